@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Speed, memory and field-extraction accuracy of the pdf text backends, over the bundled reports.
+
+Runs ofsted_send_scrape.py offline (as admin/check_extraction_regression.py does, in a throwaway
+copy of the project) once per backend pair, a pair being the per page text backend and the page 1
+(inspection dates) backend, see pdf_text_backends in the script. Each run extracts from scratch
+(text cache per pair) and is scored against admin/golden/send_extraction_golden.json.
+
+Usage:
+    python admin/benchmark_pdf_backends.py                                # deployed pair + each backend for both
+    python admin/benchmark_pdf_backends.py --pairs pymupdf:pymupdf pdfminer:pypdf2
+    python admin/benchmark_pdf_backends.py --all                          # every pages:first-page combination
+
+Reported per pair: extract stage seconds (+ per report), traced python peak (PyMuPDF's own C allocations
+aren't traced, compare the run's process peak RSS up to the end of extraction too), reports matching golden
+and regressions against it. The fastest pair without regressions is suggested, set it with
+OFSTED_SEND_PDF_TEXT_BACKEND|OFSTED_SEND_PDF_FIRST_PAGE_BACKEND (or pdf_text_backend|pdf_first_page_backend
+in the script).
+
+Exit codes: 0 ok, 2 golden file missing or no pair could be run.
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from check_extraction_regression import (
+    DEFAULT_GOLDEN, METRICS_PATH, build_workspace, compare_reports, load_extracted, run_pipeline
+)
+
+BACKENDS = ["pymupdf", "pypdf2", "pdfminer"]
+DEPLOYED_PAIR = ("pymupdf", "pypdf2")  # script defaults (pdf_text_backend, pdf_first_page_backend)
+
+# module each backend needs, optional ones are skipped where not installed
+BACKEND_MODULES = {"pymupdf": "fitz", "pypdf2": "PyPDF2", "pdfminer": "pdfminer"}
+
+
+def parse_pair(value):
+    """'pages:first' (or one name for both) -> (pages backend, first page backend)."""
+    pages, _, first = value.partition(":")
+    pair = (pages, first or pages)
+    for backend in pair:
+        if backend not in BACKENDS:
+            raise argparse.ArgumentTypeError(f"unknown backend '{backend}', one of {', '.join(BACKENDS)}")
+    return pair
+
+
+def benchmark_pair(pair, golden_reports, workers):
+    """
+    One offline run with the pair's backends.
+
+    Returns:
+        dict: {'seconds', 'peak_mb', 'process_peak_rss_mb', 'reports', 'correct', 'regressions', 'fixed'}, or
+              {'error'} where the run failed.
+    """
+    workspace = Path(tempfile.mkdtemp(prefix="send_backend_"))
+    try:
+        build_workspace(workspace)
+        returncode, output = run_pipeline(workspace, workers, extra_env={
+            "OFSTED_SEND_PDF_TEXT_BACKEND": pair[0],
+            "OFSTED_SEND_PDF_FIRST_PAGE_BACKEND": pair[1],
+        })
+        if returncode != 0:
+            return {"error": f"run failed (exit {returncode}): {output.strip().splitlines()[-1] if output.strip() else ''}"}
+        extracted = load_extracted(workspace)
+        with open(workspace / METRICS_PATH) as f:
+            extract_stage = json.load(f).get("stages", {}).get("extract", {})
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    regressions, known_issues, fixed = compare_reports(golden_reports, extracted)
+    failing = {message.split(":", 1)[0] for message in regressions} | {message.split(" (", 1)[0] for message in known_issues}
+    return {
+        "seconds": extract_stage.get("seconds"),
+        "peak_mb": extract_stage.get("peak_mb"),
+        "process_peak_rss_mb": extract_stage.get("process_peak_rss_mb"),
+        "reports": len(extracted),
+        "correct": len(set(extracted) - failing),
+        "regressions": regressions,
+        "fixed": fixed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pdf text backends on the bundled reports")
+    parser.add_argument("--pairs", nargs="+", type=parse_pair, metavar="PAGES:FIRST",
+                        help="backend pairs to run, e.g. pymupdf:pypdf2 (one name == both)")
+    parser.add_argument("--all", action="store_true", help="every pages:first-page combination of the installed backends")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help=f"golden values file (default {DEFAULT_GOLDEN})")
+    parser.add_argument("--workers", type=int, default=1, help="extraction workers (default 1, in-process so memory is traced)")
+    parser.add_argument("--show-regressions", type=int, default=5, help="regressions listed per pair (default 5)")
+    args = parser.parse_args()
+
+    if not args.golden.exists():
+        print(f"Golden file not found at {args.golden}, create it with check_extraction_regression.py --update", file=sys.stderr)
+        sys.exit(2)
+    with open(args.golden) as f:
+        golden_reports = json.load(f)["reports"]
+
+    installed = [backend for backend in BACKENDS if importlib.util.find_spec(BACKEND_MODULES[backend]) is not None]
+    for backend in sorted(set(BACKENDS) - set(installed)):
+        print(f"Backend '{backend}' skipped, {BACKEND_MODULES[backend]} not installed")
+
+    if args.pairs:
+        pairs = args.pairs
+    elif args.all:
+        pairs = list(itertools.product(installed, repeat=2))
+    else:
+        pairs = [DEPLOYED_PAIR] + [(backend, backend) for backend in installed]
+    pairs = [pair for pair in dict.fromkeys(pairs) if set(pair) <= set(installed)]
+
+    results = {}
+    for pair in pairs:
+        print(f"Running pages {pair[0]}, first page {pair[1]} ...", flush=True)
+        results[pair] = benchmark_pair(pair, golden_reports, args.workers)
+
+    print(f"\n{'pages:first':<20} {'extract s':>10} {'ms/report':>10} {'traced MB':>10} {'proc peak RSS MB':>17} {'correct':>9} {'regressions':>12}")
+    for pair, result in results.items():
+        label = ":".join(pair) + (" *" if pair == DEPLOYED_PAIR else "")
+        if "error" in result:
+            print(f"{label:<20} {result['error']}")
+            continue
+        per_report_ms = result["seconds"] * 1000 / max(result["reports"], 1)
+        print(f"{label:<20} {result['seconds']:>10.2f} {per_report_ms:>10.1f} {result['peak_mb'] or '-':>10} "
+              f"{result['process_peak_rss_mb'] or '-':>17} {result['correct']:>4}/{result['reports']:<4} {len(result['regressions']):>12}")
+    print("(* deployed defaults)")
+
+    for pair, result in results.items():
+        for title, messages in (("regressions", result.get("regressions")), ("known issues fixed", result.get("fixed"))):
+            if messages:
+                print(f"\n{':'.join(pair)} {title} ({len(messages)}):")
+                for message in messages[:args.show_regressions]:
+                    print(f"    {message}")
+                if len(messages) > args.show_regressions:
+                    print(f"    ... {len(messages) - args.show_regressions} more")
+
+    passing = [pair for pair, result in results.items() if "error" not in result and not result["regressions"]]
+    if not results or all("error" in result for result in results.values()):
+        print("\nNo backend pair could be run", file=sys.stderr)
+        sys.exit(2)
+    if passing:
+        fastest = min(passing, key=lambda pair: results[pair]["seconds"])
+        print(f"\nFastest without regressions: pages {fastest[0]}, first page {fastest[1]}"
+              f" (OFSTED_SEND_PDF_TEXT_BACKEND={fastest[0]} OFSTED_SEND_PDF_FIRST_PAGE_BACKEND={fastest[1]})")
+    else:
+        print("\nNo pair extracted every report correctly, keep the deployed defaults")
+
+
+if __name__ == "__main__":
+    main()
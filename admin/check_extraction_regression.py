@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Golden-output regression check of SEND report extraction, with per-stage time|memory budgets.
+
+Runs ofsted_send_scrape.py in offline mode (no network) over the bundled
+export_data/inspection_reports/ corpus, in a throwaway copy of the project so the
+committed outputs|store|caches are untouched. Every extracted field of every report is then
+diffed against admin/golden/send_extraction_golden.json, and the run's stage metrics
+(export_data/cache/run_metrics.json) checked against the budgets held in the same file.
+
+Usage:
+    python admin/check_extraction_regression.py
+    python admin/check_extraction_regression.py --workers 4      # faster, extraction memory then in worker processes (untraced)
+    python admin/check_extraction_regression.py --update         # accept current output as golden (after an intended change)
+
+Golden entries marked "known_issue" hold the correct (hand checked) values. Their mismatches are
+reported but don't fail the check, and --update leaves them as they are. A known issue that now
+matches is reported so the flag can be removed.
+
+Exit codes: 0 ok, 1 field regression or budget exceeded, 2 the pipeline run itself failed.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_NAME = "ofsted_send_scrape.py"
+DEFAULT_GOLDEN = PROJECT_ROOT / "admin" / "golden" / "send_extraction_golden.json"
+REPORTS_FOLDER = Path("export_data") / "inspection_reports"
+STORE_PATH = Path("export_data") / "ofsted_send_inspections.db"
+METRICS_PATH = Path("export_data") / "cache" / "run_metrics.json"
+
+# extracted fields compared per report (as held in the inspection store, dates ISO)
+GOLDEN_FIELDS = [
+    "publication_date",
+    "outcome_grade",
+    "previous_inspection_date",
+    "inspection_start_date",
+    "inspection_end_date",
+    "next_inspection",
+    "next_inspection_by_date",
+    "inspection_outcome_text",
+]
+
+EXTRACTED_SQL = f"""
+SELECT pub.publication_link, pub.publication_date,
+       {", ".join("i." + field for field in GOLDEN_FIELDS[1:])}
+FROM publications pub
+JOIN inspections i ON i.publication_link = pub.publication_link
+"""
+
+
+def build_workspace(workspace):
+    """Copy what an offline run reads (script, imports, reports archive) into workspace, as a git repo."""
+    shutil.copy2(PROJECT_ROOT / SCRIPT_NAME, workspace / SCRIPT_NAME)
+    shutil.copytree(PROJECT_ROOT / "import_data", workspace / "import_data")
+    shutil.copytree(PROJECT_ROOT / REPORTS_FOLDER, workspace / REPORTS_FOLDER)
+    # script opens GITHUB_WORKSPACE as a repo (changed reports list on the html page)
+    subprocess.run(["git", "init", "-q", str(workspace)], check=True)
+
+
+def run_pipeline(workspace, workers, extra_env=None):
+    """Offline run of the scrape script in workspace (+ extra_env overrides). Returns (returncode, combined output)."""
+    env = dict(
+        os.environ,
+        GITHUB_WORKSPACE=str(workspace),
+        OFSTED_SEND_RUN_MODE="offline",
+        OFSTED_SEND_MAX_WORKERS=str(workers),
+        OFSTED_SEND_TRACK_MEMORY="1",
+        **(extra_env or {}),
+    )
+    result = subprocess.run(
+        [sys.executable, SCRIPT_NAME], cwd=workspace, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    return result.returncode, result.stdout
+
+
+def load_extracted(workspace):
+    """Extracted fields per report, keyed '<urn>_<la>/<report filename>'."""
+    conn = sqlite3.connect(workspace / STORE_PATH)
+    try:
+        rows = conn.execute(EXTRACTED_SQL).fetchall()
+    finally:
+        conn.close()
+
+    reports_prefix = REPORTS_FOLDER.as_posix() + "/"
+    extracted = {}
+    for link, *values in rows:
+        extracted[link[len(reports_prefix):] if link.startswith(reports_prefix) else link] = dict(zip(GOLDEN_FIELDS, values))
+    return extracted
+
+
+def compare_reports(golden_reports, extracted):
+    """
+    Diff extracted fields against golden.
+
+    Returns:
+        tuple: (regressions, known_issues, fixed_known_issues), each a list of message strings.
+    """
+    regressions, known_issues, fixed = [], [], []
+
+    for key in sorted(set(golden_reports) | set(extracted)):
+        expected = golden_reports.get(key)
+        actual = extracted.get(key)
+        if expected is None:
+            regressions.append(f"{key}: extracted but not in golden (new report? re-run with --update)")
+            continue
+        if actual is None:
+            regressions.append(f"{key}: in golden but nothing extracted")
+            continue
+
+        diffs = [
+            f"{field}: expected {expected.get(field)!r}, got {actual.get(field)!r}"
+            for field in GOLDEN_FIELDS if expected.get(field) != actual.get(field)
+        ]
+        if expected.get("known_issue"):
+            if diffs:
+                known_issues.append(f"{key} ({expected['known_issue']}): " + "; ".join(diffs))
+            else:
+                fixed.append(f"{key}: known issue now extracts correctly, remove its known_issue flag")
+        elif diffs:
+            regressions.extend(f"{key}: {diff}" for diff in diffs)
+
+    return regressions, known_issues, fixed
+
+
+def check_budgets(budgets, metrics):
+    """Stage metrics over budget, as message strings. Budgets are {stage: {'seconds'|'peak_mb': limit}}."""
+    exceeded = []
+    stages = metrics.get("stages", {})
+    for stage, limits in budgets.items():
+        measured = stages.get(stage)
+        if measured is None:
+            exceeded.append(f"{stage}: stage not reported by the run")
+            continue
+        for measure, limit in limits.items():
+            if measured.get(measure) is not None and measured[measure] > limit:
+                exceeded.append(f"{stage}: {measure} {measured[measure]} over budget {limit}")
+    return exceeded
+
+
+def update_golden(golden, extracted):
+    """Accept extracted values as golden, known_issue entries (hand corrected values) kept as they are."""
+    reports = {}
+    for key in sorted(extracted):
+        previous = golden["reports"].get(key, {})
+        reports[key] = previous if previous.get("known_issue") else extracted[key]
+    golden["reports"] = reports
+    return golden
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff offline extraction of the bundled reports against golden values")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help=f"golden values|budgets file (default {DEFAULT_GOLDEN})")
+    parser.add_argument("--workers", type=int, default=1, help="extraction workers (default 1, in-process so memory is traced)")
+    parser.add_argument("--update", action="store_true", help="write this run's values to the golden file")
+    parser.add_argument("--keep", action="store_true", help="keep the run workspace (printed) for inspection")
+    args = parser.parse_args()
+
+    golden = {"budgets": {}, "reports": {}}
+    if args.golden.exists():
+        with open(args.golden) as f:
+            golden = json.load(f)
+    elif not args.update:
+        print(f"Golden file not found at {args.golden}, create it with --update", file=sys.stderr)
+        sys.exit(2)
+
+    workspace = Path(tempfile.mkdtemp(prefix="send_regression_"))
+    try:
+        build_workspace(workspace)
+        started = time.perf_counter()
+        returncode, output = run_pipeline(workspace, args.workers)
+        elapsed = time.perf_counter() - started
+        if returncode != 0:
+            print(output[-4000:])
+            print(f"Offline pipeline run failed (exit {returncode})", file=sys.stderr)
+            sys.exit(2)
+
+        extracted = load_extracted(workspace)
+        with open(workspace / METRICS_PATH) as f:
+            metrics = json.load(f)
+    finally:
+        if args.keep:
+            print(f"Run workspace kept at {workspace}")
+        else:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    print(f"Offline run: {len(extracted)} report(s) extracted in {elapsed:.1f}s")
+    for stage, measured in metrics.get("stages", {}).items():
+        limits = golden["budgets"].get(stage, {})
+        print(f"    {stage:<16} {measured['seconds']:>8.3f}s (budget {limits.get('seconds', '-')})"
+              f"  {measured.get('peak_mb', '-'):>8} MB (budget {limits.get('peak_mb', '-')})")
+
+    for field, tier_counts in metrics.get("extraction_tiers", {}).items():
+        print(f"    {field:<26} " + ", ".join(f"{tier} {count}" for tier, count in tier_counts.items()))
+
+    if args.update:
+        args.golden.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.golden, "w") as f:
+            json.dump(update_golden(golden, extracted), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Golden values written to {args.golden} ({len(extracted)} reports)")
+        return
+
+    regressions, known_issues, fixed = compare_reports(golden["reports"], extracted)
+    over_budget = check_budgets(golden["budgets"], metrics)
+
+    for title, messages in (
+        ("Known extraction issues (not failing)", known_issues),
+        ("Known issues fixed", fixed),
+        ("Extraction regressions", regressions),
+        ("Budgets exceeded", over_budget),
+    ):
+        if messages:
+            print(f"\n{title} ({len(messages)}):")
+            for message in messages:
+                print(f"    {message}")
+
+    if regressions or over_budget:
+        print(f"\nFAILED: {len(regressions)} field regression(s), {len(over_budget)} budget(s) exceeded")
+        sys.exit(1)
+    print(f"\nOK: {len(extracted) - len(known_issues)} report(s) match golden ({len(known_issues)} known issue(s)), all stages within budget")
+
+
+if __name__ == "__main__":
+    main()
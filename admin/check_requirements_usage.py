@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
+"""
+Audit of requirements.txt against the project's imports, + the startup cost of each third-party import
+of the scrape script (see --help). Imports guarded by try/except ImportError are reported as optional.
+"""
 
-
+import argparse
 import ast
+import subprocess
 import sys
 import re
+from collections import defaultdict
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 REQ_FILE = PROJECT_ROOT / "requirements.txt"
+SCRIPT_FILE = PROJECT_ROOT / "ofsted_send_scrape.py"
+WORKFLOWS_DIR = PROJECT_ROOT / ".github" / "workflows"
+OUTSIDE_STAGES = "<outside stages>"
+# packaging tooling the workflow installs, not project dependencies
+PIP_TOOLING = {"pip", "wheel", "setuptools"}
 EXCLUDE_DIRS = {
     ".git", ".github", ".venv", "venv", "env", "__pycache__", "site-packages",
     "dist", "build", "docs", "data", "assets", "node_modules"
@@ -25,6 +36,10 @@ KNOWN_IMPORTS = {
     "beautifulsoup4":   ["bs4"],
     "GitPython":        ["git"],
     "scipy":            ["scipy"],
+    "pandas":           ["pandas"],
+    "numpy":            ["numpy"],
+    "python-dateutil":  ["dateutil"],
+    "pdfminer.six":     ["pdfminer"],  # optional pdf text backend
     # add here if project using known others
 }
 
@@ -68,30 +83,50 @@ def collect_local_packages(root: Path):
             init_py = d / "__init__.py"
             if init_py.exists():
                 locals_set.add(d.name.split(".")[0])
-    # also include top level scripts as local modules
-    for f in root.glob("*.py"):
+    # also include top level|admin scripts as local modules (admin scripts import each other)
+    for f in list(root.glob("*.py")) + list((root / "admin").glob("*.py")):
         locals_set.add(f.stem)
     return locals_set
 
+def guarded_import_nodes(tree):
+    """Import nodes within a try whose handlers catch ImportError|ModuleNotFoundError (optional deps)."""
+    guarded = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Try):
+            continue
+        caught = set()
+        for handler in node.handlers:
+            types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+            caught |= {t.id for t in types if isinstance(t, ast.Name)}
+        if caught & {"ImportError", "ModuleNotFoundError"}:
+            for statement in node.body:
+                guarded |= {id(n) for n in ast.walk(statement) if isinstance(n, (ast.Import, ast.ImportFrom))}
+    return guarded
+
 def collect_imports(pyfile: Path):
+    """Return tuple: (top level import names, those imported anywhere outside an ImportError guard)."""
     try:
         tree = ast.parse(pyfile.read_text(encoding="utf-8"), filename=str(pyfile))
     except Exception:
-        return set()
-    used = set()
+        return set(), set()
+    guarded = guarded_import_nodes(tree)
+    used, required = set(), set()
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
-            for n in node.names:
-                top = n.name.split(".", 1)[0]
-                used.add(top)
+            tops = {n.name.split(".", 1)[0] for n in node.names}
         elif isinstance(node, ast.ImportFrom):
             if node.level and node.level > 0:
                 # relative import, treat as local
                 continue
-            if node.module:
-                top = node.module.split(".", 1)[0]
-                used.add(top)
-    return used
+            if not node.module:
+                continue
+            tops = {node.module.split(".", 1)[0]}
+        else:
+            continue
+        used |= tops
+        if id(node) not in guarded:
+            required |= tops
+    return used, required
 
 def build_reverse_map():
     rev = {}
@@ -100,7 +135,231 @@ def build_reverse_map():
             rev.setdefault(top, set()).add(canonicalize_name(dist))
     return rev
 
+def parse_workflow_installs(workflows_dir: Path):
+    """Canonical names of packages named directly in workflow pip install|download commands (not -r files)."""
+    pulled = set()
+    req_re = re.compile(r"^([A-Za-z0-9_.\-]+)")
+    for wf in sorted(workflows_dir.glob("*.yml")):
+        text = wf.read_text(encoding="utf-8").replace("\\\n", " ")
+        for m in re.finditer(r"pip\s+(?:install|download)\s+([^\n|;&]+)", text):
+            skip_next = False
+            for token in m.group(1).split():
+                token = token.strip("\"'")
+                if skip_next:
+                    skip_next = False
+                    continue
+                if token in ("-r", "--requirement", "-c", "--constraint", "-d", "--dest"):
+                    skip_next = True
+                    continue
+                if token.startswith("-"):
+                    continue
+                name = req_re.match(token)
+                if name and canonicalize_name(name.group(1)) not in PIP_TOOLING:
+                    pulled.add(canonicalize_name(name.group(1)))
+    return pulled
+
+def module_import_bindings(tree):
+    """Module level names bound by imports --> module they come from ('pd' --> 'pandas', 'relativedelta' --> 'dateutil.relativedelta')."""
+    bindings = {}
+    statements = list(tree.body)
+    while statements:
+        node = statements.pop(0)
+        if isinstance(node, ast.Import):
+            for n in node.names:
+                bindings[n.asname or n.name.split(".", 1)[0]] = n.name
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for n in node.names:
+                bindings[n.asname or n.name] = node.module
+        elif isinstance(node, (ast.Try, ast.If)):
+            # guarded imports (optional deps)
+            statements.extend(node.body)
+            for handler in getattr(node, "handlers", []):
+                statements.extend(handler.body)
+    return bindings
+
+def stage_name(with_node):
+    """Stage name if with_node is a `with run_stage('<name>'):` block, else None."""
+    for item in with_node.items:
+        call = item.context_expr
+        if (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "run_stage"
+                and call.args and isinstance(call.args[0], ast.Constant)):
+            return call.args[0].value
+    return None
+
+class NameUseCollector(ast.NodeVisitor):
+    """Names referenced per owner: the enclosing top level function|class, or run_stage block within it."""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.names = defaultdict(set)
+
+    def visit_With(self, node):
+        stage = stage_name(node)
+        if stage is None:
+            self.generic_visit(node)
+            return
+        outer, self.owner = self.owner, stage
+        self.generic_visit(node)
+        self.owner = outer
+
+    def visit_Name(self, node):
+        self.names[self.owner].add(node.id)
+
+def import_stage_usage(script: Path):
+    """
+    Which pipeline stages use each third-party (or any) top level import of the script.
+
+    Functions are followed through the calls they make, so an import used by a helper counts
+    against every stage reaching that helper. Module level code outside run_stage blocks
+    (startup, run mode setup, reporting) counts as OUTSIDE_STAGES.
+
+    Returns:
+        tuple: ({top level module: set of stage names, empty if imported but never used},
+                {top level module: modules the script imports from it}).
+    """
+    tree = ast.parse(script.read_text(encoding="utf-8"), filename=str(script))
+    bindings = module_import_bindings(tree)
+
+    names = defaultdict(set)
+    definitions = set()
+    module_level = NameUseCollector(OUTSIDE_STAGES)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions.add(node.name)
+            collector = NameUseCollector(node.name)
+            collector.visit(node)
+            for owner, used in collector.names.items():
+                names[owner] |= used
+        else:
+            module_level.visit(node)
+    for owner, used in module_level.names.items():
+        names[owner] |= used
+
+    def reachable_imports(owner):
+        found, seen, pending = set(), {owner}, [owner]
+        while pending:
+            used = names.get(pending.pop(), set())
+            found |= {bindings[n].split(".", 1)[0] for n in used if n in bindings}
+            for callee in (used & definitions) - seen:
+                seen.add(callee)
+                pending.append(callee)
+        return found
+
+    stages = {owner for owner in names if owner not in definitions}
+    imported = defaultdict(set)
+    for module in bindings.values():
+        imported[module.split(".", 1)[0]].add(module)
+    usage = {top: set() for top in imported}
+    for stage in stages:
+        for module in reachable_imports(stage):
+            usage[module].add(stage)
+    return usage, dict(imported)
+
+MEASURE_SNIPPET = """
+import importlib, os, resource, sys, time
+
+def rss_kb():
+    # current resident set where /proc is available, peak RSS otherwise
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+for name in sys.argv[2:]:
+    importlib.import_module(name)
+rss_before = rss_kb()
+started = time.perf_counter()
+for name in sys.argv[1].split(','):
+    importlib.import_module(name)
+elapsed = time.perf_counter() - started
+print(elapsed, rss_kb() - rss_before)
+"""
+
+def measure_import(modules, preload=(), repeat=3):
+    """
+    Import time (ms) and resident memory added (MB) of modules, in a fresh interpreter per try.
+
+    preload modules are imported first, so the figures are marginal to them. Best of repeat tries.
+
+    Returns:
+        tuple: (ms, mb), or None if a module (or a preload) fails to import.
+    """
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", MEASURE_SNIPPET, ",".join(sorted(modules)), *preload],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+        if result.returncode != 0:
+            return None
+        seconds, rss_kb = result.stdout.splitlines()[-1].split()
+        measured = (float(seconds) * 1000, int(rss_kb) / 1024)
+        best = measured if best is None else (min(best[0], measured[0]), min(best[1], measured[1]))
+    return best
+
+def report_import_costs(third_party, stage_usage, imported, repeat, heavy_ms):
+    """Print import cost per third-party module of the script, and deferral|removal candidates with their saving."""
+    costs = {}
+    for module in sorted(third_party):
+        others = sorted(name for other in third_party - {module} for name in imported[other])
+        costs[module] = (
+            measure_import(imported[module], repeat=repeat),
+            measure_import(imported[module], others, repeat=repeat)
+        )
+
+    print("\n=== Import cost of the scrape script's third-party imports ===")
+    print(f"{'module':<12} {'isolated ms':>12} {'MB':>7} {'marginal ms':>12} {'MB':>7}  stages using it")
+    for module, (isolated, marginal) in sorted(costs.items(), key=lambda kv: -(kv[1][0] or (0, 0))[0]):
+        if isolated is None:
+            print(f"{module:<12} {'not importable here':>41}")
+            continue
+        marginal = marginal or (float("nan"), float("nan"))
+        stages = sorted(stage_usage.get(module, ()))
+        print(f"{module:<12} {isolated[0]:>12.1f} {isolated[1]:>7.1f} {marginal[0]:>12.1f} {marginal[1]:>7.1f}  "
+              f"{', '.join(stages) or 'none (unused import)'}")
+
+    measured = [c[0] for c in costs.values() if c[0] is not None]
+    print(f"Total isolated: {sum(c[0] for c in measured):.0f} ms, {sum(c[1] for c in measured):.0f} MB "
+          "(shared dependencies counted once per module)")
+
+    unused = sorted(m for m in third_party if not stage_usage.get(m))
+    single_stage = sorted(
+        m for m in third_party
+        if len(stage_usage.get(m, ())) == 1 and OUTSIDE_STAGES not in stage_usage[m]
+        and costs[m][0] is not None and costs[m][0][0] >= heavy_ms
+    )
+
+    if unused:
+        print("\nImported at top level but never used (remove the import):")
+        for module in unused:
+            print(f"  - {module}: saves {format_saving(costs[module][1])} of every run's startup")
+
+    if single_stage:
+        print(f"\nHeavy (>= {heavy_ms:g} ms) top level imports used by a single stage "
+              "(import inside that stage's functions instead):")
+        for module in single_stage:
+            stage = next(iter(stage_usage[module]))
+            print(f"  - {module}: only the '{stage}' stage, deferring saves {format_saving(costs[module][1])} "
+                  "of startup, all of it for runs that skip the stage")
+    else:
+        print(f"\nNo heavy (>= {heavy_ms:g} ms) top level imports confined to a single stage")
+
+def format_saving(cost):
+    if cost is None:
+        return "an unmeasured amount"
+    ms, mb = cost
+    if ms < 1:
+        return "~0 ms (already loaded by the other imports)"
+    return f"~{ms:.0f} ms, {mb:.0f} MB"
+
 def main():
+    parser = argparse.ArgumentParser(description="Audit requirements against imports, and the startup cost of each import")
+    parser.add_argument("--no-timing", action="store_true", help="import scan only, skip import time|memory measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreter imports per module, best taken (default 3)")
+    parser.add_argument("--heavy-ms", type=float, default=100, help="import time from which a module counts as heavy (default 100)")
+    args = parser.parse_args()
+
     root = PROJECT_ROOT
     if not REQ_FILE.exists():
         print(f"requirements.txt not found at {REQ_FILE}", file=sys.stderr)
@@ -112,9 +371,11 @@ def main():
 
     local_pkgs = collect_local_packages(root)
 
-    imports = set()
+    imports, required_imports = set(), set()
     for f in iter_python_files(root):
-        imports |= collect_imports(f)
+        file_imports, file_required = collect_imports(f)
+        imports |= file_imports
+        required_imports |= file_required
 
     # Classify imports
     third_party_imports = set()
@@ -152,7 +413,11 @@ def main():
     used_real = {d for d in used_dists if d in listed or d in known_dist_names}
 
     unused_listed = sorted(listed - used_real)
-    missing_direct = sorted(used_real - listed)
+    # unlisted packages only imported under an ImportError guard are optional, not missing
+    required_dists = {d for imp in required_imports for d in import_to_dists.get(imp, ())}
+    missing_direct = sorted((used_real - listed) & required_dists)
+    optional_unlisted = sorted(used_real - listed - required_dists)
+    workflow_unused = sorted(parse_workflow_installs(WORKFLOWS_DIR) - used_real - listed) if WORKFLOWS_DIR.exists() else []
 
     print("\n=== Import scan summary ===")
     print(f"Python files scanned: {len(list(iter_python_files(root)))}")
@@ -167,6 +432,11 @@ def main():
     else:
         print("No obviously unused packages from requirements.txt")
 
+    if workflow_unused:
+        print("\nInstalled|downloaded by the workflow but not imported by the code:")
+        for d in workflow_unused:
+            print(f"  - {d}  (no startup cost, drop the workflow step to save install|download time)")
+
     if missing_direct:
         print("\nDirect imports in code that are not in requirements.txt:")
         for d in missing_direct:
@@ -175,6 +445,11 @@ def main():
     else:
         print("\nNo missing direct packages based on import scan")
 
+    if optional_unlisted:
+        print("\nOptional imports (try/except ImportError guarded), not in requirements.txt:")
+        for d in optional_unlisted:
+            print(f"  - {d}  (install to enable the features using it)")
+
     unknown_third_party = sorted(
         {u for u in unknown_imports if canonicalize_name(u) not in listed}
     )
@@ -204,5 +479,10 @@ def main():
     if unused_listed:
         print("Review manually before replacing requirements.txt")
 
+    if not args.no_timing and SCRIPT_FILE.exists():
+        stage_usage, imported = import_stage_usage(SCRIPT_FILE)
+        script_third_party = {m for m in stage_usage if m in third_party_imports}
+        report_import_costs(script_third_party, stage_usage, imported, args.repeat, args.heavy_ms)
+
 if __name__ == "__main__":
     main()
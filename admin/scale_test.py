@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Synthetic scale test of the whole scrape pipeline, against a local stand-in for the Ofsted reports site.
+
+Generates N providers and serves, from a local HTTP server, the search results pages, provider pages
+(a mix of SEND, focused visit and JTAI publications) and templated SEND-style report pdfs. Pdfs are rendered
+per URN (PyMuPDF), so every report is distinct and nothing is served from the text cache. ofsted_send_scrape.py
+is then run against it (OFSTED_SEND_URL_STEM) in a throwaway workspace at each scale, and throughput, peak
+memory (RSS) and failure handling reported.
+
+Usage:
+    python admin/scale_test.py                                   # 1k, 10k and 50k providers
+    python admin/scale_test.py --scales 1000 --workers 8
+    python admin/scale_test.py --scales 10000 --failure-rate 0.02 --latency-ms 50 --json scale_results.json
+    python admin/scale_test.py --scales 200 --range-fetch partial
+
+Injected failures (--failure-rate) are HTTP 500s on provider pages and report pdfs, chosen per path
+(same paths fail on every run). Search pages are not failed, one failed page ends the scrape.
+
+--range-fetch runs with OFSTED_SEND_RANGE_FETCH=1, report pdfs carrying a photo on page 2 and served with HTTP
+Range support: 'partial' (linearized pdfs, opening pages fetched), 'not-linearized' or 'no-ranges' (server
+ignores Range), the last two falling back to full downloads. Stored outcome grades|inspection dates are
+checked against the synthetic reports' in every mode.
+
+Exit codes: 0 every scale ran, 1 a pipeline run failed|timed out, stored fields were wrong or reports were
+(not) range fetched against the --range-fetch mode.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import fitz  # PyMuPDF
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPT_NAME = "ofsted_send_scrape.py"
+STORE_PATH = Path("export_data") / "ofsted_send_inspections.db"
+METRICS_PATH = Path("export_data") / "cache" / "run_metrics.json"
+DEFAULT_SCALES = [1000, 10000, 50000]
+RANGE_FETCH_MODES = ["partial", "not-linearized", "no-ranges"]
+
+FIRST_URN = 900000          # synthetic URNs, clear of real ones (not in the LA lookup)
+SEND_SHARE = 0.8            # providers with at least one SEND report
+OUTCOMES = {
+    1: "arrangements typically lead to positive experiences and outcomes for children and young people with SEND.",
+    2: "arrangements lead to inconsistent experiences and outcomes for children and young people with SEND.",
+    3: "There are widespread and/or systemic failings leading to significant concerns about the experiences and outcomes of children and young people with SEND.",
+}
+NEXT_INSPECTION = {
+    1: "The next full area SEND inspection will be within approximately five years.",
+    2: "The next full area SEND inspection will be within approximately three years.",
+    3: "A monitoring inspection will be carried out within approximately 18 months.",
+}
+FILLER = (
+    "Leaders across education, health and care have a shared understanding of the strengths and weaknesses "
+    "of the local area. Children and young people with SEND are identified early and most receive timely "
+    "support. Waiting times for some health services remain too long, and the quality of education, health "
+    "and care plans is variable. "
+)
+
+
+def synthetic_provider(urn):
+    """Deterministic provider detail for a URN: name, and its publications (most recent first)."""
+    rng = random.Random(urn)
+    publications = []
+    if rng.random() < SEND_SHARE:
+        published = date(2023, 1, 2) + timedelta(days=rng.randrange(900))
+        for n in range(rng.choice([1, 1, 2])):
+            start = published - timedelta(days=rng.randrange(40, 70))
+            publications.append({
+                "kind": "Area SEND full inspection",
+                "published": published,
+                "start": start,
+                "end": start + timedelta(days=4),
+                "grade": rng.choice([1, 1, 2, 2, 3]),
+            })
+            published -= timedelta(days=rng.randrange(900, 1900))
+    for kind in ("Children's services focused visit", "Joint area child protection inspection"):
+        if rng.random() < 0.5:
+            publications.append({"kind": kind, "published": date(2022, 1, 3) + timedelta(days=rng.randrange(1200))})
+    publications.sort(key=lambda publication: publication["published"], reverse=True)
+    return f"Synthetic Area {urn} Council", publications
+
+
+def report_text(name, publication, previous):
+    """SEND-style report text, per page, laid out as the real reports are (see extract_send_fields)."""
+    fmt = lambda d: f"{d.day} {d:%B %Y}"
+    if previous is None:
+        previous_line = "Dates of previous inspection: 1 to 5 December 2016"
+    elif previous["start"].month == previous["end"].month:
+        previous_line = f"Dates of previous inspection: {previous['start'].day} to {fmt(previous['end'])}"
+    else:
+        previous_line = f"Dates of previous inspection: {fmt(previous['start'])} to {fmt(previous['end'])}"
+    start, end = publication["start"], publication["end"]
+    return [
+        "Local area partnership report\n\n"
+        f"Area SEND inspection of {name} Local Area Partnership\n\n"
+        f"Inspection dates: {fmt(start)} to {fmt(end)}\n"
+        f"{previous_line}\n\n"
+        "Inspection outcome\n\n"
+        f"The local area partnership's special educational needs and/or disabilities (SEND) {OUTCOMES[publication['grade']]}\n\n"
+        f"{NEXT_INSPECTION[publication['grade']]}\n\n"
+        "Ofsted and CQC ask that the local area partnership updates and publishes its strategic plan.\n\n"
+        "Information about the local area partnership\n\n" + FILLER * 3,
+        "What is it like to be a child or young person with SEND in this area?\n\n" + FILLER * 6,
+        "Local area partnership details\n\nLocal authority: " + name,
+    ]
+
+
+def expected_report_fields(providers):
+    """{(urn, publication index): (outcome grade, inspection start date iso)} for every synthetic SEND report."""
+    return {
+        (urn, n): (publication["grade"], publication["start"].isoformat())
+        for urn in range(FIRST_URN, FIRST_URN + providers)
+        for n, publication in enumerate(synthetic_provider(urn)[1])
+        if "start" in publication
+    }
+
+
+def with_linearization_dict(content):
+    """
+    Stand-in for a linearized pdf (PyMuPDF no longer writes them): a linearization dict written ahead of the
+    objects, xref offsets moved to match. Objects aren't reordered and there are no hint tables, readers go by
+    the xref as for any pdf, but fetch_report_opening_pages takes its partial path.
+    """
+    xref_at = int(re.search(rb"startxref\s+(\d+)", content).group(1))
+    size = int(re.search(rb"/Size (\d+)", content[xref_at:]).group(1))
+    first_page = int(re.search(rb"/Kids\[(\d+) 0 R", content).group(1))
+    page_count = int(re.search(rb"/Type/Pages/Count (\d+)", content).group(1))
+    insert_at = content.index(b"\n1 0 obj") + 1
+
+    # fixed width /L|/E, so the dict's length is known before its values
+    template = b"%d 0 obj\n<</Linearized 1/L %010d/E %010d/O %d/N %d/T 0/H[0 0]>>\nendobj\n\n"
+    shift = len(template % (size, 0, 0, first_page, page_count))
+    xref = re.sub(rb"(\d{10}) 00000 n", lambda m: b"%010d 00000 n" % (int(m.group(1)) + shift), content[xref_at:])
+    xref = xref.replace(b"xref\n0 %d\n" % size, b"xref\n0 %d\n" % (size + 1), 1)
+    xref = xref.replace(b"\ntrailer", b"%010d 00000 n \ntrailer" % insert_at, 1)
+    xref = xref.replace(b"/Size %d" % size, b"/Size %d" % (size + 1), 1)
+    xref = re.sub(rb"startxref\s+\d+", b"startxref\n%d" % (xref_at + shift), xref)
+
+    length = len(content) + shift + (len(xref) - len(content[xref_at:]))
+    linearization = template % (size, length, insert_at + shift, first_page, page_count)
+    return content[:insert_at] + linearization + content[insert_at:xref_at] + xref
+
+
+class SyntheticSite:
+    """Search|provider pages and report pdfs for providers FIRST_URN .. FIRST_URN + providers - 1."""
+
+    def __init__(self, providers, failure_rate=0.0, latency_ms=0, range_fetch=None):
+        self.providers = providers
+        self.range_fetch = range_fetch
+        self.base_url = ""  # report links are absolute (as files.ofsted.gov.uk), set once the server is up
+        self.failure_rate = failure_rate
+        self.latency = latency_ms / 1000
+        self.counts = {}
+        self.lock = threading.Lock()
+        self.pdf_lock = threading.Lock()  # PyMuPDF isn't thread safe
+
+    def count(self, route, status):
+        with self.lock:
+            self.counts[f"{route} {status}"] = self.counts.get(f"{route} {status}", 0) + 1
+
+    def fails(self, path):
+        return int(hashlib.sha256(path.encode()).hexdigest()[:8], 16) / 0xFFFFFFFF < self.failure_rate
+
+    def search_page(self, query):
+        first = int(query.get("start", ["0"])[0])
+        rows = int(query.get("rows", ["100"])[0])
+        urns = range(FIRST_URN + first, FIRST_URN + min(first + rows, self.providers))
+        links = "\n".join(
+            f'<li><a href="/provider/44/{urn}">{synthetic_provider(urn)[0]}</a></li>' for urn in urns
+        )
+        return f"<html><body><ul>{links}</ul></body></html>".encode()
+
+    def provider_page(self, urn):
+        _, publications = synthetic_provider(urn)
+        links = "\n".join(
+            f'<li><a class="publication-link" href="{self.base_url}file/{urn}/{n}" target="_blank">{p["kind"]}'
+            f'<span class="nonvisual">{p["kind"]}, pdf - {p["published"].day} {p["published"]:%B %Y}</span></a></li>'
+            for n, p in enumerate(publications)
+        )
+        return f"<html><body><ul>{links}</ul></body></html>".encode()
+
+    def report_pdf(self, urn, n):
+        name, publications = synthetic_provider(urn)
+        publication = publications[n]
+        if "start" not in publication:
+            pages = [f"{publication['kind']} of {name}"]
+        else:
+            send_reports = [p for p in publications if "start" in p]
+            later = send_reports[send_reports.index(publication) + 1:]
+            pages = report_text(name, publication, later[0] if later else None)
+
+        with self.pdf_lock:
+            doc = fitz.open()
+            for text in pages:
+                doc.new_page().insert_textbox(fitz.Rect(60, 60, 535, 790), text, fontsize=10)
+            if self.range_fetch and len(pages) > 1:
+                # a photo (noise, so it doesn't compress), which the partial path leaves unfetched
+                photo = fitz.Pixmap(fitz.csRGB, 160, 160, random.Random(urn * 100 + n).randbytes(160 * 160 * 3), False)
+                doc[1].insert_image(fitz.Rect(60, 500, 300, 740), pixmap=photo)
+            # no random /ID, so each range request reads from the same bytes
+            content = doc.tobytes(garbage=3, deflate=True, no_new_id=bool(self.range_fetch))
+            doc.close()
+        if self.range_fetch in ("partial", "no-ranges"):
+            content = with_linearization_dict(content)
+        return content
+
+    def handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                parts = url.path.strip("/").split("/")
+                if site.latency:
+                    time.sleep(site.latency)
+                try:
+                    if parts[0] == "search":
+                        route, content_type, body = "search", "text/html", site.search_page(parse_qs(url.query))
+                    elif parts[0] == "provider" and len(parts) == 3:
+                        route, content_type, body = "provider", "text/html", None
+                        if not site.fails(url.path):
+                            body = site.provider_page(int(parts[2]))
+                    elif parts[0] == "file" and len(parts) == 3:
+                        route, content_type, body = "pdf", "application/pdf", None
+                        if not site.fails(url.path):
+                            body = site.report_pdf(int(parts[1]), int(parts[2]))
+                    else:
+                        route, content_type, body = "other", "text/plain", None
+                except (ValueError, IndexError):
+                    route, content_type, body = "other", "text/plain", None
+
+                status = 200 if body is not None else (404 if route == "other" else 500)
+                byte_range = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+                if status == 200 and route == "pdf" and byte_range and site.range_fetch in ("partial", "not-linearized"):
+                    start = int(byte_range.group(1))
+                    end = min(int(byte_range.group(2) or len(body) - 1), len(body) - 1)
+                    status, content_range, body = 206, f"bytes {start}-{end}/{len(body)}", body[start:end + 1]
+                site.count(route, status)
+                if status not in (200, 206):
+                    self.send_error(status)
+                    return
+                self.send_response(status)
+                if status == 206:
+                    self.send_header("Content-Range", content_range)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # thousands of requests, counted instead
+
+        return Handler
+
+
+def expected_send_reports(providers):
+    """SEND reports a 'latest' run should extract (most recent per provider), ignoring injected failures."""
+    return sum(
+        any("start" in p for p in synthetic_provider(urn)[1])
+        for urn in range(FIRST_URN, FIRST_URN + providers)
+    )
+
+
+def build_workspace(workspace):
+    """Copy what a run reads (script, imports) into workspace, as a git repo."""
+    shutil.copy2(PROJECT_ROOT / SCRIPT_NAME, workspace / SCRIPT_NAME)
+    shutil.copytree(PROJECT_ROOT / "import_data", workspace / "import_data")
+    # script opens GITHUB_WORKSPACE as a repo (changed reports list on the html page)
+    subprocess.run(["git", "init", "-q", str(workspace)], check=True)
+
+
+def run_scale(providers, site_url, workers, track_memory, timeout, range_fetch=None):
+    """One pipeline run over `providers` synthetic providers. Returns the result dict."""
+    workspace = Path(tempfile.mkdtemp(prefix=f"send_scale_{providers}_"))
+    try:
+        build_workspace(workspace)
+        env = dict(
+            os.environ,
+            GITHUB_WORKSPACE=str(workspace),
+            OFSTED_SEND_RUN_MODE="latest",
+            OFSTED_SEND_URL_STEM=site_url,
+            OFSTED_SEND_MAX_RESULTS=str(providers),
+            OFSTED_SEND_MAX_WORKERS=str(workers),
+            OFSTED_SEND_TRACK_MEMORY="1" if track_memory else "0",
+            OFSTED_SEND_RANGE_FETCH="1" if range_fetch else "0",
+        )
+        started = time.perf_counter()
+        with open(workspace / "run_output.txt", "w") as output:
+            process = subprocess.Popen([sys.executable, SCRIPT_NAME], cwd=workspace, env=env,
+                                       stdout=output, stderr=subprocess.STDOUT)
+            timed_out = False
+            deadline = started + timeout if timeout else None
+            while True:
+                pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+                if pid:
+                    break
+                if deadline and time.perf_counter() > deadline:
+                    process.kill()
+                    timed_out = True
+                    pid, status, rusage = os.wait4(process.pid, 0)
+                    break
+                time.sleep(0.2)
+            process.returncode = os.waitstatus_to_exitcode(status)
+        elapsed = time.perf_counter() - started
+
+        result = {
+            "providers": providers,
+            "returncode": process.returncode,
+            "timed_out": timed_out,
+            "seconds": round(elapsed, 1),
+            "providers_per_second": round(providers / elapsed, 1),
+            "peak_rss_mb": round(rusage.ru_maxrss / 1024, 1),  # linux: KB
+            "expected_reports": expected_send_reports(providers),
+            "stored_reports": None,
+            "range_fetched_reports": None,
+            "field_mismatches": None,
+            "stages": {},
+        }
+        if (workspace / STORE_PATH).exists():
+            conn = sqlite3.connect(workspace / STORE_PATH)
+            try:
+                result["stored_reports"] = conn.execute("SELECT COUNT(*) FROM inspections").fetchone()[0]
+                result["range_fetched_reports"] = conn.execute(
+                    "SELECT COUNT(*) FROM inspections WHERE range_fetched_sha256 IS NOT NULL"
+                ).fetchone()[0]
+                stored_fields = conn.execute(
+                    "SELECT publication_link, outcome_grade, inspection_start_date FROM inspections"
+                ).fetchall()
+            finally:
+                conn.close()
+            expected_fields = expected_report_fields(providers)
+            result["field_mismatches"] = sum(
+                expected_fields.get(tuple(int(part) for part in link.rsplit("/", 2)[1:])) != (grade, start_date)
+                for link, grade, start_date in stored_fields
+            )
+        if (workspace / METRICS_PATH).exists():
+            with open(workspace / METRICS_PATH) as f:
+                result["stages"] = json.load(f).get("stages", {})
+        if range_fetch:
+            with open(workspace / "run_output.txt") as f:
+                summary = re.search(r"Range fetch: .*", f.read())
+            result["range_fetch_summary"] = summary.group(0) if summary else None
+        if process.returncode != 0:
+            with open(workspace / "run_output.txt") as f:
+                result["output_tail"] = f.read()[-2000:]
+        return result
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scale test the scrape pipeline against a local synthetic Ofsted site")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help=f"provider counts to run (default {DEFAULT_SCALES})")
+    parser.add_argument("--workers", type=int, default=4, help="pipeline max_workers (default 4)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="fraction of provider pages|pdfs answered with HTTP 500")
+    parser.add_argument("--latency-ms", type=int, default=0, help="added latency per request")
+    parser.add_argument("--track-memory", action="store_true", help="also trace per-stage peak python memory (slower)")
+    parser.add_argument("--timeout", type=int, default=0, help="seconds before a run is killed (default none)")
+    parser.add_argument("--range-fetch", choices=RANGE_FETCH_MODES, help="run with pdf_range_fetch on, site serving ranges as the mode says")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    for providers in args.scales:
+        site = SyntheticSite(providers, failure_rate=args.failure_rate, latency_ms=args.latency_ms, range_fetch=args.range_fetch)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), site.handler())
+        server.daemon_threads = True
+        site.base_url = f"http://127.0.0.1:{server.server_port}/"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            print(f"Running {providers} providers ...", flush=True)
+            result = run_scale(providers, site.base_url, args.workers, args.track_memory, args.timeout, args.range_fetch)
+        finally:
+            server.shutdown()
+            server.server_close()
+        result["requests"] = dict(sorted(site.counts.items()))
+        results.append(result)
+
+        print(f"    {result['seconds']}s ({result['providers_per_second']} providers/s), peak RSS {result['peak_rss_mb']} MB, "
+              f"exit {result['returncode']}{' (timed out)' if result['timed_out'] else ''}")
+        print(f"    reports stored {result['stored_reports']} of {result['expected_reports']} expected, "
+              f"{result['range_fetched_reports']} range fetched, {result['field_mismatches']} with wrong fields | requests "
+              + ", ".join(f"{route} {count}" for route, count in result["requests"].items()))
+        if result.get("range_fetch_summary"):
+            print(f"    {result['range_fetch_summary']}")
+        for stage, measured in result["stages"].items():
+            print(f"        {stage:<16} {measured['seconds']:>9.3f}s  {measured.get('peak_mb', '-'):>8} MB")
+        if "output_tail" in result:
+            print(result["output_tail"])
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Results written to {args.json}")
+
+    if any(result["returncode"] != 0 or result["timed_out"] or result["field_mismatches"] for result in results):
+        sys.exit(1)
+    # partial mode stores every report range fetched, the fallback modes none
+    if args.range_fetch and any(
+        bool(result["range_fetched_reports"]) != (args.range_fetch == "partial")
+        or (args.range_fetch == "partial" and result["range_fetched_reports"] != result["stored_reports"])
+        for result in results
+    ):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
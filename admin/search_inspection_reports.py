@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Full-text search over extracted SEND inspection report text held in the inspection store.
+
+Usage:
+    python admin/search_inspection_reports.py "joint commissioning"
+    python admin/search_inspection_reports.py "waiting times NEAR/5 autism" --limit 20
+    python admin/search_inspection_reports.py "ehc plans" --outcome-only
+
+Query syntax is SQLite FTS5 (phrases in quotes, AND/OR/NOT, NEAR, prefix*).
+Results are ranked by bm25 relevance, outcome section matches weighted above full report text.
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = PROJECT_ROOT / "export_data" / "ofsted_send_inspections.db"
+
+# bm25 column weights: publication_link (unindexed), outcome_text, report_text
+OUTCOME_WEIGHT = 4.0
+REPORT_WEIGHT = 1.0
+
+SEARCH_SQL = """
+SELECT pub.urn,
+       p.local_authority,
+       pub.publication_date,
+       snippet(inspection_text_fts, {snippet_col}, '[', ']', ' ... ', 16) AS snippet,
+       bm25(inspection_text_fts, 0.0, ?, ?) AS score
+FROM inspection_text_fts
+JOIN publications pub ON pub.publication_link = inspection_text_fts.publication_link
+LEFT JOIN providers p ON p.urn = pub.urn
+WHERE inspection_text_fts MATCH ?
+ORDER BY score
+LIMIT ?
+"""
+
+
+def search(conn, query, limit=10, outcome_only=False):
+    """Return ranked (urn, local_authority, publication_date, snippet, score) rows for an FTS5 query."""
+    if outcome_only:
+        query = f"outcome_text : ({query})"
+    # snippet from the outcome section unless the hit is only in the wider report
+    snippet_col = 1 if outcome_only else -1
+    return conn.execute(
+        SEARCH_SQL.format(snippet_col=snippet_col),
+        (OUTCOME_WEIGHT, REPORT_WEIGHT, query, limit)
+    ).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search extracted SEND inspection report text")
+    parser.add_argument("query", help="FTS5 query string")
+    parser.add_argument("--limit", type=int, default=10, help="max results (default 10)")
+    parser.add_argument("--outcome-only", action="store_true", help="only match within inspection outcome sections")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help=f"inspection store path (default {DEFAULT_DB})")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"Inspection store not found at {args.db}, run ofsted_send_scrape.py first", file=sys.stderr)
+        sys.exit(2)
+
+    conn = sqlite3.connect(f"file:{args.db}?mode=ro", uri=True)
+    try:
+        started = time.perf_counter()
+        rows = search(conn, args.query, limit=args.limit, outcome_only=args.outcome_only)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except sqlite3.OperationalError as e:
+        print(f"Search failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    for urn, la, published, snippet, score in rows:
+        print(f"{urn:<8} {(la or ''):<28} {published or '':<10}  {score:8.3f}")
+        print(f"    {snippet}")
+
+    print(f"\n{len(rows)} result(s) in {elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,17 +13,73 @@ export_file_type         = 'excel'
 # data exports
 root_export_folder = 'export_data'              # <all> exports folder
 inspections_subfolder = 'inspection_reports'    # downloaded report pdfs
+inspections_db_filename = 'ofsted_send_inspections.db'  # sqlite store of providers|publications|inspections (in root_export_folder)
+geospatial_subfolder = 'geospacial_reports'    # choropleth-ready outcome GeoJSON
+geospatial_report_filename = 'send_outcomes_by_la.geojson'
+cache_subfolder = 'cache'                       # derived|reusable intermediates (not committed)
+aggregates_subfolder = 'aggregates'             # precomputed regional|timing summaries (small json|csv, also shown on index.html)
+feeds_subfolder = 'feeds'                       # Atom|JSON feeds of new SEND publications, appended to each run
+feed_filename = 'send_publications'             # feeds as <feed_filename>.atom|.json
+feed_max_entries = 200                          # most recent publications kept in the feeds (all stay in the store)
+feed_site_url = 'https://data-to-insight.github.io/ofsted-send-scrape-tool/'  # published site, feed|entry links
+upcoming_inspection_months = 3                  # next inspection due within this many months counts as upcoming
 
 # data imports
 import_la_data_path = 'import_data/la_lookup/'
 import_geo_data_path = 'import_data/geospatial/'
 geo_boundaries_filename = 'local_authority_districts_boundaries.json'
+geo_county_lookup_filename = 'lad23_county_lookup.csv'  # shire district (LAD23CD) -> county (CTY23CD), county LAs mapped over their districts
+geo_simplify_tolerance = 0.002  # degrees (~150m), boundary simplification applied once + cached
+geo_coord_precision = 3         # decimal places boundary coordinates quantised to (~100m)
 
 # scrape inspection grade/data from pdf reports
 pdf_data_capture = True # True is default (scrape within pdf inspection reports for inspection results etc)
                         # This impacts run time E.g False == ~1m20 / True == ~ 4m10
                         # False == only pdfs/list of LA's+link to most recent exported. Not inspection results.
 
+# Publication types recognised on the provider pages, by terms (all) found in the link's nonvisual text
+inspection_types = {
+    'area send full inspection':                ['area', 'send', 'full inspection'],
+    'joint area child protection inspection':   ['joint area child protection inspection'],
+    "children's services focused visit":        ["children's services focused visit"],
+    "children's services inspection":           ["children's services inspection"],     # ILACS
+}
+# Types collected during the (single) provider pages crawl. SEND reports are extracted into the summary,
+# others are listed to their own <type>_publications.csv in root_export_folder (e.g. for the ILACS|JTAI tools)
+collect_inspection_types = ['area send full inspection']
+
+# run mode (can also be set via env var OFSTED_SEND_RUN_MODE)
+run_mode = 'latest'     # 'latest' == most recent SEND report per LA (default)
+                        # 'history' == every published SEND report per LA, + long-format history export
+                        # 'reextract' == re-run field extraction over cached report text only (no scrape)
+                        # 'offline' == extract from the local export_data/inspection_reports archive only (no network)
+                        # 'watch' == 'latest' run, then stays resident polling for new publications (see watch_*)
+history_export_filename = 'ofsted_csc_send_history'  # history mode export (csv, in root_export_folder)
+reuse_extracted_reports = True  # skip re-download|extraction of reports already held in the inspection store
+max_workers = 4         # parallel provider page|report fetches (keep modest, avoid over-pinging Ofsted)
+save_pdf_reports = False  # True == keep downloaded report pdfs in export_data/inspection_reports/<urn>_<la>/
+pdf_text_cache_subfolder = 'pdf_text'  # extracted report text cache (in root_export_folder/cache_subfolder)
+pdf_text_extractor_version = 1  # bump if page text extraction changes, invalidates cached text
+pdf_text_backend = 'pymupdf'        # per page report text: 'pymupdf'|'pypdf2'|'pdfminer' (pip install pdfminer.six), env OFSTED_SEND_PDF_TEXT_BACKEND
+pdf_first_page_backend = 'pypdf2'   # page 1 text (inspection dates|table), same choices, env OFSTED_SEND_PDF_FIRST_PAGE_BACKEND
+                                    # compare speed|memory|accuracy on the bundled reports with admin/benchmark_pdf_backends.py
+pdf_range_fetch = False     # True == fetch only the opening pages of linearized report pdfs (HTTP Range), env OFSTED_SEND_RANGE_FETCH=1
+                            # full download where ranges aren't served|pdf isn't linearized, and with save_pdf_reports
+range_fetch_pages = 2       # pdf_range_fetch, opening pages fetched (dates|outcome sit on page 1, fallback tier reads 2)
+range_fetch_block_kb = 16   # pdf_range_fetch, fetched in blocks of this size (smaller == fewer bytes, more requests)
+watch_interval_minutes = 15     # watch mode, minutes between polls of the search listing|provider pages
+watch_jitter = 0.2              # watch mode, +/- fraction of the interval each poll is shifted by (no fixed beat)
+run_metrics_filename = 'run_metrics.json'  # per-stage timings of the last run (in root_export_folder/cache_subfolder)
+track_stage_memory = False  # True == also trace peak python memory per stage (tracemalloc, slower), env OFSTED_SEND_TRACK_MEMORY=1
+                            # + RSS|top allocations per stage and memory per report document, in run_metrics_filename
+log_filename = 'output.log'  # run log, JSON lines (appended across runs, rotated at log_max_kb)
+log_max_kb = 1024
+log_level = 'INFO'          # console|log level, 'DEBUG' == per report detail (dates, next inspection), env OFSTED_SEND_LOG_LEVEL
+stage_log_levels = {}       # per stage overrides of log_level (see run_stage), e.g. {'extract': 'DEBUG', 'store': 'WARNING'}
+memory_top_allocations = 5  # track_stage_memory, allocation sites (file:line) listed per stage, by memory left held
+memory_budget_mb = None     # e.g. 1024 on a small CI runner, caps in-flight report downloads|parses to fit, env OFSTED_SEND_MEMORY_BUDGET_MB
+document_memory_estimate_mb = 40  # memory_budget_mb, allowance per in-flight report (pdf + parse + page text), see per-document metrics
+
 
 
 #
@@ -56,17 +112,44 @@ max_results = 160  # expecting 153 @110225
 # Script admin settings
 # Standard library
 import os
-import io
+import sys
 import re
 import time
-from datetime import datetime, timedelta
+import sqlite3
+import json
+import hashlib
+import csv
+import pickle
+import tempfile
+import gzip
+import io
+import zipfile
+from urllib.parse import quote
+from xml.etree import ElementTree
+from datetime import datetime, timedelta, date
 import warnings
 import logging
+import logging.handlers
+import atexit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
+import threading
+import random
+import tracemalloc
+from contextlib import contextmanager
+from functools import lru_cache
+from dataclasses import dataclass
+
+try:
+    import resource  # process peak RSS (not available on Windows)
+except ModuleNotFoundError:
+    resource = None
 
 # Third-party
 import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 import pandas as pd
+import numpy as np
 from bs4 import BeautifulSoup
 from dateutil.relativedelta import relativedelta
 import git
@@ -78,6 +161,13 @@ try:
 except ModuleNotFoundError:
     print("install 'PyMuPDF' and 'PyPDF2' using pip")
 
+try:
+    # optional 'pdfminer' text backend (see pdf_text_backends)
+    from pdfminer.high_level import extract_pages as pdfminer_extract_pages
+    from pdfminer.layout import LTTextContainer
+except ModuleNotFoundError:
+    pdfminer_extract_pages = None
+
 # Excel export
 try:
     import xlsxwriter
@@ -90,16 +180,68 @@ except ModuleNotFoundError:
 # tabula
 # -- 
 
-# wipe / reset the logging file 
-with open('output.log', 'w'):
-    # comment out if maintaining ongoing/historic log
-    pass
-
 # Keep warnings quiet unless priority
 logging.getLogger('org.apache.pdfbox').setLevel(logging.ERROR)
 warnings.filterwarnings('ignore')
 
-logging.basicConfig(filename='output.log', level=logging.INFO, format='%(asctime)s - %(message)s')
+# Run log, all progress|errors go through this (see start_logging)
+logger = logging.getLogger('ofsted_send')
+
+# Pipeline stage (see run_stage) log records are tagged with
+current_stage = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One json object per log record: time, level, stage, message, + any extra={...} fields."""
+    standard_attributes = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'stage'}
+
+    def format(self, record):
+        entry = {
+            'time':     self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level':    record.levelname,
+            'stage':    getattr(record, 'stage', None),
+            'message':  record.getMessage(),
+            **{key: value for key, value in vars(record).items() if key not in self.standard_attributes},
+        }
+        return json.dumps(entry, default=str)
+
+
+def add_log_stage(record):
+    """
+    Log (handler) filter, tags each record with the current pipeline stage and drops records below that
+    stage's stage_log_levels level (else log_level). Stage levels apply per record, the logger's own level
+    is left as set by start_logging, so threads logging across a stage change aren't affected.
+    """
+    record.stage = current_stage
+    return record.levelno >= logging.getLevelName(stage_log_levels.get(current_stage, log_level).upper())
+
+
+def start_logging(level, filename, max_kb):
+    """
+    Routes the run log through a queue to the console (plain messages) and filename (JSON lines), both written
+    by a listener thread so logging doesn't hold up the scrape. The queue is a multiprocessing one, so records
+    from forked extraction workers arrive too. The logger's level is the lowest of level and any stage_log_levels,
+    so records below it aren't created at all, per stage levels are then applied by the add_log_stage filter.
+
+    Returns:
+        logging.handlers.QueueListener: The started listener, stopped (queue flushed) at exit.
+    """
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+    file_handler = logging.handlers.RotatingFileHandler(filename, maxBytes=max_kb * 1024, backupCount=2, encoding='utf-8')
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    log_queue = multiprocessing.Queue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(add_log_stage)
+    logger.addHandler(queue_handler)
+    logger.setLevel(min(logging.getLevelName(name.upper()) for name in [level, *stage_log_levels.values()]))
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 
@@ -107,13 +249,28 @@ logging.basicConfig(filename='output.log', level=logging.INFO, format='%(asctime
 # Use GITHUB_WORKSPACE env var(str) if available(workflow actions), 
 # otherwise fall back to the default path(codespace).
 repo_path = os.environ.get('GITHUB_WORKSPACE', '/workspaces/ofsted-send-scrape-tool')
-print("Using repo path:", repo_path)
+
+log_level = os.environ.get('OFSTED_SEND_LOG_LEVEL', log_level).upper()
+log_listener = start_logging(log_level, log_filename, log_max_kb)
+logger.info(f"Using repo path: {repo_path}")
+
+run_mode = os.environ.get('OFSTED_SEND_RUN_MODE', run_mode)
+logger.info(f"Run mode: {run_mode}")
+max_workers = int(os.environ.get('OFSTED_SEND_MAX_WORKERS', max_workers))
+track_stage_memory = os.environ.get('OFSTED_SEND_TRACK_MEMORY', str(int(track_stage_memory))) == '1'
+memory_budget_mb = int(os.environ.get('OFSTED_SEND_MEMORY_BUDGET_MB') or memory_budget_mb or 0) or None
+pdf_range_fetch = os.environ.get('OFSTED_SEND_RANGE_FETCH', str(int(pdf_range_fetch))) == '1'
+pdf_text_backend = os.environ.get('OFSTED_SEND_PDF_TEXT_BACKEND', pdf_text_backend)
+pdf_first_page_backend = os.environ.get('OFSTED_SEND_PDF_FIRST_PAGE_BACKEND', pdf_first_page_backend)
+# Site|scale overrides, e.g. admin/scale_test.py pointing a run at its local synthetic site
+url_stem = os.environ.get('OFSTED_SEND_URL_STEM', url_stem)
+max_results = int(os.environ.get('OFSTED_SEND_MAX_RESULTS', max_results))
 
 try:
     # repo object using path string
     repo = git.Repo(repo_path)
 except git.exc.NoSuchPathError:
-    print(f"Error initialising repo path for inspection reports: {repo_path}")
+    logger.error(f"Error initialising repo path for inspection reports: {repo_path}")
     raise
 
 
@@ -121,6 +278,33 @@ except git.exc.NoSuchPathError:
 #
 # Function defs
 
+# ETag|Last-Modified|content hash of each url's last fetch whose reports were all stored, for watch mode's conditional polling
+page_validators = {}
+# validators of pages fetched since, held until their reports are stored (confirm_page_validators). A page whose
+# report extraction failed has its pending validators discarded, so the next poll sees it as changed and retries it
+pending_page_validators = {}
+
+
+def remember_page_validators(url, response, content_sha256=None):
+    """Holds a response's validators (+ content hash, for servers that ignore conditional requests) against its url, pending."""
+    pending_page_validators[url] = {
+        'etag':             response.headers.get('ETag'),
+        'last_modified':    response.headers.get('Last-Modified'),
+        'content_sha256':   content_sha256 or hashlib.sha256(response.content).hexdigest(),
+    }
+
+
+def discard_page_validators(url):
+    """Drops a page's pending validators (its reports weren't all extracted), it's re-fetched in full next poll."""
+    pending_page_validators.pop(url, None)
+
+
+def confirm_page_validators():
+    """Pending validators become those conditional polls use, called once the fetched pages' reports are stored."""
+    page_validators.update(pending_page_validators)
+    pending_page_validators.clear()
+
+
 def get_soup(url, retries=3, delay=5):
     """
     Given a URL, returns a BeautifulSoup object + request error handling
@@ -137,34 +321,77 @@ def get_soup(url, retries=3, delay=5):
         try:
             response = requests.get(url, timeout=timeout_seconds)
             response.raise_for_status()  # any HTTP errors?
+            remember_page_validators(url, response)
             soup = BeautifulSoup(response.content, 'html.parser')
             return soup
         except Timeout:
-            print(f"Timeout getting URL '{url}' on attempt {attempt + 1}. Retrying after {delay} secs...")
+            logger.warning(f"Timeout getting URL '{url}' on attempt {attempt + 1}. Retrying after {delay} secs...")
             time.sleep(delay)
         except HTTPError as e:
-            print(f"HTTP error getting URL '{url}': {e}")
+            logger.error(f"HTTP error getting URL '{url}': {e}")
             return None  # end retries on client and server errors
         except RequestException as e:
-            print(f"Request error getting URL '{url}': {e}")
+            logger.warning(f"Request error getting URL '{url}': {e}")
             if attempt < retries - 1:
-                print(f"Retrying after {delay} secs...")
+                logger.info(f"Retrying after {delay} secs...")
                 time.sleep(delay) # pause to assist not getting blocked
             else:
-                print("Max rtry attempts reached, giving up")
+                logger.error("Max rtry attempts reached, giving up")
                 return None
         except Exception as e:
-            print(f"Unexpected error occurred: {e}")
+            logger.error(f"Unexpected error occurred: {e}")
             return None
 
     return None  # All the retries failed / stop point
 
 
+def get_soup_if_modified(url, timeout_seconds=10):
+    """
+    Conditional GET (If-None-Match|If-Modified-Since from the url's last fetch), for watch mode polling.
+
+    Returns:
+        tuple: (modified, BeautifulSoup or None). Not modified on a 304, or where the server ignores the
+               validators but the content is unchanged. Request errors are reported and treated as not modified
+               (picked up on the next poll).
+    """
+    validators = page_validators.get(url, {})
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout_seconds)
+        if response.status_code == 304:
+            return False, None
+        response.raise_for_status()
+    except RequestException as e:
+        logger.warning(f"Request error polling URL '{url}': {e}")
+        return False, None
+
+    content_sha256 = hashlib.sha256(response.content).hexdigest()
+    if content_sha256 == validators.get('content_sha256'):
+        return False, None
+
+    remember_page_validators(url, response, content_sha256)
+    return True, BeautifulSoup(response.content, 'html.parser')
+
+
+# Phrases, then undesired 'single' words (whole words only), removed from la/provider names in one pass
+provider_name_noise_pattern = re.compile(
+    r"royal borough of |city of |metropolitan district council|london borough of|council of"
+    r"|(?<!\S)(?:city|metropolitan|borough|council|county|district|the)(?!\S)"
+)
+
+
+@lru_cache(maxsize=None)
 def clean_provider_name(name):
     """
     Cleans the la/provider name according to:
                 - expected output based on existing ILACS sheet
                 - historic string issues seen on Ofsted site
+    Memoized, the same few hundred names recur across listing pages|polls.
 
     Args:
         name (str): The original name to be cleaned.
@@ -172,14 +399,16 @@ def clean_provider_name(name):
         str: The cleaned name.
     """
     # Convert to lowercase and remove extra spaces
-    name = name.lower().replace('  ', ' ')
-    
-    # Remove specific phrases
-    name = name.replace("royal borough of ", "").replace("city of ", "").replace("metropolitan district council", "").replace("london borough of", "").replace("council of", "")
+    name = ' '.join(name.lower().split())
+
+    # Remove specific phrases|words and join the remaining parts
+    return ' '.join(provider_name_noise_pattern.sub('', name).split())
+
 
-    # Remove further undesired 'single' words and join the remaining parts
-    name_parts = [part for part in name.split() if part not in ['city', 'metropolitan', 'borough', 'council', 'county', 'district', 'the']] 
-    return ' '.join(name_parts)
+@lru_cache(maxsize=None)
+def la_name_key(name):
+    """LA name matching key (see build_la_name_index): cleaned as provider names, '&' as 'and', commas dropped."""
+    return ' '.join(clean_provider_name(name).replace('&', ' and ').replace(',', ' ').split())
 
 
 
@@ -270,6 +499,14 @@ def format_date_for_report(date_input, output_format_str, input_format_str=None)
 
 
 
+# Fast tier date patterns (page 1 text), compiled once
+non_printable_pattern = re.compile(r'[^\x20-\x7E]')
+multi_space_pattern = re.compile(r'\s+')
+split_year_pattern = re.compile(r"(\b20)\s+(\d{2}\b)")
+inspection_dates_pattern = re.compile(r"Inspection dates\s*:\s*(\d{1,2} \w+ \d{4}) to (\d{1,2} \w+ \d{4})")
+inspection_dates_same_month_pattern = re.compile(r"Inspection dates\s*:\s*(\d{1,2}) to (\d{1,2}) (\w+) (\d{4})")
+previous_inspection_dates_pattern = re.compile(r"Dates? of previous inspection:\s*(\d{1,2}) to (\d{1,2}) (\w+) (\d{4})")
+
 def extract_dates_from_text(text):
     """
     Extracts and cleans inspection dates from the given text.
@@ -295,15 +532,15 @@ def extract_dates_from_text(text):
     # print("Debug: Starting date extraction")
 
     if not text:
-        print("Debug: Input text is empty or None.")
+        logger.debug("Input text is empty or None.")
         raise ValueError("No text provided")
 
     # Remove non-printing characters and multiple spaces
-    cleaned_text = re.sub(r'[^\x20-\x7E]', '', text)
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    cleaned_text = non_printable_pattern.sub('', text)
+    cleaned_text = multi_space_pattern.sub(' ', cleaned_text)
 
     # Preprocess the inspection_dates to fix split years, e.g. 20 23, 20 24 -> 2023, 2024
-    cleaned_text = re.sub(r"(\b20)\s+(\d{2}\b)", r"\1\2", cleaned_text)
+    cleaned_text = split_year_pattern.sub(r"\1\2", cleaned_text)
     #print(f"Debug: Cleaned text: {cleaned_text}")
 
 
@@ -315,7 +552,7 @@ def extract_dates_from_text(text):
 
     # # Not implemented. But in case need to handle cases of repeating year alongside known repeating month "13 July 2023 to 21 July 2023" e.g. West Sussex
     # date_match = re.search(r"Inspection dates\s*:\s*(\d{1,2}(?: \w+ \d{4})?(?: to \d{1,2})? \w+ \d{4})", cleaned_text)
-    date_match = re.search(r"Inspection dates\s*:\s*(\d{1,2} \w+ \d{4}) to (\d{1,2} \w+ \d{4})", cleaned_text)
+    date_match = inspection_dates_pattern.search(cleaned_text)
 
 
     if date_match:
@@ -326,7 +563,7 @@ def extract_dates_from_text(text):
     else:
         #print("Debug: Primary date match not found, trying fallback method")
         # Fallback to capturing single date or simpler range within the same month
-        date_match = re.search(r"Inspection dates\s*:\s*(\d{1,2}) to (\d{1,2}) (\w+) (\d{4})", cleaned_text)
+        date_match = inspection_dates_same_month_pattern.search(cleaned_text)
 
         if date_match:
             #print(f"Debug: Fallback date match found: {date_match.group(0)}")
@@ -340,7 +577,8 @@ def extract_dates_from_text(text):
 
         else:
 
-            raise ValueError(f"Extract_dates_from_text - No inspection dates found: {cleaned_text}")
+            # (extract_send_fields falls back to extract_dates_fallback)
+            raise ValueError(f"Extract_dates_from_text - No inspection dates found: {cleaned_text[:200]}")
 
     # Clean and format the extracted dates
     try:
@@ -349,11 +587,11 @@ def extract_dates_from_text(text):
         #print(f"Debug: Formatted start date: {start_date}")
         #print(f"Debug: Formatted end date: {end_date}")
     except ValueError as ve:
-        print(f"Error converting date: {ve}")
+        logger.warning(f"Error converting date: {ve}")
         raise ValueError("Date conversion failed")
 
     # Now handle previous inspection dates if present in the same cleaned_text
-    previous_inspection_match = re.search(r"Dates? of previous inspection:\s*(\d{1,2}) to (\d{1,2}) (\w+) (\d{4})", cleaned_text)
+    previous_inspection_match = previous_inspection_dates_pattern.search(cleaned_text)
     if previous_inspection_match:
         #print(f"Debug: Previous inspection match found: {previous_inspection_match.groups()}")
         previous_start_day = previous_inspection_match.group(1)
@@ -367,14 +605,14 @@ def extract_dates_from_text(text):
             previous_end_date = datetime.strptime(previous_end_date_str, "%d %B %Y").strftime("%d/%m/%Y")
             #print(f"Debug: Formatted previous inspection end date: {previous_end_date}")
         except ValueError as ve:
-            print(f"Error converting previous inspection date: {ve}")
+            logger.warning(f"Error converting previous inspection date: {ve}")
             previous_end_date = "01/01/1900"  # Placeholder date for conversion errors
     else:
         #print("Debug: No previous inspection date found, using placeholder.")
         previous_end_date = "01/01/1900"  # Placeholder date if no match found
 
     # Final debug print to verify results
-    print(f"\nStart Date: {start_date}, End Date: {end_date}, Previous Inspection End Date: {previous_end_date}")
+    logger.debug("Start Date: %s, End Date: %s, Previous Inspection End Date: %s", start_date, end_date, previous_end_date)
     
     return start_date, end_date, previous_end_date
 
@@ -458,12 +696,23 @@ def extract_dates_from_text(text):
 
 
 
-def extract_inspection_data_update(pdf_content):
+def extract_first_page_text(pdf_path, backend=None):
+    """
+    Returns the text of page 1 (page[0]) of the inspection report, where the inspection dates sit.
+
+    Args:
+        pdf_path (str): Path to the (downloaded) PDF file. Read via file handle, not an in-memory copy.
+        backend (str):  pdf_text_backends name, default pdf_first_page_backend (PyPDF2).
+    """
+    return pdf_text_backends[backend or pdf_first_page_backend](pdf_path, page_count=1)[0]
+
+
+def extract_inspection_data_update(first_page_text):
     """
     Function to extract key details from inspection reports PDF.
 
     Args:
-        pdf_content (bytes): The raw content of the PDF file to be processed. 
+        first_page_text (str): Text of page 1 of the report pdf (see extract_first_page_text|get_pdf_text).
 
     Returns:
         dict: A dictionary containing the extracted details. The dictionary keys are as follows:
@@ -490,20 +739,6 @@ def extract_inspection_data_update(pdf_content):
         If the PDF structure is different, obv the function will need changing. 
     """
 
-    # Create a file-like buffer for the PDF content
-    with io.BytesIO(pdf_content) as buffer:
-        # Read the PDF content for text extraction
-        reader = PyPDF2.PdfReader(buffer)
-        
-        # Extract the first page of inspection report pdf
-        first_page_text = reader.pages[0].extract_text()
-
-        # Not needed in SEND extract(yet) - at least not for overview summary
-        # # Extract text from <all> pages in the pdf
-        # full_text = ''
-        # for page in reader.pages:
-        #     full_text += page.extract_text()
-
     #   # Carry over for ref from ILACS. Not used in SEND
     #     # Find the inspector's name using a regular expression
     #     match = re.search(r"Lead inspector:\s*(.+)", first_page_text)
@@ -518,7 +753,7 @@ def extract_inspection_data_update(pdf_content):
 
 
     # remove all non-printing chars from text content
-    first_page_text= re.sub(r'[^\x20-\x7E]', '', first_page_text)
+    first_page_text= non_printable_pattern.sub('', first_page_text)
 
     # extract and format inspection dates
     try:
@@ -529,21 +764,21 @@ def extract_inspection_data_update(pdf_content):
         try:
             datetime.strptime(start_date_formatted, "%d/%m/%y")
         except (ValueError, TypeError) as e:
-            print(f"Error with start date: {e}")
+            logger.warning(f"Error with start date: {e}")
             start_date_formatted = None
         
         # Validate the end date
         try:
             datetime.strptime(end_date_formatted, "%d/%m/%y")
         except (ValueError, TypeError) as e:
-            print(f"Error with end date: {e}")
+            logger.warning(f"Error with end date: {e}")
             end_date_formatted = None
         
         # Validate the previous inspection date
         try:
             datetime.strptime(previous_inspection_date, "%d/%m/%Y")
         except (ValueError, TypeError) as e:
-            print(f"Error with previous inspection date: {e}")
+            logger.warning(f"Error with previous inspection date: {e}")
             previous_inspection_date = None
 
     except ValueError as e:
@@ -551,7 +786,7 @@ def extract_inspection_data_update(pdf_content):
         start_date_formatted = None
         end_date_formatted = None
         previous_inspection_date = None
-        print(f"Error: {e}")
+        logger.warning(f"Error: {e}")
 
         
 
@@ -587,9 +822,9 @@ def find_non_printable_characters(text):
     """
     non_printable = ''.join(ch for ch in text if ord(ch) < 32 or ord(ch) > 126)
     if non_printable:
-        print(f"Non-printable characters found: {non_printable}")
+        logger.debug("Non-printable characters found: %r", non_printable)
     else:
-        print("No non-printable characters found.")
+        logger.debug("No non-printable characters found.")
 
 
 def clean_pdf_content(pdf_content):
@@ -625,18 +860,447 @@ def extract_text_from_pdf(pdf_bytes):
     return extracted_text
 
 
-def extract_text_by_pages(pdf_bytes):
+def extract_text_by_pages(pdf_path, page_count=None):
     # supercedes extract_text_from_pdf in combo with remove_unwanted_sections
-    pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
+    # opened by path, MuPDF reads from the file as needed (no bytes copy held)
     pages = []
-    
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        text = page.get_text("text")
-        pages.append(text)
+
+    with fitz.open(pdf_path, filetype="pdf") as pdf_document:
+        for page_num in range(min(page_count or len(pdf_document), len(pdf_document))):
+            page = pdf_document.load_page(page_num)
+            text = page.get_text("text")
+            pages.append(text)
     
     return pages
 
+
+def extract_text_by_pages_pypdf2(pdf_path, page_count=None):
+    # PyPDF2 reads objects on demand from an open handle, whereas a path str is read fully into memory
+    with open(pdf_path, 'rb') as pdf_file:
+        reader = PyPDF2.PdfReader(pdf_file)
+        return [page.extract_text() for page in reader.pages[:page_count]]
+
+
+def extract_text_by_pages_pdfminer(pdf_path, page_count=None):
+    # pure python (pdfminer.six), text boxes in layout order, slower but no compiled dependency
+    if pdfminer_extract_pages is None:
+        raise ModuleNotFoundError("install 'pdfminer.six' using pip for the 'pdfminer' pdf text backend")
+    return [
+        ''.join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer))
+        for page_layout in pdfminer_extract_pages(pdf_path, maxpages=page_count or 0)
+    ]
+
+
+# Report text extractors, name -> function(pdf_path, page_count=None) returning a list of page text.
+# pdf_text_backend gives the per page text (outcome|next inspection), pdf_first_page_backend page 1 (dates)
+pdf_text_backends = {
+    'pymupdf':  extract_text_by_pages,
+    'pypdf2':   extract_text_by_pages_pypdf2,
+    'pdfminer': extract_text_by_pages_pdfminer,
+}
+# pair the text cache was first written with, other pairs cached apart (see pdf_text_cache_path)
+pdf_text_default_backends = ('pymupdf', 'pypdf2')
+
+for backend in (pdf_text_backend, pdf_first_page_backend):
+    if backend not in pdf_text_backends:
+        logger.error(f"Unknown pdf text backend '{backend}', expected one of: {', '.join(pdf_text_backends)}")
+        raise ValueError(f"Unknown pdf text backend '{backend}'")
+    if backend == 'pdfminer' and pdfminer_extract_pages is None:
+        logger.error("pdf text backend 'pdfminer' needs pdfminer.six, install it using pip")
+        raise ModuleNotFoundError("pdfminer")
+if (pdf_text_backend, pdf_first_page_backend) != pdf_text_default_backends:
+    logger.info(f"PDF text backends: pages {pdf_text_backend}, first page {pdf_first_page_backend}")
+
+
+def download_pdf(url, dest_path=None, chunk_size=64 * 1024, timeout=30):
+    """
+    Streams a PDF download to disk in chunks, hashing as it arrives, so no whole-file copy is held in memory.
+
+    Written to a temp file first and then atomically moved into place, so a failed|partial download
+    never leaves a truncated report in the archive.
+
+    Args:
+        url (str):          Report url.
+        dest_path (str):    Final file path. If None the temp file is kept and returned (caller removes it).
+        chunk_size (int):   Bytes per streamed chunk.
+        timeout (int):      Connect|read timeout in seconds.
+
+    Returns:
+        tuple: (path to the downloaded file, sha256 hex digest of its content)
+    """
+    temp_dir = os.path.dirname(dest_path) if dest_path else None
+    sha256 = hashlib.sha256()
+
+    fd, temp_path = tempfile.mkstemp(suffix='.pdf.part', dir=temp_dir)
+    try:
+        with os.fdopen(fd, 'wb') as temp_file, requests.get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                temp_file.write(chunk)
+                sha256.update(chunk)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+    if dest_path is None:
+        return temp_path, sha256.hexdigest()
+
+    os.replace(temp_path, dest_path)
+    return dest_path, sha256.hexdigest()
+
+
+# PyMuPDF isn't thread safe (even across separate documents), pdf parsing within threads is serialised
+pdf_parse_lock = threading.Lock()
+
+# In-flight report downloads|parses, capped by memory_budget_mb (see apply_memory_budget) else by max_workers
+report_slots = threading.BoundedSemaphore(max_workers)
+
+
+def get_pdf_text(pdf_path, pdf_sha256, text_cache_dir):
+    """
+    Returns the report's extracted text, from the sidecar text cache where already held.
+
+    Cached as gzipped json keyed on the pdf's sha256 + pdf_text_extractor_version (+ text backends), so later changes
+    to the field parsing (dates, next inspection etc.) can be re-run over cached text without re-downloading|re-parsing pdfs.
+
+    Returns:
+        dict: {'pages': [per page text (pdf_text_backend)], 'first_page_text': page 1 text (pdf_first_page_backend)}
+    """
+    pdf_text = load_cached_pdf_text(pdf_sha256, text_cache_dir)
+    if pdf_text is not None:
+        return pdf_text
+
+    with pdf_parse_lock:
+        pdf_text = {
+            'pages':            pdf_text_backends[pdf_text_backend](pdf_path),
+            'first_page_text':  extract_first_page_text(pdf_path),
+        }
+
+    save_cached_pdf_text(pdf_text, pdf_sha256, text_cache_dir)
+    return pdf_text
+
+
+def save_cached_pdf_text(pdf_text, pdf_sha256, text_cache_dir, page_count=None):
+    """Writes extracted text to the sidecar text cache (gzipped json, atomically moved into place)."""
+    if not os.path.exists(text_cache_dir):
+        os.makedirs(text_cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix='.part', dir=text_cache_dir)
+    with os.fdopen(fd, 'wb') as f, gzip.GzipFile(fileobj=f, mode='wb') as gz:
+        gz.write(json.dumps(pdf_text).encode('utf-8'))
+    os.replace(temp_path, pdf_text_cache_path(pdf_sha256, text_cache_dir, page_count))
+
+
+def pdf_text_cache_path(pdf_sha256, text_cache_dir, page_count=None):
+    """
+    Text cache file for a pdf hash, current extractor version (+ the text backends where not the defaults,
+    + the page count where only the opening pages were extracted, see fetch_report_opening_pages).
+    """
+    backends = (pdf_text_backend, pdf_first_page_backend)
+    backends_tag = '' if backends == pdf_text_default_backends else '_' + '-'.join(backends)
+    pages_tag = f"_p{page_count}" if page_count else ''
+    return os.path.join(text_cache_dir, f"{pdf_sha256}_v{pdf_text_extractor_version}{backends_tag}{pages_tag}.json.gz")
+
+
+def load_cached_pdf_text(pdf_sha256, text_cache_dir, page_count=None):
+    """Returns cached extracted text for a pdf hash (current extractor version|backends), or None if not cached."""
+    cache_path = pdf_text_cache_path(pdf_sha256, text_cache_dir, page_count)
+    if not os.path.exists(cache_path):
+        return None
+    with gzip.open(cache_path, 'rb') as gz:
+        return json.loads(gz.read().decode('utf-8'))
+
+
+def get_pdf_text_with_memory(pdf_path, pdf_sha256, text_cache_dir):
+    """
+    get_pdf_text, + with track_stage_memory the report's memory use: pdf|page text size and traced peak above the
+    start of its text extraction (under threads, allocations by concurrent downloads are included).
+
+    Returns:
+        tuple: (pdf_text, metrics dict {'pdf_kb', 'text_kb', 'peak_mb'}, empty if memory isn't traced)
+    """
+    if not (track_stage_memory and tracemalloc.is_tracing()):
+        return get_pdf_text(pdf_path, pdf_sha256, text_cache_dir), {}
+
+    reset_traced_peak()
+    started = tracemalloc.get_traced_memory()[0]
+    pdf_text = get_pdf_text(pdf_path, pdf_sha256, text_cache_dir)
+
+    return pdf_text, {
+        'pdf_kb':   round(os.path.getsize(pdf_path) / 1024, 1),
+        'text_kb':  round(sum(len(page) for page in pdf_text['pages']) / 1024, 1),
+        'peak_mb':  round((tracemalloc.get_traced_memory()[1] - started) / (1024 * 1024), 1),
+    }
+
+
+class HttpRangeFile(io.RawIOBase):
+    """
+    Read-only, seekable file over a url served with HTTP Range requests, fetched in blocks on first read.
+
+    Lets PyPDF2 (which reads objects on demand from a file handle) open a remote pdf touching only the
+    bytes it needs. Blocks held are kept in `blocks`, `bytes_fetched`|`requests_made` count the transfer.
+    """
+
+    def __init__(self, url, size, block_size, timeout=30, first_bytes=b''):
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.block_size = block_size
+        self.timeout = timeout
+        self.position = 0
+        self.blocks = {}
+        self.bytes_fetched = 0
+        self.requests_made = 0
+        # bytes already fetched from the start of the file (whole blocks only)
+        for index in range(len(first_bytes) // block_size):
+            self.blocks[index] = first_bytes[index * block_size:(index + 1) * block_size]
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        self.position = min(max(offset, 0), self.size)
+        return self.position
+
+    def fetch(self, start, end):
+        """Makes sure bytes start..end-1 are held, missing blocks fetched in as few requests as possible."""
+        first, last = start // self.block_size, (max(end, start + 1) - 1) // self.block_size
+        missing = [index for index in range(first, last + 1) if index not in self.blocks]
+        while missing:
+            # run of consecutive missing blocks == one request
+            run_end = 0
+            while run_end + 1 < len(missing) and missing[run_end + 1] == missing[run_end] + 1:
+                run_end += 1
+            range_start = missing[0] * self.block_size
+            range_end = min((missing[run_end] + 1) * self.block_size, self.size) - 1
+            response = requests.get(self.url, headers={'Range': f"bytes={range_start}-{range_end}"}, timeout=self.timeout)
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise HTTPError(f"Range request not honoured for '{self.url}' (HTTP {response.status_code})")
+            if (len(response.content) != range_end - range_start + 1
+                    or not response.headers.get('Content-Range', '').endswith(f"/{self.size}")):
+                # short body, or the file changed since the opening request
+                raise HTTPError(f"Range request for '{self.url}' returned {len(response.content)} of "
+                                f"{range_end - range_start + 1} bytes ({response.headers.get('Content-Range')})")
+            self.requests_made += 1
+            self.bytes_fetched += len(response.content)
+            for index in missing[:run_end + 1]:
+                offset = index * self.block_size - range_start
+                self.blocks[index] = response.content[offset:offset + self.block_size]
+            missing = missing[run_end + 1:]
+
+    def readinto(self, buffer):
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        self.fetch(self.position, self.position + length)
+        written = 0
+        while written < length:
+            index, offset = divmod(self.position + written, self.block_size)
+            chunk = self.blocks[index][offset:offset + length - written]
+            buffer[written:written + len(chunk)] = chunk
+            written += len(chunk)
+        self.position += length
+        return length
+
+    def transfer(self):
+        return {'bytes_fetched': self.bytes_fetched, 'bytes_total': self.size, 'range_requests': self.requests_made}
+
+    def write_sparse_copy(self, path):
+        """Writes a file of the full size holding the fetched blocks, zeros elsewhere (sparse on disk)."""
+        with open(path, 'wb') as f:
+            f.truncate(self.size)
+            for index, block in sorted(self.blocks.items()):
+                f.seek(index * self.block_size)
+                f.write(block)
+
+
+linearized_pattern = re.compile(rb'<<[^>]*?/Linearized\s[^>]*>>', re.DOTALL)
+linearized_key_pattern = re.compile(rb'/([LEO])\s+(\d+)')
+
+
+def pdf_linearization(opening_bytes):
+    """
+    Linearization parameters of a pdf from its opening bytes, or None if it isn't linearized.
+
+    Returns:
+        dict: {'L': file length, 'E': end of the first page section, 'O': first page object number}
+    """
+    match = linearized_pattern.search(opening_bytes[:1024])
+    if not match:
+        return None
+    return {key.decode(): int(value) for key, value in linearized_key_pattern.findall(match.group(0))}
+
+
+# page dict|annotation keys pointing away from the page's own content (other pages, outline, structure tree)
+range_fetch_skip_keys = {'/Parent', '/P', '/Pg', '/Obj', '/Dest', '/A', '/B', '/Thumb', '/StructParent', '/StructParents'}
+# catalog entries page text depends on (colour output intent, optional content visibility)
+range_fetch_catalog_keys = ['/OutputIntents', '/OCProperties']
+image_subtype_pattern = re.compile(rb'/Subtype\s*/Image\b')
+indirect_reference_pattern = re.compile(rb'(\d+)\s+(\d+)\s+R\b')
+
+
+def fetch_page_objects(reader, range_file, obj, seen):
+    """
+    Resolves (so fetches) every object a page's text depends on: content streams, resources, fonts, forms.
+    Image streams are left unfetched, found by peeking at the object's dictionary before resolving it.
+    """
+    if isinstance(obj, PyPDF2.generic.IndirectObject):
+        if obj.idnum in seen:
+            return
+        seen.add(obj.idnum)
+        offset = reader.xref.get(obj.generation, {}).get(obj.idnum)
+        if offset is not None:
+            range_file.seek(offset)
+            head = re.split(rb'\bstream\b|\bendobj\b', range_file.read(512), maxsplit=1)[0]
+            if image_subtype_pattern.search(head):
+                # image data left unfetched, but not what its dictionary refers to (e.g. an ICC colour profile)
+                for ref_id, ref_generation in indirect_reference_pattern.findall(head):
+                    fetch_page_objects(reader, range_file, PyPDF2.generic.IndirectObject(int(ref_id), int(ref_generation), reader), seen)
+                return
+        obj = obj.get_object()
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key not in range_fetch_skip_keys:
+                fetch_page_objects(reader, range_file, value, seen)
+    elif isinstance(obj, list):
+        for value in obj:
+            fetch_page_objects(reader, range_file, value, seen)
+
+
+def number_tree_value(tree, key):
+    """Value held against key in a pdf number tree (e.g. the structure tree's /ParentTree), or None."""
+    node = tree.get_object()
+    while node is not None:
+        if '/Nums' in node:
+            nums = node['/Nums']
+            for index in range(0, len(nums) - 1, 2):
+                if nums[index] == key:
+                    return nums[index + 1]
+            return None
+        for kid in node.get('/Kids', []):
+            kid = kid.get_object()
+            low, high = kid.get('/Limits', [key, key])
+            if low <= key <= high:
+                node = kid
+                break
+        else:
+            return None
+    return None
+
+
+def fetch_page_structure(reader, range_file, pages, seen):
+    """
+    Fetches the structure elements marked content on the pages belongs to (and their ancestors), from
+    the structure tree's /ParentTree. PyMuPDF takes tagged text (e.g. /ActualText) from these.
+    """
+    struct_root = reader.trailer['/Root'].get_object().get('/StructTreeRoot')
+    if struct_root is None:
+        return
+    struct_root = struct_root.get_object()
+    for key in ('/RoleMap', '/ClassMap'):
+        fetch_page_objects(reader, range_file, struct_root.get(key), seen)
+    if '/ParentTree' not in struct_root:
+        return
+
+    for page in pages:
+        if '/StructParents' not in page:
+            continue
+        elements = number_tree_value(struct_root['/ParentTree'], page['/StructParents'])
+        for element in (elements.get_object() if elements is not None else []):
+            # element and its ancestors, not their other children (the rest of the document's structure)
+            while isinstance(element, PyPDF2.generic.IndirectObject) and element.idnum not in seen:
+                seen.add(element.idnum)
+                element = element.get_object().get('/P')
+
+
+def fetch_report_opening_pages(url, text_cache_dir, page_count=None, block_size=None, timeout=30):
+    """
+    Text of only the opening pages of a linearized report pdf, fetched with HTTP Range requests.
+
+    The first request (opening block) shows whether the server honours ranges and the pdf is linearized.
+    The first page section (up to the linearization dict's /E) is then fetched in one request, and the
+    trailer|xref and the objects the further opening pages' text needs on demand. Photos, later pages and
+    annexes are never fetched. Page text comes from the same extractors as a full download (pdf_text_backends),
+    reading a sparse local copy of the fetched bytes.
+
+    Text is cached (see get_pdf_text) against the sha256 of the first page section, in place of the whole pdf's,
+    and the page count (a cached 2 page text isn't served once range_fetch_pages is 3).
+
+    Returns:
+        tuple: (pdf_text {'pages': [opening pages], 'first_page_text'}, first page section sha256,
+                {'bytes_fetched', 'bytes_total', 'range_requests'}), or None where the server ignores ranges
+                or the pdf isn't linearized (caller falls back to download_pdf).
+    """
+    page_count = page_count or range_fetch_pages
+    block_size = block_size or range_fetch_block_kb * 1024
+
+    with requests.get(url, headers={'Range': f"bytes=0-{block_size - 1}"}, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        content_range = response.headers.get('Content-Range', '')
+        if response.status_code != 206 or not re.match(r'bytes 0-\d+/\d+$', content_range):
+            return None  # ranges unsupported, body left unread
+        opening_bytes = response.content
+
+    size = int(content_range.rsplit('/', 1)[1])
+    linearization = pdf_linearization(opening_bytes)
+    if not linearization or linearization.get('L') != size:
+        return None  # not linearized (or appended to since), first page objects could be anywhere
+
+    range_file = HttpRangeFile(url, size, block_size, timeout, opening_bytes)
+    range_file.bytes_fetched, range_file.requests_made = len(opening_bytes), 1
+    first_section_end = min(max(linearization.get('E', 0), block_size), size)
+    range_file.fetch(0, first_section_end)
+    range_file.seek(0)
+    first_section_sha256 = hashlib.sha256(range_file.read(first_section_end)).hexdigest()
+
+    pdf_text = load_cached_pdf_text(first_section_sha256, text_cache_dir, page_count)
+    if pdf_text is not None:
+        return pdf_text, first_section_sha256, range_file.transfer()
+
+    reader = PyPDF2.PdfReader(range_file)
+    pages = reader.pages[:page_count]
+    seen = set()
+    for page in pages:
+        fetch_page_objects(reader, range_file, page, seen)
+    # + document level objects text extraction depends on (PyMuPDF reads the Info dict's producer)
+    catalog = reader.trailer['/Root'].get_object()
+    for obj in [reader.trailer.get('/Info')] + [catalog.get(key) for key in range_fetch_catalog_keys]:
+        fetch_page_objects(reader, range_file, obj, seen)
+    fetch_page_structure(reader, range_file, pages, seen)
+
+    fd, sparse_path = tempfile.mkstemp(suffix='.pdf.part')
+    os.close(fd)
+    try:
+        range_file.write_sparse_copy(sparse_path)
+        with pdf_parse_lock:
+            # unfetched (zeroed) images are reported as broken objects, expected here
+            display_errors = fitz.TOOLS.mupdf_display_errors()
+            fitz.TOOLS.mupdf_display_errors(False)
+            try:
+                pdf_text = {
+                    'pages':            pdf_text_backends[pdf_text_backend](sparse_path, page_count),
+                    'first_page_text':  extract_first_page_text(sparse_path),
+                }
+            finally:
+                fitz.TOOLS.mupdf_display_errors(display_errors)
+    finally:
+        os.remove(sparse_path)
+
+    save_cached_pdf_text(pdf_text, first_section_sha256, text_cache_dir, page_count)
+    return pdf_text, first_section_sha256, range_file.transfer()
+
+
 def remove_unwanted_sections(pages_content):
      # supercedes extract_text_from_pdf in combo with extract_text_by_pages
      # we know the last two pages of the reports are superfluous to content/outcome detail
@@ -717,13 +1381,25 @@ def parse_inspection_date(date_string):
 
 
 
-def extract_next_inspection(inspection_outcome_section):
-    monitoring_pattern = re.compile(r"monitoring inspection will be carried out within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE)
-    full_patterns = [
-        re.compile(r"full reinspection will be within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE),
-        re.compile(r"the next full area SEND inspection will be within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE)
-    ]
-    
+# Ofsted write time frames as words or digits
+time_frame_numbers = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12
+}
+
+# Fast tier next inspection patterns (outcome section), compiled once
+next_monitoring_inspection_pattern = re.compile(r"monitoring inspection will be carried out within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE)
+next_full_inspection_patterns = [
+    re.compile(r"full reinspection will be within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE),
+    re.compile(r"the next full area SEND inspection will be within approximately (\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (years?|months?)", re.IGNORECASE)
+]
+
+def extract_next_inspection(inspection_outcome_section, monitoring_pattern=next_monitoring_inspection_pattern, full_patterns=next_full_inspection_patterns):
+    """
+    Returns the next (monitoring, else full) inspection time frame as f"{time_frame} {unit}", or None.
+    Patterns default to the fast tier's, extract_next_inspection_fallback passes looser ones.
+    """
     # Check for monitoring inspection first
     match = monitoring_pattern.search(inspection_outcome_section)
     if not match:
@@ -735,13 +1411,8 @@ def extract_next_inspection(inspection_outcome_section):
     
     if match:
         # Convert text numbers to numeric
-        number_map = {
-            "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
-            "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
-            "eleven": 11, "twelve": 12
-        }
         number_str = match.group(1).lower()
-        time_frame = number_map.get(number_str, number_str)  # Convert text to number if needed
+        time_frame = time_frame_numbers.get(number_str, number_str)  # Convert text to number if needed
         unit = match.group(2).lower()
         
         return f"{time_frame} {unit}"
@@ -773,7 +1444,7 @@ def calculate_next_inspection_by_date(last_inspection_date, next_inspection_time
         unit = match.group(2).lower()
 
         # testing
-        print(f"calculate_next_inspection_by_date/number+unit: {number}, {unit}")  # testing
+        logger.debug("calculate_next_inspection_by_date/number+unit: %s, %s", number, unit)
 
         if 'year' in unit:
             next_inspection_date = last_inspection_date_parsed + relativedelta(years=number)
@@ -789,6 +1460,84 @@ def calculate_next_inspection_by_date(last_inspection_date, next_inspection_time
     return "Invalid next inspection time frame"
 
 
+# Fallback tier, only run for fields the fast tier (page 1 PyPDF2 text, strict patterns) didn't resolve.
+# Uses the PyMuPDF text of the opening pages (different layout|reading order, held in the text cache so
+# still no pdf access) and looser patterns, e.g. month spanning "29 April to 3 May 2024",
+# repeated month "23 September to 27 September 2024", en dash ranges, "will take place within", no "approximately"
+extraction_fallback_pages = 2   # opening report pages searched by the fallback tier
+
+month_names = r"(January|February|March|April|May|June|July|August|September|October|November|December)"
+# [start day [start month] [start year] to|-] end day end month end year
+date_range_fallback = (
+    r"(?:(\d{1,2})(?:\s+" + month_names + r")?(?:\s+(\d{4}))?\s*(?:to|–|-)\s*)?"
+    r"(\d{1,2})\s+" + month_names + r"\s+(\d{4})"
+)
+inspection_dates_fallback_pattern = re.compile(r"Inspection dates?\s*:?\s*" + date_range_fallback, re.IGNORECASE)
+previous_inspection_dates_fallback_pattern = re.compile(
+    r"(?:Dates? of (?:the )?previous inspections?\s*:?|previous (?:full )?inspection was on)\s*" + date_range_fallback, re.IGNORECASE
+)
+
+time_frame_fallback = r"within\s+(?:approximately\s+)?(\d+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s+(years?|months?)"
+next_monitoring_inspection_fallback_pattern = re.compile(r"monitoring\s+inspection\s+will\s+(?:be\s+carried\s+out|take\s+place|be)\s+" + time_frame_fallback, re.IGNORECASE)
+next_full_inspection_fallback_patterns = [
+    re.compile(r"full\s+(?:area\s+SEND\s+)?(?:re)?inspection\s+will\s+(?:be\s+carried\s+out|take\s+place|be)\s+" + time_frame_fallback, re.IGNORECASE),
+]
+
+
+def fallback_text_from_pages(pages):
+    """Opening pages' (PyMuPDF) text as one line, split years rejoined, for the fallback tier patterns."""
+    text = multi_space_pattern.sub(' ', " ".join(pages[:extraction_fallback_pages]))
+    return split_year_pattern.sub(r"\1\2", text)
+
+
+def search_date_range_fallback(pattern, text):
+    """
+    Returns (start, end) datetimes of the first date (range) matched by a fallback tier pattern, or None.
+    Start month|year default to the end's, e.g. "23 to 27 September 2024", "29 April to 3 May 2024".
+    """
+    for match in pattern.finditer(text):
+        start_day, start_month, start_year, end_day, end_month, end_year = match.groups()
+        try:
+            end_date = datetime.strptime(f"{end_day} {end_month} {end_year}", "%d %B %Y")
+            if start_day is None:
+                return end_date, end_date  # single date
+            start_date = datetime.strptime(f"{start_day} {start_month or end_month} {start_year or end_year}", "%d %B %Y")
+        except ValueError:
+            continue  # e.g. 31 in a 30 day month, try any later match
+        if start_date > end_date and start_year is None:
+            start_date = start_date.replace(year=start_date.year - 1)  # e.g. "27 December to 2 January 2025"
+        return start_date, end_date
+    return None
+
+
+def extract_next_inspection_fallback(text):
+    """Next inspection time frame as extract_next_inspection, with the fallback tier's looser patterns."""
+    return extract_next_inspection(
+        multi_space_pattern.sub(' ', text),
+        monitoring_pattern=next_monitoring_inspection_fallback_pattern,
+        full_patterns=next_full_inspection_fallback_patterns
+    )
+
+
+def summarise_extraction_tiers(extraction_tiers):
+    """
+    Counts which extraction tier resolved each field across reports.
+
+    Args:
+        extraction_tiers (dict): report link -> {field: 'fast'|'fallback'|None}, see extract_send_fields.
+
+    Returns:
+        dict: field -> {'fast'|'fallback'|'unresolved': report count}
+    """
+    tier_counts = {}
+    for report_tiers in extraction_tiers.values():
+        for field, tier in report_tiers.items():
+            field_counts = tier_counts.setdefault(field, {'fast': 0, 'fallback': 0, 'unresolved': 0})
+            field_counts[tier or 'unresolved'] += 1
+    return tier_counts
+
+
+
 def parse_date_new(date_input, date_format=None, output_format="%d/%m/%y", return_as_date=False):
     """
     Function to parse a date string or format a datetime object into a specified format, with an option to return as a date object.
@@ -856,353 +1605,2045 @@ def parse_date_new(date_input, date_format=None, output_format="%d/%m/%y", retur
     
 
 
-def process_provider_links(provider_links):
+def match_inspection_type(nonvisual_text):
+    """
+    Returns the collect_inspection_types entry a publication's (lowercase) nonvisual text matches, else None.
+    """
+    for inspection_type in collect_inspection_types:
+        if all(term in nonvisual_text for term in inspection_types[inspection_type]):
+            return inspection_type
+    return None
+
+
+def provider_page_url(link):
+    """Provider (child) page url of a search results provider link."""
+    return url_stem + link['href'].lstrip('/')
+
+
+def get_provider_publications(link, if_modified=False):
     """
-    Processes provider links and returns a list of dictionaries containing URN, local authority, and inspection link.
+    Fetches a provider's child page and returns its publication links of each collected inspection type.
 
     Args:
-        provider_links (list): A list of BeautifulSoup Tag objects representing provider links.
+        link (bs4.element.Tag): Provider link from the search results page.
+        if_modified (bool): Conditional fetch (watch mode), None returned if the page is unchanged since last fetched.
 
     Returns:
-        list: A list of dictionaries containing URN, local authority, inspection link, and, if enabled, additional inspection data.
+        tuple: (urn, la_name_str, provider_dir, {inspection_type: list of (href, filename) tuples most recent FIRST})
     """
-    
-    data = []
-    global pdf_data_capture # Bool flag
-    global root_export_folder
-    global inspections_subfolder
+    # Extract the URN and provider name from the web link shown
+    urn = link['href'].rsplit('/', 1)[-1]
+    la_name_str = clean_provider_name(link.text.strip())
 
+    provider_dir = os.path.join('.', root_export_folder, inspections_subfolder, urn + '_' + la_name_str)
 
-    for link in provider_links:
-        # Extract the URN and provider name from the web link shown
-        urn = link['href'].rsplit('/', 1)[-1]
-        la_name_str = clean_provider_name(link.text.strip())
+    # Create the provider directory if it doesn't exist, ready for .pdf report export into file structure
+    if not os.path.exists(provider_dir):
+        os.makedirs(provider_dir)
 
+    # Get the child page content
+    child_url = provider_page_url(link)
+    if if_modified:
+        modified, child_soup = get_soup_if_modified(child_url)
+        if not modified:
+            return None
+    else:
+        child_soup = get_soup(child_url)
 
-        provider_dir = os.path.join('.', root_export_folder, inspections_subfolder, urn + '_' + la_name_str)
+    publications = {inspection_type: [] for inspection_type in collect_inspection_types}
 
-        # Create the provider directory if it doesn't exist, ready for .pdf report export into file structure
-        if not os.path.exists(provider_dir):
-            os.makedirs(provider_dir)
+    if child_soup is None:
+        logger.warning(f"No provider page content retrieved for {urn} {la_name_str}, skipping")
+        return urn, la_name_str, provider_dir, publications
 
-        # Get the child page content
-        child_url = 'https://reports.ofsted.gov.uk' + link['href']
-        child_soup = get_soup(child_url)
+    # Find all publication links in the provider's child page
+    # Important: This assumes that the provider's reports are returned/organised most recent FIRST
+    pdf_links = child_soup.find_all('a', {'class': 'publication-link'})
 
-        # Find all publication links in the provider's child page
-        pdf_links = child_soup.find_all('a', {'class': 'publication-link'})
+    for pdf_link in pdf_links:
 
+        # E.g. Publication link contains
+        # <a class="publication-link" href="https://files.ofsted.gov.uk/v1/file/50252240" target="_blank">
 
-        # Initialise a flag to indicate if an inspection link has been found
-        # Important: This assumes that the provider's reports are returned/organised most recent FIRST
-        found_inspection_link = False
 
-        # Iterate through the publication links
-        for pdf_link in pdf_links:
+        # Check if the current/next href-link meets the selection criteria
+        # This block obv relies on Ofsted continued use of nonvisual element descriptors
+        # containing the type(s) of inspection text. We use  "children's services inspection"
 
-            # E.g. Publication link contains
-            # <a class="publication-link" href="https://files.ofsted.gov.uk/v1/file/50252240" target="_blank">
+        nonvisual_text = pdf_link.select_one('span.nonvisual').text.lower().strip()
 
+        # For reference:
+        # At this point <nonvisual_text> contains a mixed batch of the following:
+        # joint area child protection inspection, pdf - 30 january 2024
+        # children's services focused visit, pdf - 01 august 2024
+        # joint area child protection inspection, pdf - 06 january 2023
+        # children's services focused visit, pdf - 07 november 2023
+        # area send full inspection, pdf - 12 july 2024
 
-            # Check if the current/next href-link meets the selection criteria
-            # This block obv relies on Ofsted continued use of nonvisual element descriptors
-            # containing the type(s) of inspection text. We use  "children's services inspection"
+        # Web page|non-visual elements search terms set in inspection_types (config)
+        inspection_type = match_inspection_type(nonvisual_text)
+        if inspection_type:
 
-            nonvisual_text = pdf_link.select_one('span.nonvisual').text.lower().strip()
+            # Create the filename (this filetype needs to be hard-coded here)
+            filename = nonvisual_text.replace(', pdf', '') + '.pdf'
 
-            # For reference:
-            # At this point <nonvisual_text> contains a mixed batch of the following:
-            # joint area child protection inspection, pdf - 30 january 2024
-            # children's services focused visit, pdf - 01 august 2024
-            # joint area child protection inspection, pdf - 06 january 2023
-            # children's services focused visit, pdf - 07 november 2023
-            # area send full inspection, pdf - 12 july 2024
+            # # For reference:
+            # # at this point, example var contents would be: 
+            # print(f"pdflink:{pdf_link}")                # e.g. "<a class="publication-link" href="https://files.ofsted.gov.uk/v1/file/50252437" target="_blank">
+            #                                             # Area SEND full inspection                <span class="nonvisual">Area SEND full inspection, pdf - 15 July 2024</span></a>"
+            # print(f"nonvisualtext:{nonvisual_text}")    # e.g. "area send full inspection, pdf - 15 july 2024"
+            # print(f"filename:{filename}")               # e.g. "area send full inspection - 15 july 2024.pdf"
+            publications[inspection_type].append((pdf_link['href'], filename))
 
-            # For now at least, web page|non-visual elements search terms hard-coded
-            if 'area' in nonvisual_text and 'send' in nonvisual_text and 'full inspection' in nonvisual_text:
+    return urn, la_name_str, provider_dir, publications
 
-                # Create the filename and download the PDF (this filetype needs to be hard-coded here)
-                filename = nonvisual_text.replace(', pdf', '') + '.pdf'
 
+def extract_send_publication(urn, la_name_str, provider_dir, inspection_link, filename):
+    """
+    Downloads a single area SEND report and builds its summary record.
+
+    Args:
+        urn (str):              Provider URN.
+        la_name_str (str):      Cleaned LA name.
+        provider_dir (str):     Local LA reports folder.
+        inspection_link (str):  Report pdf url.
+        filename (str):         Report filename, incl. published date e.g. "area send full inspection - 15 july 2024.pdf"
+
+    Returns:
+        InspectionRecord: Record as stored, or only the page-available detail if pdf_data_capture is off.
+    """
+    # Capture the data that will be exported about this inspection
+    local_authority = provider_dir.split('_', 1)[-1].replace('_', ' ').strip()
 
-                # # For reference:
-                # # at this point, example var contents would be: 
-                # print(f"pdflink:{pdf_link}")                # e.g. "<a class="publication-link" href="https://files.ofsted.gov.uk/v1/file/50252437" target="_blank">
-                #                                             # Area SEND full inspection                <span class="nonvisual">Area SEND full inspection, pdf - 15 July 2024</span></a>"
-                # print(f"nonvisualtext:{nonvisual_text}")    # e.g. "area send full inspection, pdf - 15 july 2024"
-                # print(f"filename:{filename}")               # e.g. "area send full inspection - 15 july 2024.pdf"
-           
+    # Extract the report published date
+    report_published_date_str = filename.split('-')[-1].strip().split('.')[0] # published date appears after '-' 
 
+    # get/format date(s) (as dt objects)
+    report_published_date = datetime.strptime(report_published_date_str, '%d %B %Y').date()
 
-                # # Turn this OFF to minimise data 
-                # # Download and stores locally each relevant PDF! 
-                pdf_content = requests.get(pdf_link['href']).content
-                # with open(os.path.join(provider_dir, filename), 'wb') as f:
-                #     f.write(pdf_content)
-                # ## END data reduction
+    # Format the provider directory as a file path link (in readiness for such as Excel)
+    provider_dir_link = f"{provider_dir}"
+    provider_dir_link = provider_dir_link.replace('/', '\\') # fix for Windows systems
 
-  
-                pdf_pages_content = extract_text_by_pages(pdf_content)
-                pdf_pages_content_reduced = remove_unwanted_sections(pdf_pages_content)
+    record = InspectionRecord(urn=int(urn), local_authority=la_name_str, inspection_link=inspection_link,
+                              publication_date=report_published_date, local_link_to_all_inspections=provider_dir_link)
 
-                # Combine pages back into a single text
-                pdf_content_reduced = "\n".join(pdf_pages_content_reduced)
+    if not pdf_data_capture:
+        # Opt2 : ~x4 faster runtime
+        # Only grab the data/docs we can get direct off the Ofsted page 
+        return record
 
-                # Extract the "Inspection outcome" section
-                inspection_outcome_section = extract_inspection_outcome_section(pdf_content_reduced)
 
-                # Determine the outcome grade
-                outcome_grade = determine_outcome_grade(inspection_outcome_section)
-            
-                # Next inspection time-frame (comnes back as f"{time_frame} {unit}")
-                next_inspection = extract_next_inspection(inspection_outcome_section)
+    # Opt1 : ~x4 slower runtime
+    # Only here if we have set PDF text scrape flag to True
+    # Turn this off, speeds up script if we only need the inspection documents themselves to be retrieved
+
+    # Download (streamed to disk) the report pdf, only kept in the LA's reports folder if save_pdf_reports
+    # Reports in flight (downloaded|parsed, not yet reduced to fields) limited to report_slots (memory_budget_mb)
+    text_cache_dir = os.path.join(root_export_folder, cache_subfolder, pdf_text_cache_subfolder)
+    with report_slots:
+        # pdf_range_fetch, only the opening pages fetched where the server|pdf allow, else the full download
+        opening_pages = None
+        if pdf_range_fetch and not save_pdf_reports:
+            try:
+                opening_pages = fetch_report_opening_pages(inspection_link, text_cache_dir)
+            except Exception as e:
+                logger.warning(f"Range fetch of '{inspection_link}' failed, downloading in full: {e}")
+
+        if opening_pages:
+            pdf_text, pdf_sha256, transfer = opening_pages
+            record.document_metrics = {**transfer, 'bytes_saved': transfer['bytes_total'] - transfer['bytes_fetched'], 'range_fetched': True}
+            record.range_fetched = True
+        else:
+            if save_pdf_reports:
+                pdf_path, pdf_sha256 = download_pdf(inspection_link, os.path.join(provider_dir, filename))
+            else:
+                pdf_path, pdf_sha256 = download_pdf(inspection_link)
 
-               # Extract the local authority and inspection link, and add the data to the list
-                if not found_inspection_link:
+            try:
+                pdf_text, record.document_metrics = get_pdf_text_with_memory(pdf_path, pdf_sha256, text_cache_dir)
+                if pdf_range_fetch:
+                    pdf_size = os.path.getsize(pdf_path)
+                    record.document_metrics.update(bytes_fetched=pdf_size, bytes_total=pdf_size, bytes_saved=0, range_fetched=False)
+            finally:
+                if not save_pdf_reports:
+                    os.remove(pdf_path)
 
-                    # Capture the data that will be exported about the most recent inspection only
-                    local_authority = provider_dir.split('_', 1)[-1].replace('_', ' ').strip()
-                    inspection_link = pdf_link['href']
-                    
-                    # #testing
-                    # print(f"la:{local_authority}")
-                    # print(f"inspectionlink:{inspection_link}")
+        if pdf_range_fetch:
+            logger.debug("Report fetch %s: %s of %s bytes (%s saved)", inspection_link, record.document_metrics['bytes_fetched'],
+                         record.document_metrics['bytes_total'], record.document_metrics['bytes_saved'])
 
-                
+        record.report_sha256 = pdf_sha256
+        record.set_report_fields(extract_send_fields(pdf_text))
 
-                    # Extract the report published date
-                    report_published_date_str = filename.split('-')[-1].strip().split('.')[0] # published date appears after '-' 
-            
-                    # get/format date(s) (as dt objects)
-                    report_published_date = format_date(report_published_date_str, '%d %B %Y', '%d/%m/%y')
-
-
-
-                    # Now get the in-document data
-                    if pdf_data_capture:
-                        # Opt1 : ~x4 slower runtime
-                        # Only here if we have set PDF text scrape flag to True
-                        # Turn this off, speeds up script if we only need the inspection documents themselves to be retrieved
-
-               
-                        # Scrape inside the pdf inspection reports
-                        # inspection_data_dict = extract_inspection_data(pdf_content)
-                        inspection_data_dict = extract_inspection_data_update(pdf_content)
-                    
-
-                        # Dict extract here for readability of returned data/onward
-
-                        # # inspection basics
-                        # overall_effectiveness = inspection_data_dict['overall_inspection_grade']
-                        # inspector_name = inspection_data_dict['inspector_name']
-                        inspection_start_date = inspection_data_dict['inspection_start_date']
-                        inspection_end_date = inspection_data_dict['inspection_end_date']
-                        previous_inspection_date = inspection_data_dict['previous_inspection_date']
-
-
-                        # format dates for output                       
-                        inspection_start_date_formatted = format_date_for_report(inspection_start_date, "%d/%m/%y")
-                        inspection_end_date_formatted = format_date_for_report(inspection_end_date, "%d/%m/%y")
-                        previous_inspection_date_formatted = format_date_for_report(previous_inspection_date, "%d/%m/%Y") # Note YYYY not yy (required for placeholder date)
-
-                        # Format the provider directory as a file path link (in readiness for such as Excel)
-                        provider_dir_link = f"{provider_dir}"
-
-                        
-                        provider_dir_link = provider_dir_link.replace('/', '\\') # fix for Windows systems
-                        
-                        print(f"{local_authority}") # Gives listing console output during run in the format 'data/inspection reports/urn name_of_la'
-
-                        # testing
-                        #print(f"next_inspection: {next_inspection}")
-
-                        # testing
-                        #print(f"Dict: {inspection_data_dict}")
-                        #print(f"inspection_start_date_formatted: {inspection_start_date}")
-                        #print(f"inspection_end_date_formatted: {inspection_end_date}")
-                        #print(f"inspection_start_date_formatted: {inspection_start_date_formatted}")
-                        #print(f"inspection_end_date_formatted: {inspection_end_date_formatted} | next_inspection: {next_inspection}")
-
-                        # problematic end date, means more likely to get success on start date (only 2/3 days difference)
-                        next_inspection_by_date = calculate_next_inspection_by_date(inspection_start_date_formatted, next_inspection)
-
-                        # testing
-                        #print(f"next_inspection_by_date(after processing): {next_inspection_by_date}")
-
-                        data.append({
-                                        'urn': urn,
-                                        'local_authority':          la_name_str,
-                                        'inspection_link':          inspection_link,
-                                        'outcome_grade':            outcome_grade,
-
-                                        'previous_inspection_date': previous_inspection_date_formatted,
-                                        'inspection_start_date':    inspection_start_date_formatted,
-                                        'inspection_end_date':      inspection_end_date_formatted,
-                                        'publication_date':         report_published_date,
-                                        'next_inspection':          next_inspection,
-                                        'next_inspection_by_date':  next_inspection_by_date,
-                                        'local_link_to_all_inspections': provider_dir_link,
-                                        'inspection_outcome_text':  inspection_outcome_section,
-
-                                        # 'inspection_framework':   inspection_framework,
-                                        # 'inspector_name':         inspector_name,
-
-                                        # 'sentiment_score': sentiment_score,
-                                        # 'sentiment_summary': sentiment_summary,
-                                        # 'main_inspection_topics': main_inspection_topics
-
-                                    })
-                        
-                    else:
-                        # Opt2 : ~x4 faster runtime
-                        # Only grab the data/docs we can get direct off the Ofsted page 
-                        data.append({'urn': urn, 'local_authority': local_authority, 'inspection_link': inspection_link})
-
-                    
-                    found_inspection_link = True # Flag to ensure data reporting on only the most recent inspection
-                
+    logger.info("%s", local_authority) # Gives listing console output during run in the format 'data/inspection reports/urn name_of_la'
 
-    return data
+    return record
 
 
-def save_data_update(data, filename, file_type='csv', hyperlink_column = None):
+def extract_send_fields(pdf_text):
     """
-    Exports data to a specified file type.
+    Extracts the summary fields from a report's (cached) text, see get_pdf_text.
+    No pdf|network access, so can be re-run over the whole text cache when parsing changes.
 
     Args:
-        data (DataFrame): The data to be exported.
-        filename (str): The desired name of the output file.
-        file_type (str, optional): The desired file type. Defaults to 'csv'.
-        hyperlink_column (str, optional): The column containing folder names for hyperlinks. Defaults to None.
+        pdf_text (dict): {'pages': [...], 'first_page_text': str}
+
+    Dates and next inspection time frame are tiered: the fast tier (page 1 text, strict patterns)
+    resolves almost all reports, the fallback tier only runs for fields it missed.
 
     Returns:
-        None
+        dict: outcome grade|text, inspection dates, next inspection timeframe|by date, reduced report text,
+              + 'extraction_tiers' {field: 'fast'|'fallback'|None} (None == unresolved).
     """
-    if file_type == 'csv':
-        filename_with_extension = filename + '.csv'
-        data.to_csv(filename_with_extension, index=False)
+    pdf_pages_content_reduced = remove_unwanted_sections(pdf_text['pages'])
 
-    elif file_type == 'excel':
-        filename_with_extension = filename + '.xlsx'
+    # Combine pages back into a single text
+    pdf_content_reduced = "\n".join(pdf_pages_content_reduced)
 
-        # Create a new workbook and add a worksheet
-        workbook = xlsxwriter.Workbook(filename_with_extension)
-        sheet = workbook.add_worksheet('ofsted_cs_send_inspections')  # pass the desired worksheet name here
+    # Extract the "Inspection outcome" section
+    inspection_outcome_section = extract_inspection_outcome_section(pdf_content_reduced)
 
-        hyperlink_col_index = data.columns.get_loc(hyperlink_column) if hyperlink_column else None
+    # Determine the outcome grade
+    outcome_grade = determine_outcome_grade(inspection_outcome_section)
 
-        # Define hyperlink format
-        hyperlink_format = workbook.add_format({'font_color': 'blue', 'underline': 1})
+    # Next inspection time-frame (comnes back as f"{time_frame} {unit}")
+    next_inspection = extract_next_inspection(inspection_outcome_section)
 
-        # Write DataFrame to the worksheet
-        for row_num, (index, row) in enumerate(data.iterrows(), start=1):
-            for col_num, (column, cell_value) in enumerate(row.items()):
-                if hyperlink_col_index is not None and col_num == hyperlink_col_index:
-                    # Add hyperlink using the HYPERLINK formula
-                    link = f".\\{cell_value}"
-                    sheet.write_formula(row_num, col_num, f'=HYPERLINK("{link}", "{cell_value}")', hyperlink_format)
-                else:
-                    sheet.write(row_num, col_num, str(cell_value))
+    # Scrape inside the pdf inspection reports
+    # inspection_data_dict = extract_inspection_data(pdf_content)
+    inspection_data_dict = extract_inspection_data_update(pdf_text['first_page_text'])
 
-        # Write header
-        header_format = workbook.add_format({'bold': True})
-        for col_num, column in enumerate(data.columns):
-            sheet.write(0, col_num, column, header_format)
 
-        # Save the workbook
-        workbook.close()
-    else:
-        print(f"Error: unsupported file type '{file_type}'. Please choose 'csv' or 'excel'.")
-        return
+    # Dict extract here for readability of returned data/onward
 
-    print(f"\n\n{filename_with_extension} successfully created!")
+    # # inspection basics
+    # overall_effectiveness = inspection_data_dict['overall_inspection_grade']
+    # inspector_name = inspection_data_dict['inspector_name']
+    inspection_start_date = inspection_data_dict['inspection_start_date']
+    inspection_end_date = inspection_data_dict['inspection_end_date']
+    previous_inspection_date = inspection_data_dict['previous_inspection_date']
 
+    extraction_tiers = {
+        'inspection_dates':         'fast' if inspection_start_date and inspection_end_date else None,
+        'previous_inspection_date': 'fast' if previous_inspection_date not in (None, "01/01/1900") else None,
+        'next_inspection':          'fast' if next_inspection else None,
+    }
 
+    # Fallback tier, only for the fields the fast tier didn't resolve
+    if None in extraction_tiers.values():
+        fallback_text = fallback_text_from_pages(pdf_text['pages'])
 
-def import_csv_from_folder(folder_name):
-    """
-    Imports a single CSV file from a local folder relative to the root of the script.
+        if not extraction_tiers['inspection_dates']:
+            inspection_dates = search_date_range_fallback(inspection_dates_fallback_pattern, fallback_text)
+            if inspection_dates:
+                inspection_start_date, inspection_end_date = (d.strftime("%d/%m/%y") for d in inspection_dates)
+                extraction_tiers['inspection_dates'] = 'fallback'
 
-    The CSV file must be located in the specified folder. If multiple CSV files are found,
-    a ValueError is raised. If no CSV files are found, a ValueError is raised.
+        if not extraction_tiers['previous_inspection_date']:
+            previous_dates = search_date_range_fallback(previous_inspection_dates_fallback_pattern, fallback_text)
+            if previous_dates:
+                previous_inspection_date = previous_dates[1].strftime("%d/%m/%Y")  # end of the previous inspection
+                extraction_tiers['previous_inspection_date'] = 'fallback'
 
-    Parameters:
-    folder_name (str): The name of the folder containing the CSV file.
+        if not extraction_tiers['next_inspection']:
+            next_inspection = extract_next_inspection_fallback(inspection_outcome_section)
+            if not next_inspection:
+                next_inspection = extract_next_inspection_fallback(fallback_text)
+            if next_inspection:
+                extraction_tiers['next_inspection'] = 'fallback'
 
-    Returns:
-    pandas.DataFrame: A DataFrame containing the data from the CSV file.
-    """
-    file_names = [f for f in os.listdir(folder_name) if f.endswith('.csv')]
-    if len(file_names) == 0:
-        raise ValueError('No CSV file found in the specified folder')
-    elif len(file_names) > 1:
-        raise ValueError('More than one CSV file found in the specified folder')
-    else:
-        file_path = os.path.join(folder_name, file_names[0])
-        df = pd.read_csv(file_path)
-        return df
-    
-    
-def reposition_columns(df, key_col, cols_to_move):
-    """
-    Move one or more columns in a DataFrame to be immediately to the right 
-    of a given key column. 
 
-    Args:
-        df (pandas.DataFrame): The DataFrame to modify.
-        key_col (str): The column that should be to the left of the moved columns.
-        cols_to_move (list of str): The columns to move.
+    # format dates for output                       
+    inspection_start_date_formatted = format_date_for_report(inspection_start_date, "%d/%m/%y")
+    inspection_end_date_formatted = format_date_for_report(inspection_end_date, "%d/%m/%y")
+    previous_inspection_date_formatted = format_date_for_report(previous_inspection_date, "%d/%m/%Y") # Note YYYY not yy (required for placeholder date)
 
-    Returns:
-        pandas.DataFrame: The modified DataFrame.
-    """
-    # Check if the columns exist in the DataFrame
-    for col in [key_col] + cols_to_move:
-        if col not in df.columns:
-            raise ValueError(f"{col} must exist in the DataFrame.")
+    # testing
+    #print(f"next_inspection: {next_inspection}")
 
-    # Get a list of the column names
-    cols = df.columns.tolist()
+    # testing
+    #print(f"Dict: {inspection_data_dict}")
+    #print(f"inspection_start_date_formatted: {inspection_start_date}")
+    #print(f"inspection_end_date_formatted: {inspection_end_date}")
+    #print(f"inspection_start_date_formatted: {inspection_start_date_formatted}")
+    #print(f"inspection_end_date_formatted: {inspection_end_date_formatted} | next_inspection: {next_inspection}")
 
-    # Find the position of the key column
-    key_index = cols.index(key_col)
+    # problematic end date, means more likely to get success on start date (only 2/3 days difference)
+    next_inspection_by_date = calculate_next_inspection_by_date(inspection_start_date_formatted, next_inspection)
 
-    # For each column to move (in reverse order)
-    for col_to_move in reversed(cols_to_move):
-        # Find the current index of the column to move
-        col_index = cols.index(col_to_move)
+    # testing
+    #print(f"next_inspection_by_date(after processing): {next_inspection_by_date}")
 
-        # Remove the column to move from its current position
-        cols.pop(col_index)
+    return {
+                'outcome_grade':            outcome_grade,
 
-        # Insert the column to move at the position immediately after the key column
-        cols.insert(key_index + 1, col_to_move)
+                'previous_inspection_date': previous_inspection_date_formatted,
+                'inspection_start_date':    inspection_start_date_formatted,
+                'inspection_end_date':      inspection_end_date_formatted,
+                'next_inspection':          next_inspection,
+                'next_inspection_by_date':  next_inspection_by_date,
+                'inspection_outcome_text':  inspection_outcome_section,
+                'report_text':              pdf_content_reduced, # store|search index only, not exported
+                'extraction_tiers':         extraction_tiers,
 
-    # Return the DataFrame with reordered columns
-    return df[cols]
+                # 'inspection_framework':   inspection_framework,
+                # 'inspector_name':         inspector_name,
 
+                # 'sentiment_score': sentiment_score,
+                # 'sentiment_summary': sentiment_summary,
+                # 'main_inspection_topics': main_inspection_topics
 
-def merge_and_select_columns(merge_to_df, merge_from_df, key_column, columns_to_add):
-    """
-    Merges two dataframes and returns a merged dataframe with additional columns from
-    the second dataframe, without any duplicate columns. 
+            }
 
-    Parameters:
-    df1 (pandas.DataFrame): The first dataframe to merge.
-    df2 (pandas.DataFrame): The second dataframe to merge.
-    key_column (str): The name of the key column to merge on.
-    columns_to_add (list): A list of column names from df2 to add to df1.
 
-    Returns:
-    pandas.DataFrame: A new dataframe with merged data from df1 and selected columns from df2.
+def publication_listing_record(urn, la_name_str, provider_dir, inspection_type, inspection_link, filename):
     """
-    merged = merge_to_df.merge(merge_from_df[columns_to_add + [key_column]], on=key_column)
-    return merged
-
+    Builds the (page-available only) record for a publication of a non SEND collected inspection type.
+    """
+    try:
+        publication_date = datetime.strptime(filename.split('-')[-1].strip().split('.')[0], '%d %B %Y').date()
+    except ValueError:
+        publication_date = None
+
+    return InspectionRecord(urn=int(urn), local_authority=la_name_str, inspection_link=inspection_link,
+                            publication_date=publication_date, inspection_type=inspection_type,
+                            local_link_to_all_inspections=provider_dir.replace('/', '\\'))
+
+
+def process_provider_links(provider_links, all_publications=False, skip_links=frozenset(), if_modified=False):
+    """
+    Processes provider links and returns a list of InspectionRecords containing URN, local authority, and inspection link.
+
+    Args:
+        provider_links (list):      A list of BeautifulSoup Tag objects representing provider links.
+        all_publications (bool):    False == most recent SEND report per LA only, True == every SEND report (history mode).
+        skip_links (set):           Report links already extracted (e.g. held in the inspection store), not re-downloaded.
+        if_modified (bool):         Only provider pages changed since last fetched are processed (watch mode).
+
+    Returns:
+        list: A list of InspectionRecords containing URN, local authority, inspection link, and, if enabled, additional inspection data.
+              Publications of other collected (non SEND) inspection types are listed (link|date) with their inspection_type.
+    """
+    
+    data = []
+
+    # Provider pages, then report downloads|extraction, fanned out over max_workers threads
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        providers = [
+            (provider_page_url(link), provider)
+            for link, provider in zip(provider_links, executor.map(lambda link: get_provider_publications(link, if_modified=if_modified), provider_links))
+            if provider is not None
+        ]
+
+        jobs = []
+        for page_url, (urn, la_name_str, provider_dir, publications) in providers:
+
+            # Other inspection types collected in this same pass, listing only (no report extraction)
+            for inspection_type, type_publications in publications.items():
+                if inspection_type != send_inspection_type:
+                    data.extend(
+                        publication_listing_record(urn, la_name_str, provider_dir, inspection_type, inspection_link, filename)
+                        for inspection_link, filename in type_publications
+                    )
+
+            send_publications = publications.get(send_inspection_type, [])
+            if not all_publications:
+                # Report on only the most recent inspection
+                send_publications = send_publications[:1]
+
+            for inspection_link, filename in send_publications:
+                if inspection_link in skip_links:
+                    continue # already extracted on a previous run
+                jobs.append((page_url, executor.submit(extract_send_publication, urn, la_name_str, provider_dir, inspection_link, filename)))
+
+        for page_url, job in jobs:
+            try:
+                data.append(job.result())
+            except Exception as e:
+                logger.error(f"Error extracting report: {e}")
+                # provider page seen as changed again next poll, so the failed report is retried
+                discard_page_validators(page_url)
+
+    return data
+
+
+def file_sha256(file_path, chunk_size=64 * 1024):
+    """Returns the sha256 hex digest of a file, read in chunks."""
+    sha256 = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def find_archived_send_reports(archive_dir):
+    """
+    Walks the local reports archive (<archive_dir>/<urn>_<la name>/<report>.pdf) for area SEND reports.
+
+    Returns:
+        list: (urn, la_name_str, provider_dir, pdf_path, filename) tuples, one per archived SEND report.
+    """
+    archived_reports = []
+    for folder in sorted(os.listdir(archive_dir)):
+        provider_dir = os.path.join(archive_dir, folder)
+        urn, _, la_name_str = folder.partition('_')
+        if not (os.path.isdir(provider_dir) and urn.isdigit() and la_name_str):
+            continue
+
+        for filename in sorted(os.listdir(provider_dir)):
+            name = filename.lower()
+            if name.endswith('.pdf') and 'area' in name and 'send' in name and 'full inspection' in name:
+                archived_reports.append((urn, la_name_str, provider_dir, os.path.join(provider_dir, filename), filename))
+
+    return archived_reports
+
+
+def extract_archived_publication(urn, la_name_str, provider_dir, pdf_path, filename):
+    """
+    Builds a report's summary record from the local archive copy, as extract_send_publication does for
+    a downloaded one. The report link is held as the local path (see save_inspections_to_store).
+    """
+    # Extract the report published date
+    report_published_date_str = filename.split('-')[-1].strip().split('.')[0] # published date appears after '-' 
+    report_published_date = datetime.strptime(report_published_date_str, '%d %B %Y').date()
+
+    pdf_sha256 = file_sha256(pdf_path)
+    pdf_text, document_metrics = get_pdf_text_with_memory(pdf_path, pdf_sha256, os.path.join(root_export_folder, cache_subfolder, pdf_text_cache_subfolder))
+
+    record = InspectionRecord(urn=int(urn), local_authority=la_name_str, inspection_link=pdf_path.replace(os.sep, '/'),
+                              publication_date=report_published_date, local_link_to_all_inspections=provider_dir.replace('/', '\\'),
+                              report_sha256=pdf_sha256, document_metrics=document_metrics)
+    record.set_report_fields(extract_send_fields(pdf_text))
+    return record
+
+
+def extract_archived_reports(archived_reports, workers=max_workers):
+    """
+    Runs extraction over archived reports in parallel, no network access.
+
+    PDF parsing is cpu bound and PyMuPDF isn't thread safe, so a (fork) process pool is used where the
+    platform has one. Otherwise threads, with parsing serialised by pdf_parse_lock (cached text is still parallel).
+
+    Returns:
+        list: Records, as extract_archived_publication.
+    """
+    if workers <= 1:
+        # in-process, e.g. so track_stage_memory sees the parsing
+        executor = ThreadPoolExecutor(max_workers=1)
+    elif 'fork' in multiprocessing.get_all_start_methods():
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork'))
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    data = []
+    with executor:
+        jobs = [executor.submit(extract_archived_publication, *report) for report in archived_reports]
+        for report, job in zip(archived_reports, jobs):
+            try:
+                data.append(job.result())
+            except Exception as e:
+                logger.error(f"Error extracting archived report {report[3]}: {e}")
+
+    return data
+
+
+
+# Published outputs are only rewritten when their data changed. Each carries a hash of its data content
+# (volatile timestamps excluded) to compare the next run's against, and what was written is collected here
+# so the run can signal (GITHUB_OUTPUT publish=true|false) whether there's anything to commit|deploy.
+published_outputs = []
+
+output_data_hash_pattern = re.compile(r'(?:<meta name="data-hash" content=|"data_hash":\s*)"([0-9a-f]{64})"')
+
+
+def output_data_hash(*parts):
+    """sha256 of an output's data content (str|bytes parts)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8') if isinstance(part, str) else part)
+    return digest.hexdigest()
+
+
+def read_output_data_hash(path):
+    """
+    Returns the data hash held by a previous output, or None if there isn't one.
+    xlsx: 'data_hash' custom document property, html|json: data-hash meta tag|data_hash key,
+    csv (no timestamps to exclude): hash of the file content itself.
+    """
+    if not os.path.exists(path):
+        return None
+
+    if path.endswith('.xlsx'):
+        try:
+            with zipfile.ZipFile(path) as xlsx_zip:
+                text = xlsx_zip.read('docProps/custom.xml').decode('utf-8')
+        except (KeyError, zipfile.BadZipFile):
+            return None
+        match = re.search(r'name="data_hash".*?<vt:lpwstr>([0-9a-f]{64})</vt:lpwstr>', text, re.DOTALL)
+        return match.group(1) if match else None
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    if path.endswith('.csv'):
+        return output_data_hash(content)
+    match = output_data_hash_pattern.search(content.decode('utf-8', errors='ignore'))
+    return match.group(1) if match else None
+
+
+def write_output_if_changed(path, data_hash, render):
+    """
+    Writes render()'s content (str|bytes) to path only if data_hash differs from the previous output's.
+
+    Returns:
+        bool: True if written (and added to published_outputs).
+    """
+    if read_output_data_hash(path) == data_hash:
+        logger.info(f"{path} unchanged, not rewritten")
+        return False
+
+    content = render()
+    output_dir = os.path.dirname(path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix='.part', dir=output_dir or '.')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(content.encode('utf-8') if isinstance(content, str) else content)
+    os.replace(temp_path, path)
+
+    published_outputs.append(path)
+    return True
+
+
+
+def save_data_update(data, filename, file_type='csv', hyperlink_column = None):
+    """
+    Exports data to a specified file type.
+
+    Args:
+        data (DataFrame): The data to be exported.
+        filename (str): The desired name of the output file.
+        file_type (str, optional): The desired file type. Defaults to 'csv'.
+        hyperlink_column (str, optional): The column containing folder names for hyperlinks. Defaults to None.
+
+    Returns:
+        None
+
+    Note:
+        Only (re)written if the data changed since the previous export, see write_output_if_changed.
+    """
+    if file_type == 'csv':
+        filename_with_extension = filename + '.csv'
+        csv_content = data.to_csv(index=False)
+        written = write_output_if_changed(filename_with_extension, output_data_hash(csv_content), lambda: csv_content)
+
+    elif file_type == 'excel':
+        filename_with_extension = filename + '.xlsx'
+        data_hash = output_data_hash(data.to_csv(index=False), str(hyperlink_column))
+        written = write_output_if_changed(
+            filename_with_extension, data_hash,
+            lambda: render_excel_workbook(data, data_hash, hyperlink_column=hyperlink_column)
+        )
+    else:
+        logger.error(f"Error: unsupported file type '{file_type}'. Please choose 'csv' or 'excel'.")
+        return
+
+    if written:
+        logger.info(f"{filename_with_extension} successfully created!")
+
+
+def render_excel_workbook(data, data_hash, hyperlink_column=None):
+    """Renders the summary xlsx in memory (bytes), data_hash held as a custom document property."""
+    output = io.BytesIO()
+    # Create a new workbook and add a worksheet
+    workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+    workbook.set_custom_property('data_hash', data_hash)
+    sheet = workbook.add_worksheet('ofsted_cs_send_inspections')  # pass the desired worksheet name here
+
+    hyperlink_col_index = data.columns.get_loc(hyperlink_column) if hyperlink_column else None
+
+    # Define hyperlink format
+    hyperlink_format = workbook.add_format({'font_color': 'blue', 'underline': 1})
+
+    # Write DataFrame to the worksheet
+    for row_num, (index, row) in enumerate(data.iterrows(), start=1):
+        for col_num, (column, cell_value) in enumerate(row.items()):
+            if hyperlink_col_index is not None and col_num == hyperlink_col_index:
+                # Add hyperlink using the HYPERLINK formula
+                link = f".\\{cell_value}"
+                sheet.write_formula(row_num, col_num, f'=HYPERLINK("{link}", "{cell_value}")', hyperlink_format)
+            else:
+                sheet.write(row_num, col_num, str(cell_value))
+
+    # Write header
+    header_format = workbook.add_format({'bold': True})
+    for col_num, column in enumerate(data.columns):
+        sheet.write(0, col_num, column, header_format)
+
+    # Save the workbook
+    workbook.close()
+
+    return output.getvalue()
+
+
+
+def find_single_csv(folder_name):
+    """
+    Returns the path of the single CSV file within a local folder relative to the root of the script.
+
+    The CSV file must be located in the specified folder. If multiple CSV files are found,
+    a ValueError is raised. If no CSV files are found, a ValueError is raised.
+    """
+    file_names = [f for f in os.listdir(folder_name) if f.endswith('.csv')]
+    if len(file_names) == 0:
+        raise ValueError('No CSV file found in the specified folder')
+    elif len(file_names) > 1:
+        raise ValueError('More than one CSV file found in the specified folder')
+    return os.path.join(folder_name, file_names[0])
+
+
+def import_csv_from_folder(folder_name):
+    """
+    Imports a single CSV file from a local folder relative to the root of the script.
+
+    Parameters:
+    folder_name (str): The name of the folder containing the CSV file.
+
+    Returns:
+    pandas.DataFrame: A DataFrame containing the data from the CSV file.
+    """
+    return pd.read_csv(find_single_csv(folder_name))
+
+
+# LA lookup column types (anything not listed is kept as str), empty values become None
+la_lookup_column_types = {
+    'urn':                          int,
+    'ons_population_0-25':          float,
+}
+
+
+def parse_la_lookup_csv(file_path):
+    """
+    Parses the LA lookup CSV into a URN-keyed index of typed row dicts.
+    Rows without a usable URN are skipped.
+    """
+    lookup_index = {}
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            typed_row = {}
+            for col, value in row.items():
+                value = value.strip() if value is not None else ''
+                if value == '':
+                    typed_row[col] = None
+                    continue
+                try:
+                    typed_row[col] = la_lookup_column_types.get(col, str)(value)
+                except ValueError:
+                    typed_row[col] = None
+            if typed_row.get('urn') is not None:
+                lookup_index[typed_row['urn']] = typed_row
+    return lookup_index
+
+
+def load_la_lookup_index(folder_name, cache_dir):
+    """
+    Returns the URN-keyed LA lookup index, parsed once and cached (pickle) between runs.
+
+    The cache is reused while the source CSV's mtime|size are unchanged, and re-validated against the
+    file's sha256 if they have (e.g. a fresh git checkout touches mtimes without changing content).
+
+    Args:
+        folder_name (str): Folder holding the (single) lookup CSV.
+        cache_dir (str): Folder for the cached index.
+
+    Returns:
+        dict: {urn (int): {column: typed value}}
+    """
+    file_path = find_single_csv(folder_name)
+    file_stat = os.stat(file_path)
+    cache_path = os.path.join(cache_dir, 'la_lookup_index.pickle')
+
+    cached = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cached = None
+
+    if cached and cached['source'] == file_path and (cached['mtime'], cached['size']) == (file_stat.st_mtime, file_stat.st_size):
+        return cached['index']
+
+    with open(file_path, 'rb') as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()
+
+    if cached and cached['source'] == file_path and cached['sha256'] == source_hash:
+        lookup_index = cached['index']
+    else:
+        lookup_index = parse_la_lookup_csv(file_path)
+        logger.info(f"LA lookup index rebuilt from {file_path} ({len(lookup_index)} LAs)")
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'source': file_path, 'mtime': file_stat.st_mtime, 'size': file_stat.st_size,
+                     'sha256': source_hash, 'index': lookup_index}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    return lookup_index
+
+
+la_name_index_cols = ('local_authority_ons_name', 'also_known_as', 'ltla23nm')
+
+
+def build_la_name_index(lookup_index, name_cols=la_name_index_cols):
+    """
+    Name-keyed index onto the URN-keyed LA lookup, for providers whose URN isn't in the lookup (e.g. a new
+    URN after an LA reorganisation). Keyed on la_name_key of each LA's ONS name, also known as names
+    (a '[name, name]' list) and LTLA name. Names shared by more than one LA (e.g. 'cumbria') are left out.
+
+    Returns:
+        dict: {name key: urn}
+    """
+    name_index, shared_names = {}, set()
+    for urn, row in lookup_index.items():
+        for col in name_cols:
+            value = row.get(col)
+            if not value:
+                continue
+            names = value.strip('[]').split(',') if col == 'also_known_as' else [value]
+            for name in names:
+                key = la_name_key(name)
+                if not key:
+                    continue
+                if name_index.setdefault(key, urn) != urn:
+                    shared_names.add(key)
+    for key in shared_names:
+        del name_index[key]
+    return name_index
+
+
+def enrich_record(record, lookup_index, columns, name_index=None):
+    """
+    Adds the requested LA lookup columns to a single scraped record (in place), keyed on urn, or where the
+    URN isn't in the lookup on the LA name (name_index, see build_la_name_index).
+    Unmatched records are kept, with the lookup columns set to None.
+
+    Returns:
+        str: How the record was matched to the lookup, 'urn'|'name', or None if not found.
+    """
+    lookup_row = lookup_index.get(record.urn)
+    matched_on = 'urn' if lookup_row else None
+    if lookup_row is None and name_index:
+        lookup_row = lookup_index.get(name_index.get(la_name_key(record.local_authority)))
+        matched_on = 'name' if lookup_row else None
+
+    for col in columns:
+        setattr(record, col, lookup_row.get(col) if lookup_row else None)
+    return matched_on
+
+
+
+
+#
+# Inspection store (SQLite)
+# Persists providers, publications and extracted inspection records between runs so that
+# exports (and ad-hoc questions) are answered by query rather than by re-scraping Ofsted.
+# Dates are held as ISO yyyy-mm-dd text so that sqlite date() comparisons|ordering work.
+
+send_inspection_type = 'area send full inspection'
+provider_lookup_cols = ('la_code', 'region_code', 'ltla23cd', 'stat_neighbours')  # LA lookup data held against each provider
+
+
+@dataclass(slots=True)
+class InspectionRecord:
+    """
+    A scraped (or archived) publication as saved to the store, values parsed: int urn|grade, dates as date
+    (None for missing|the 01/01/1900 placeholder). Report fields only set where the report was extracted.
+    """
+    urn: int
+    local_authority: str
+    inspection_link: str
+    publication_date: date | None
+    local_link_to_all_inspections: str | None = None
+    inspection_type: str = send_inspection_type
+    report_sha256: str | None = None
+    range_fetched: bool = False             # pdf_range_fetch, opening pages only (report_sha256 is the first page section's)
+
+    # extracted report fields (see extract_send_fields)
+    extracted: bool = False
+    outcome_grade: int | None = None
+    previous_inspection_date: date | None = None
+    inspection_start_date: date | None = None
+    inspection_end_date: date | None = None
+    next_inspection: str | None = None
+    next_inspection_by_date: date | None = None
+    inspection_outcome_text: str | None = None
+    report_text: str | None = None          # store|search index only, not exported
+    extraction_tiers: dict | None = None
+    document_metrics: dict | None = None    # track_stage_memory|pdf_range_fetch only
+
+    # LA lookup (enrich_record), as provider_lookup_cols
+    la_code: int | str | None = None
+    region_code: str | None = None
+    ltla23cd: str | None = None
+    stat_neighbours: str | None = None
+
+    def set_report_fields(self, fields):
+        """Sets the extracted report fields from extract_send_fields' (report formatted) output."""
+        self.extracted = True
+        self.outcome_grade = fields['outcome_grade']
+        self.previous_inspection_date = to_date(fields['previous_inspection_date'])
+        self.inspection_start_date = to_date(fields['inspection_start_date'])
+        self.inspection_end_date = to_date(fields['inspection_end_date'])
+        self.next_inspection = fields['next_inspection']
+        self.next_inspection_by_date = to_date(fields['next_inspection_by_date'])
+        self.inspection_outcome_text = fields['inspection_outcome_text']
+        self.report_text = fields['report_text']
+        self.extraction_tiers = fields['extraction_tiers']
+
+inspection_store_schema = """
+CREATE TABLE IF NOT EXISTS providers (
+    urn                     INTEGER PRIMARY KEY,
+    local_authority         TEXT,
+    la_code                 TEXT,
+    region_code             TEXT,
+    ltla23cd                TEXT,
+    stat_neighbours         TEXT,
+    provider_dir            TEXT
+);
+
+CREATE TABLE IF NOT EXISTS publications (
+    publication_link        TEXT PRIMARY KEY,
+    urn                     INTEGER NOT NULL,
+    inspection_type         TEXT NOT NULL,
+    publication_date        TEXT,
+    first_seen_date         TEXT
+);
+
+CREATE TABLE IF NOT EXISTS inspections (
+    publication_link        TEXT PRIMARY KEY REFERENCES publications(publication_link),
+    urn                     INTEGER NOT NULL,
+    outcome_grade           INTEGER,
+    previous_inspection_date TEXT,
+    inspection_start_date   TEXT,
+    inspection_end_date     TEXT,
+    next_inspection         TEXT,
+    next_inspection_by_date TEXT,
+    inspection_outcome_text TEXT,
+    extracted_date          TEXT,
+    report_sha256           TEXT,
+    range_fetched_sha256    TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_providers_region_code ON providers(region_code);
+CREATE INDEX IF NOT EXISTS idx_providers_ltla23cd ON providers(ltla23cd);
+CREATE INDEX IF NOT EXISTS idx_publications_urn ON publications(urn, inspection_type, publication_date);
+CREATE INDEX IF NOT EXISTS idx_publications_publication_date ON publications(publication_date);
+CREATE INDEX IF NOT EXISTS idx_inspections_urn ON inspections(urn);
+CREATE INDEX IF NOT EXISTS idx_inspections_next_inspection_by_date ON inspections(next_inspection_by_date);
+
+-- most recent area SEND publication per LA (what the summary exports report on), one row per urn:
+-- undated publications last, same date tie broken on link (an Ofsted url ranks above its local archive copy)
+DROP VIEW IF EXISTS latest_send_inspections;
+CREATE VIEW latest_send_inspections AS
+SELECT urn, publication_link, publication_date,
+       outcome_grade, previous_inspection_date, inspection_start_date, inspection_end_date,
+       next_inspection, next_inspection_by_date, inspection_outcome_text
+FROM (
+    SELECT pub.urn, pub.publication_link, pub.publication_date,
+           i.outcome_grade, i.previous_inspection_date, i.inspection_start_date, i.inspection_end_date,
+           i.next_inspection, i.next_inspection_by_date, i.inspection_outcome_text,
+           ROW_NUMBER() OVER (
+               PARTITION BY pub.urn
+               ORDER BY pub.publication_date IS NULL, pub.publication_date DESC, pub.publication_link DESC
+           ) AS publication_rank
+    FROM publications pub
+    LEFT JOIN inspections i ON i.publication_link = pub.publication_link
+    WHERE pub.inspection_type = 'area send full inspection'
+)
+WHERE publication_rank = 1;
+
+-- sentiment|theme scores, keyed on the report pdf's sha256 so each report is only scored once
+CREATE TABLE IF NOT EXISTS inspection_text_scores (
+    report_sha256           TEXT PRIMARY KEY,
+    sentiment_score         REAL,
+    sentiment_summary       TEXT,
+    main_inspection_topics  TEXT,
+    scores_version          INTEGER
+);
+"""
+
+# (table, column, type) added to the schema after first release, applied to existing stores on open
+inspection_store_added_columns = [
+    ('inspections', 'report_sha256', 'TEXT'),
+    ('inspections', 'range_fetched_sha256', 'TEXT'),
+]
+
+# Search with e.g. admin/search_inspection_reports.py "joint commissioning"
+inspection_text_search_schema = """
+CREATE VIRTUAL TABLE IF NOT EXISTS inspection_text_fts USING fts5(
+    publication_link UNINDEXED,
+    outcome_text,
+    report_text,
+    tokenize = 'porter unicode61'
+);
+
+-- publication link -> FTS rowid, so a report's index entry is replaced|removed by rowid
+-- (publication_link is UNINDEXED in the FTS table, filtering on it scans every row)
+CREATE TABLE IF NOT EXISTS inspection_text_fts_rows (
+    fts_rowid               INTEGER PRIMARY KEY,
+    publication_link        TEXT NOT NULL UNIQUE
+);
+"""
+
+
+def open_inspection_store(db_path):
+    """
+    Opens (creating if needed) the sqlite inspection store and ensures the schema|indexes exist.
+
+    Args:
+        db_path (str): Path to the sqlite database file.
+
+    Returns:
+        sqlite3.Connection: Open connection to the store.
+    """
+    db_dir = os.path.dirname(db_path)
+    if db_dir and not os.path.exists(db_dir):
+        os.makedirs(db_dir)
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(inspection_store_schema)
+
+    # Columns added since a store was first created
+    for table, column, column_type in inspection_store_added_columns:
+        existing_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing_columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    # Full-text index over outcome|report text (needs sqlite built with FTS5, as per std python builds)
+    try:
+        conn.executescript(inspection_text_search_schema)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search index not available ({e}), continuing without it")
+    else:
+        # stores indexed before the rowid map, mapped once
+        if conn.execute("SELECT 1 FROM inspection_text_fts_rows LIMIT 1").fetchone() is None:
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO inspection_text_fts_rows (fts_rowid, publication_link) "
+                    "SELECT rowid, publication_link FROM inspection_text_fts"
+                )
+
+    return conn
+
+
+def has_text_search_index(conn):
+    """Returns True if the store holds the FTS5 inspection text index."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'inspection_text_fts'"
+    ).fetchone() is not None
+
+
+def index_inspection_text(conn, publication_link, outcome_text, report_text):
+    """
+    (Re)indexes the outcome section and full report text of a single publication.
+    Called as each report is saved, so the index grows incrementally run on run.
+    """
+    fts_rowid = unindex_inspection_text(conn, publication_link)
+    if fts_rowid is None:
+        fts_rowid = conn.execute(
+            "INSERT INTO inspection_text_fts_rows (publication_link) VALUES (?)", (publication_link,)
+        ).lastrowid
+    conn.execute(
+        "INSERT INTO inspection_text_fts (rowid, publication_link, outcome_text, report_text) VALUES (?, ?, ?, ?)",
+        (fts_rowid, publication_link, outcome_text or "", report_text or "")
+    )
+
+
+def unindex_inspection_text(conn, publication_link):
+    """Removes a publication's search index entry (by rowid). Returns its FTS rowid, None if it wasn't indexed."""
+    row = conn.execute(
+        "SELECT fts_rowid FROM inspection_text_fts_rows WHERE publication_link = ?", (publication_link,)
+    ).fetchone()
+    if row is None:
+        return None
+    conn.execute("DELETE FROM inspection_text_fts WHERE rowid = ?", row)
+    return row[0]
+
+
+def to_date(date_str):
+    """
+    Parses a report date string (any of the formats parse_inspection_date accepts) into a date.
+    Returns None for empty|unparseable values and for the 01/01/1900 no-data placeholder.
+    """
+    if not date_str:
+        return None
+    try:
+        date_obj = parse_inspection_date(date_str)
+    except (TypeError, ValueError):
+        return None
+    if date_obj.year == 1900:
+        return None
+    return date_obj.date() if isinstance(date_obj, datetime) else date_obj
+
+
+def to_iso_date(date_value):
+    """ISO yyyy-mm-dd of a date, or of a report date string (see to_date). None where there's no date."""
+    if not isinstance(date_value, date):
+        date_value = to_date(date_value)
+    return date_value.strftime("%Y-%m-%d") if date_value else None
+
+
+def update_providers_from_lookup(conn, lookup_index, lookup_cols=provider_lookup_cols):
+    """
+    Refreshes the LA lookup columns of providers already held in the store (e.g. after a lookup CSV change,
+    for LAs whose reports were reused rather than re-extracted this run).
+    """
+    lookup_cols = list(lookup_cols)
+    set_clause = ", ".join(f"{col} = ?" for col in lookup_cols)
+    with conn:
+        conn.executemany(
+            f"UPDATE providers SET {set_clause} WHERE urn = ?",
+            [
+                tuple(None if row.get(col) is None else str(row[col]) for col in lookup_cols) + (urn,)
+                for urn, row in lookup_index.items()
+            ]
+        )
+
+
+def save_inspections_to_store(conn, data):
+    """
+    Upserts scraped provider|publication|inspection records (as built by process_provider_links) into the store.
+
+    Args:
+        conn (sqlite3.Connection): Open store connection.
+        data (list): InspectionRecords from process_provider_links (or extract_archived_reports).
+
+    Returns:
+        list: Publication links that were not previously held in the store (i.e. new this run).
+    """
+    today_iso = datetime.now().strftime("%Y-%m-%d")
+    known_links = {row[0] for row in conn.execute("SELECT publication_link FROM publications")}
+    text_search = has_text_search_index(conn)
+    new_links = []
+
+    with conn:
+        for record in data:
+            urn = record.urn
+            link = record.inspection_link
+            record_type = record.inspection_type
+            publication_date = to_iso_date(record.publication_date)
+
+            if not link.startswith('http'):
+                # offline (local archive) record, keep the Ofsted link if the store already holds this report
+                known_web_link = conn.execute(
+                    "SELECT publication_link FROM publications WHERE urn = ? AND inspection_type = ? "
+                    "AND publication_date = ? AND publication_link LIKE 'http%'",
+                    (urn, record_type, publication_date)
+                ).fetchone()
+                if known_web_link:
+                    link = known_web_link[0]
+
+            conn.execute(
+                "INSERT INTO providers (urn, local_authority, provider_dir, la_code, region_code, ltla23cd, stat_neighbours) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(urn) DO UPDATE SET local_authority = excluded.local_authority, provider_dir = excluded.provider_dir, "
+                + ", ".join(f"{col} = COALESCE(excluded.{col}, providers.{col})" for col in provider_lookup_cols),
+                (urn, record.local_authority, record.local_link_to_all_inspections)
+                + tuple(None if getattr(record, col) is None else str(getattr(record, col)) for col in provider_lookup_cols)
+            )
+            conn.execute(
+                "INSERT INTO publications (publication_link, urn, inspection_type, publication_date, first_seen_date) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(publication_link) DO UPDATE SET publication_date = excluded.publication_date",
+                (link, urn, record_type, publication_date, today_iso)
+            )
+            if link not in known_links:
+                new_links.append(link)
+
+            if link.startswith('http'):
+                # supersede any offline (local archive path) entry for the same report
+                local_links = [row[0] for row in conn.execute(
+                    "SELECT publication_link FROM publications WHERE urn = ? AND inspection_type = ? "
+                    "AND publication_date = ? AND publication_link NOT LIKE 'http%'",
+                    (urn, record_type, publication_date)
+                )]
+                for local_link in local_links:
+                    delete_publication_from_store(conn, local_link, text_search)
+
+            if not record.extracted:
+                continue  # listing only (pdf_data_capture off, or non SEND type), nothing extracted from the report itself
+
+            # range fetched reports hold the opening pages' text only, their (first page section) hash is kept apart
+            # from report_sha256, so they're neither scored nor full-text indexed (see pdf_range_fetch)
+            conn.execute(
+                "INSERT OR REPLACE INTO inspections (publication_link, urn, outcome_grade, previous_inspection_date, "
+                "inspection_start_date, inspection_end_date, next_inspection, next_inspection_by_date, "
+                "inspection_outcome_text, extracted_date, report_sha256, range_fetched_sha256) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    link, urn, record.outcome_grade,
+                    to_iso_date(record.previous_inspection_date),
+                    to_iso_date(record.inspection_start_date),
+                    to_iso_date(record.inspection_end_date),
+                    record.next_inspection,
+                    to_iso_date(record.next_inspection_by_date),
+                    record.inspection_outcome_text,
+                    today_iso,
+                    None if record.range_fetched else record.report_sha256,
+                    record.report_sha256 if record.range_fetched else None
+                )
+            )
+
+            if text_search and record.range_fetched:
+                unindex_inspection_text(conn, link)
+            elif text_search:
+                index_inspection_text(conn, link, record.inspection_outcome_text, record.report_text)
+
+    return new_links
+
+
+def delete_publication_from_store(conn, publication_link, text_search=False):
+    """Removes a publication and its extracted inspection record (+ search index entry) from the store."""
+    conn.execute("DELETE FROM inspections WHERE publication_link = ?", (publication_link,))
+    conn.execute("DELETE FROM publications WHERE publication_link = ?", (publication_link,))
+    if text_search:
+        unindex_inspection_text(conn, publication_link)
+        conn.execute("DELETE FROM inspection_text_fts_rows WHERE publication_link = ?", (publication_link,))
+
+
+# Typed columns of the frames built from the store (summary|history), + datetime64 inspection_date_cols
+inspection_frame_dtypes = {
+    'urn':              'Int64',
+    'outcome_grade':    'Int64',
+    'la_code':          'category',
+    'region_code':      'category',
+}
+inspection_date_cols = ['publication_date', 'inspection_start_date', 'inspection_end_date',
+                        'previous_inspection_date', 'next_inspection_by_date']
+
+
+def apply_inspection_dtypes(df):
+    """Sets inspection_frame_dtypes and datetime64 dates (from the store's ISO text) on the columns df has, in place."""
+    for col in inspection_date_cols:
+        if col in df:
+            df[col] = pd.to_datetime(df[col], format="%Y-%m-%d")
+    for col, dtype in inspection_frame_dtypes.items():
+        if col in df:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def load_send_summary_from_store(conn):
+    """
+    Builds the summary (most recent SEND inspection per LA) DataFrame from the store, in the original scrape
+    output's column order. Columns are typed (see apply_inspection_dtypes), format_summary_for_export
+    gives the report date formats for the published outputs.
+    One row per la_code, where more than one URN holds the same LA codes (a new URN matched on LA name, see
+    enrich_record) the latest publication wins. Providers without LA codes are kept, one row per urn.
+    """
+    summary_df = pd.read_sql_query(
+        """
+        SELECT urn, la_code, region_code, ltla23cd, stat_neighbours, local_authority,
+               inspection_link, outcome_grade,
+               previous_inspection_date, inspection_start_date, inspection_end_date,
+               publication_date, next_inspection, next_inspection_by_date,
+               local_link_to_all_inspections, inspection_outcome_text,
+               sentiment_score, sentiment_summary, main_inspection_topics
+        FROM (
+            SELECT p.urn, p.la_code, p.region_code, p.ltla23cd, p.stat_neighbours, p.local_authority,
+                   l.publication_link AS inspection_link, l.outcome_grade,
+                   l.previous_inspection_date, l.inspection_start_date, l.inspection_end_date,
+                   l.publication_date, l.next_inspection, l.next_inspection_by_date,
+                   p.provider_dir AS local_link_to_all_inspections, l.inspection_outcome_text,
+                   s.sentiment_score, s.sentiment_summary, s.main_inspection_topics,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY COALESCE(p.la_code, 'urn ' || p.urn)
+                       ORDER BY l.publication_date IS NULL, l.publication_date DESC, l.publication_link DESC
+                   ) AS la_rank
+            FROM latest_send_inspections l
+            JOIN providers p ON p.urn = l.urn
+            LEFT JOIN inspections i ON i.publication_link = l.publication_link
+            LEFT JOIN inspection_text_scores s ON s.report_sha256 = i.report_sha256
+        )
+        WHERE la_rank = 1
+        ORDER BY local_authority
+        """,
+        conn
+    )
+    return apply_inspection_dtypes(summary_df)
+
+
+def format_summary_for_export(summary_df):
+    """
+    Copy of the (typed) summary with the report date formats and plain text codes of the published outputs.
+    """
+    export_df = summary_df.copy()
+
+    # Back to report date formats (Note previous date is YYYY + placeholder, as per extract_dates_from_text)
+    date_formats = {
+        'previous_inspection_date': "%d/%m/%Y",
+        'inspection_start_date':    "%d/%m/%y",
+        'inspection_end_date':      "%d/%m/%y",
+        'publication_date':         "%d/%m/%y",
+        'next_inspection_by_date':  "%d/%m/%y",
+    }
+    for col, output_format in date_formats.items():
+        export_df[col] = export_df[col].dt.strftime(output_format).fillna("")
+    export_df['previous_inspection_date'] = export_df['previous_inspection_date'].replace("", "01/01/1900")
 
+    for col in ('la_code', 'region_code'):
+        export_df[col] = export_df[col].astype(object)
 
+    return export_df
 
-def save_to_html(data, column_order, local_link_column=None, web_link_column=None):
+
+def load_publications_from_store(conn, inspection_type):
+    """
+    Lists every stored publication of an inspection type (e.g. those collected for sibling tools), most recent first per LA.
+    """
+    return pd.read_sql_query(
+        """
+        SELECT pub.urn, p.local_authority, p.la_code, p.region_code, pub.inspection_type,
+               pub.publication_date, pub.publication_link
+        FROM publications pub
+        LEFT JOIN providers p ON p.urn = pub.urn
+        WHERE pub.inspection_type = ?
+        ORDER BY p.local_authority, pub.publication_date DESC
+        """,
+        conn,
+        params=(inspection_type,)
+    )
+
+
+def load_send_history_from_store(conn):
+    """
+    Builds the long-format history table (one row per SEND publication per LA) from the store.
+
+    Returns:
+        pandas.DataFrame: Typed columns (see apply_inspection_dtypes), Int64 urn|grade, categorical codes and datetime64 dates.
+    """
+    history_df = pd.read_sql_query(
+        """
+        SELECT pub.urn, p.local_authority, p.la_code, p.region_code, p.ltla23cd,
+               pub.publication_link, pub.publication_date,
+               i.inspection_start_date, i.inspection_end_date, i.previous_inspection_date,
+               i.outcome_grade, i.next_inspection, i.next_inspection_by_date
+        FROM publications pub
+        LEFT JOIN inspections i ON i.publication_link = pub.publication_link
+        LEFT JOIN providers p ON p.urn = pub.urn
+        WHERE pub.inspection_type = ?
+        ORDER BY pub.urn, pub.publication_date
+        """,
+        conn,
+        params=(send_inspection_type,)
+    )
+
+    apply_inspection_dtypes(history_df)
+    text_cols = ['local_authority', 'ltla23cd', 'publication_link', 'next_inspection']
+    history_df[text_cols] = history_df[text_cols].astype('string')
+
+    return history_df
+
+
+
+
+#
+# Sentiment|theme scoring (revived from the ILACS tool's sentiment_score|sentiment_summary|main_inspection_topics)
+# Lexicon scoring of the report text, all new reports scored in one batch as a reports x terms count matrix.
+# Scores are held in the store against the report hash, so each week only newly published reports are scored.
+
+text_scores_version = 1  # bump if the lexicons|scoring change, all reports are then re-scored
+outcome_only_scores_version = 0  # scores_version of scores from the outcome section alone (report text not indexed), redone each run
+
+# term stems (token prefix match) -> sentiment weight
+sentiment_lexicon = {
+    'positive': 1, 'effective': 1, 'strong': 1, 'timely': 1, 'improved': 1, 'good': 1, 'robust': 1,
+    'ambitio': 1, 'success': 1, 'thriv': 1, 'collaborat': 1, 'prompt': 1, 'well-established': 1,
+    'high-quality': 1, 'swift': 1, 'valued': 1,
+    'concern': -1, 'failing': -1, 'delay': -1, 'inconsistent': -1, 'poor': -1, 'lack': -1,
+    'weak': -1, 'wait': -1, 'unmet': -1, 'gap': -1, 'variab': -1, 'fragment': -1, 'frustrat': -1,
+    'insufficient': -1, 'ineffective': -1, 'unclear': -1, 'declin': -1, 'worr': -1,
+}
+sentiment_summary_threshold = 0.2  # |score| above which a report is summarised positive|negative (else mixed)
+
+# inspection themes -> term stems
+inspection_themes = {
+    'ehc plans':                ['ehc', 'ehcp', 'annual'],
+    'waiting times':            ['wait', 'delay'],
+    'mental health':            ['mental', 'camhs', 'wellbeing'],
+    'preparing for adulthood':  ['adulthood', 'transition', 'post-16', 'employment'],
+    'alternative provision':    ['alternative'],
+    'co-production':            ['co-produc', 'coproduc', 'forum'],
+    'joint commissioning':      ['jointly', 'commissioner'],
+    'speech and language':      ['speech', 'therap'],
+    'neurodevelopmental':       ['autism', 'autistic', 'adhd', 'neurodevelop'],
+    'attendance|exclusion':     ['exclu', 'attendance', 'suspension'],
+    'early identification':     ['identif', 'diagnos'],
+}
+main_topics_count = 3  # themes listed per report
+
+text_score_token_pattern = re.compile(r"[a-z][a-z0-9'-]*")
+
+
+def score_inspection_texts(texts):
+    """
+    Lexicon scores a batch of report texts in one pass (no per-report scoring loop).
+
+    All texts are tokenised into a single (factorised) token array, only the vocabulary words matching a
+    lexicon stem kept, then token counts per report built with one bincount (reports x matched words) and
+    mapped onto the stems with a matched words x stems match matrix.
+
+    Args:
+        texts (list): Report texts.
+
+    Returns:
+        list: Per text {'sentiment_score' (-1 negative .. 1 positive), 'sentiment_summary', 'main_inspection_topics'}.
+    """
+    if not texts:
+        return []
+
+    stems = list(sentiment_lexicon) + sorted({stem for theme_stems in inspection_themes.values() for stem in theme_stems} - set(sentiment_lexicon))
+    sentiment_weights = np.array([sentiment_lexicon.get(stem, 0) for stem in stems])
+    theme_names = list(inspection_themes)
+    theme_matrix = np.array([[stem in inspection_themes[theme] for theme in theme_names] for stem in stems], dtype=float)
+
+    # one token array across all texts, with the index of the text each token came from
+    # (factorised, as a fixed width numpy str array of every token would be sized by the longest word)
+    text_tokens = [text_score_token_pattern.findall((text or '').lower()) for text in texts]
+    token_counts = np.array([len(tokens) for tokens in text_tokens])
+    token_ids, vocabulary = pd.factorize(pd.Series([token for tokens in text_tokens for token in tokens], dtype=object))
+    text_index = np.repeat(np.arange(len(texts)), token_counts)
+
+    # vocabulary x stems, True where the word starts with the stem, cut down to the words matching any stem
+    vocabulary = np.asarray(vocabulary, dtype=str) if len(vocabulary) else np.array([''])
+    stem_match = np.stack([np.char.startswith(vocabulary, stem) for stem in stems], axis=1)
+    matched_words = np.flatnonzero(stem_match.any(axis=1))
+    matched_id = np.full(len(vocabulary), -1, dtype=np.int64)
+    matched_id[matched_words] = np.arange(len(matched_words))
+
+    token_matched_ids = matched_id[token_ids]
+    is_matched = token_matched_ids >= 0
+    counts = np.bincount(
+        text_index[is_matched] * len(matched_words) + token_matched_ids[is_matched],
+        minlength=len(texts) * len(matched_words)
+    )
+    stem_counts = counts.reshape(len(texts), len(matched_words)) @ stem_match[matched_words].astype(float)    # texts x stems
+
+    positive = stem_counts @ (sentiment_weights > 0)
+    negative = stem_counts @ (sentiment_weights < 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sentiment = np.where(positive + negative > 0, (positive - negative) / (positive + negative), 0.0)
+        # theme hits per 1000 words, so long|short reports compare
+        theme_rates = (stem_counts @ theme_matrix) * 1000 / np.maximum(token_counts, 1)[:, None]
+
+    top_themes = np.argsort(-theme_rates, axis=1, kind='stable')[:, :main_topics_count]
+
+    return [
+        {
+            'sentiment_score':          round(float(score), 4),
+            'sentiment_summary':        'positive' if score > sentiment_summary_threshold else 'negative' if score < -sentiment_summary_threshold else 'mixed',
+            'main_inspection_topics':   '; '.join(theme_names[i] for i in themes if theme_rates[row, i] > 0),
+        }
+        for row, (score, themes) in enumerate(zip(sentiment, top_themes))
+    ]
+
+
+def score_new_inspection_texts(conn):
+    """
+    Scores (score_inspection_texts) the reports in the store not yet scored at the current text_scores_version.
+    Scores the report text held in the full-text index, else the inspection outcome section. Outcome only
+    scores are held at outcome_only_scores_version, so they're redone (from the report text once indexed).
+
+    Returns:
+        int: Reports scored.
+    """
+    unscored = conn.execute(
+        """
+        SELECT i.report_sha256, MIN(i.publication_link), MIN(i.inspection_outcome_text)
+        FROM inspections i
+        LEFT JOIN inspection_text_scores s ON s.report_sha256 = i.report_sha256 AND s.scores_version = ?
+        WHERE i.report_sha256 IS NOT NULL AND s.report_sha256 IS NULL
+        GROUP BY i.report_sha256
+        """,
+        (text_scores_version,)
+    ).fetchall()
+    if not unscored:
+        return 0
+
+    report_texts = {}
+    if has_text_search_index(conn):
+        # only the unscored reports' text, each looked up by its FTS rowid
+        for _, link, _ in unscored:
+            row = conn.execute(
+                """
+                SELECT f.report_text FROM inspection_text_fts_rows r
+                JOIN inspection_text_fts f ON f.rowid = r.fts_rowid
+                WHERE r.publication_link = ?
+                """,
+                (link,)
+            ).fetchone()
+            if row and row[0]:
+                report_texts[link] = row[0]
+
+    scores = score_inspection_texts([report_texts.get(link) or outcome_text for _, link, outcome_text in unscored])
+
+    with conn:
+        conn.executemany(
+            """
+            INSERT INTO inspection_text_scores (report_sha256, sentiment_score, sentiment_summary, main_inspection_topics, scores_version)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(report_sha256) DO UPDATE SET
+                sentiment_score = excluded.sentiment_score,
+                sentiment_summary = excluded.sentiment_summary,
+                main_inspection_topics = excluded.main_inspection_topics,
+                scores_version = excluded.scores_version
+            """,
+            [
+                (sha, score['sentiment_score'], score['sentiment_summary'], score['main_inspection_topics'],
+                 text_scores_version if link in report_texts else outcome_only_scores_version)
+                for (sha, link, _), score in zip(unscored, scores)
+            ]
+        )
+    return len(unscored)
+
+
+
+#
+# Statistical neighbour comparison
+# The lookup's comma joined stat_neighbours (la codes) parsed once into an integer adjacency array
+# (summary row -> neighbour summary rows), so aggregates for every LA come from whole-array operations.
+
+stat_neighbour_recent_months = 12  # neighbours inspected within this many months count as 'recently inspected'
+
+
+def build_stat_neighbour_adjacency(la_codes, stat_neighbours):
+    """
+    Parses comma joined neighbour la codes into an adjacency array of row positions.
+
+    Args:
+        la_codes (Series): Each row's la code.
+        stat_neighbours (Series): Each row's comma joined neighbour la codes (as the LA lookup).
+
+    Returns:
+        numpy.ndarray: int (rows x max neighbours), neighbour row positions, -1 where no (matched) neighbour.
+    """
+    row_codes = pd.to_numeric(la_codes, errors='coerce').to_numpy()
+    neighbours = stat_neighbours.fillna('').astype(str).reset_index(drop=True).str.split(',').explode()
+    neighbour_codes = pd.to_numeric(neighbours.str.strip(), errors='coerce')
+    neighbour_slot = neighbours.groupby(level=0).cumcount().to_numpy()
+
+    adjacency = np.full((len(row_codes), max(int(neighbour_slot.max(initial=0)) + 1, 1)), -1, dtype=np.int64)
+
+    # la code -> row position lookup, -1 for codes not in the summary
+    known = ~np.isnan(row_codes)
+    code_lookup = np.full(int(np.nanmax(row_codes, initial=0)) + 1, -1, dtype=np.int64)
+    code_lookup[row_codes[known].astype(np.int64)] = np.flatnonzero(known)
+
+    codes = neighbour_codes.to_numpy()
+    in_lookup = ~np.isnan(codes) & (np.nan_to_num(codes, nan=-1) >= 0) & (np.nan_to_num(codes, nan=-1) < len(code_lookup))
+    adjacency[neighbours.index.to_numpy()[in_lookup], neighbour_slot[in_lookup]] = code_lookup[codes[in_lookup].astype(np.int64)]
+    return adjacency
+
+
+def add_stat_neighbour_aggregates(summary_df, today=None):
+    """
+    Adds statistical neighbour comparison columns to the summary, for every LA in one pass.
+
+    Columns:
+        stat_neighbours_inspected:          neighbours with a (graded) SEND inspection
+        stat_neighbours_grade_1|2|3:        neighbour outcome grade distribution
+        stat_neighbours_inspected_recently: neighbours whose inspection ended in the last stat_neighbour_recent_months
+        inspection_vs_neighbours_days:      this LA's inspection start less its neighbours' median start (+ == later)
+    """
+    today = pd.Timestamp(today or datetime.now().date())
+    adjacency = build_stat_neighbour_adjacency(summary_df['la_code'], summary_df['stat_neighbours'])
+    has_neighbour = adjacency >= 0
+
+    grades = pd.to_numeric(summary_df['outcome_grade'], errors='coerce').to_numpy(dtype=float)
+    start_days = (summary_df['inspection_start_date'] - pd.Timestamp(0)).dt.days.to_numpy(dtype=float)
+    end_dates = summary_df['inspection_end_date']
+    recent = (end_dates >= today - pd.DateOffset(months=stat_neighbour_recent_months)).to_numpy()
+
+    # gather each row's neighbour values, nan|False where no neighbour
+    neighbour_grades = np.where(has_neighbour, grades[adjacency], np.nan)
+    neighbour_start_days = np.where(has_neighbour, start_days[adjacency], np.nan)
+    neighbour_recent = has_neighbour & recent[adjacency]
+
+    summary_df = summary_df.copy()
+    summary_df['stat_neighbours_inspected'] = (~np.isnan(neighbour_grades)).sum(axis=1)
+    for grade in (1, 2, 3):
+        summary_df[f'stat_neighbours_grade_{grade}'] = (neighbour_grades == grade).sum(axis=1)
+    summary_df['stat_neighbours_inspected_recently'] = neighbour_recent.sum(axis=1)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)  # all-nan rows (no inspected neighbours)
+        median_neighbour_start = np.nanmedian(neighbour_start_days, axis=1)
+    summary_df['inspection_vs_neighbours_days'] = pd.array(np.round(start_days - median_neighbour_start), dtype='Int64')
+
+    return summary_df
+
+
+
+#
+# Precomputed aggregates
+# Regional picture computed once from the final summary, so consumers needn't load|pivot the full dataset
+
+def build_summary_aggregates(summary_df, today=None, upcoming_months=upcoming_inspection_months):
+    """
+    Grade distribution, overdue|upcoming next inspections and median end-to-publication gap, per region_code
+    plus an 'all' row, in one vectorised (groupby) pass over the summary.
+
+    Returns:
+        DataFrame: One row per region (+ 'all'), region_code|las|grade_1..3|overdue|upcoming|median_days_end_to_publication.
+    """
+    today = pd.Timestamp(today or datetime.now().date())
+    grades = summary_df['outcome_grade'].astype(float)
+    next_by = summary_df['next_inspection_by_date']
+    published = summary_df['publication_date']
+    ended = summary_df['inspection_end_date']
+
+    flags_df = pd.DataFrame({
+        'region_code':  summary_df['region_code'].astype(object).fillna('unknown').replace('', 'unknown'),
+        'grade_1':      grades.eq(1),
+        'grade_2':      grades.eq(2),
+        'grade_3':      grades.eq(3),
+        'overdue':      next_by < today,
+        'upcoming':     (next_by >= today) & (next_by < today + pd.DateOffset(months=upcoming_months)),
+        'days_end_to_publication': (published - ended).dt.days,
+    })
+
+    aggregations = dict(
+        las=('grade_1', 'size'),
+        grade_1=('grade_1', 'sum'), grade_2=('grade_2', 'sum'), grade_3=('grade_3', 'sum'),
+        overdue=('overdue', 'sum'), upcoming=('upcoming', 'sum'),
+        median_days_end_to_publication=('days_end_to_publication', 'median'),
+    )
+    by_region_df = flags_df.groupby('region_code').agg(**aggregations).reset_index()
+    all_df = flags_df.assign(region_code='all').groupby('region_code').agg(**aggregations).reset_index()
+
+    aggregates_df = pd.concat([by_region_df, all_df], ignore_index=True)
+    aggregates_df['median_days_end_to_publication'] = aggregates_df['median_days_end_to_publication'].round().astype('Int64')
+    return aggregates_df
+
+
+def save_summary_aggregates(aggregates_df, output_dir, upcoming_months=upcoming_inspection_months):
+    """
+    Writes the aggregates as send_aggregates_by_region.csv + .json (with generated date|upcoming window),
+    each only if the aggregates changed (see write_output_if_changed).
+    """
+    csv_content = aggregates_df.to_csv(index=False)
+    csv_written = write_output_if_changed(
+        os.path.join(output_dir, 'send_aggregates_by_region.csv'), output_data_hash(csv_content), lambda: csv_content
+    )
+
+    data_hash = output_data_hash(csv_content, str(upcoming_months))
+    json_written = write_output_if_changed(
+        os.path.join(output_dir, 'send_aggregates_by_region.json'), data_hash,
+        lambda: json.dumps({
+            'generated': datetime.now().strftime("%Y-%m-%d"),
+            'data_hash': data_hash,
+            'upcoming_months': upcoming_months,
+            'by_region': json.loads(aggregates_df.to_json(orient='records')),
+        }, indent=2)
+    )
+    if csv_written or json_written:
+        logger.info(f"Summary aggregates saved to {output_dir} ({len(aggregates_df) - 1} regions)")
+
+
+#
+# Publication feeds
+# Atom + JSON Feed of new SEND publications, for subscribing rather than re-downloading the summary.
+# Each run appends its new publications (change set) to the entries already in the JSON feed, the store's
+# history isn't re-read. Feeds are only rewritten when entries are added.
+
+def feed_entry_id(urn, publication_date, inspection_type=send_inspection_type):
+    """
+    Stable feed entry id for a publication, from its urn, publication date and inspection type rather than
+    the report link (an archived report's link changes once its Ofsted url is known).
+    """
+    return f"{feed_site_url}#{re.sub(r'[^a-z0-9]+', '-', inspection_type).strip('-')}-{urn}-{publication_date}"
+
+
+def load_feed_entries_from_store(conn, publication_links):
+    """
+    JSON Feed items for the given SEND publications (others skipped), with their URN|LA|grade|dates
+    under '_send'. Entry dates are the publication date, and the date first seen (stored) as updated.
+    """
+    if not publication_links:
+        return []
+    placeholders = ", ".join("?" for _ in publication_links)
+    rows = conn.execute(
+        f"""
+        SELECT pub.publication_link, pub.urn, p.local_authority, p.la_code, pub.publication_date, pub.first_seen_date,
+               i.outcome_grade, i.inspection_start_date, i.inspection_end_date, i.next_inspection, i.next_inspection_by_date
+        FROM publications pub
+        LEFT JOIN inspections i ON i.publication_link = pub.publication_link
+        LEFT JOIN providers p ON p.urn = pub.urn
+        WHERE pub.inspection_type = ? AND pub.publication_link IN ({placeholders})
+        """,
+        (send_inspection_type, *publication_links)
+    ).fetchall()
+
+    entries = []
+    for (link, urn, local_authority, la_code, published, first_seen,
+         grade, start_date, end_date, next_inspection, next_inspection_by) in rows:
+        # archived (offline) reports are held by relative path, published alongside the site
+        url = link if link.startswith('http') else feed_site_url + quote(link)
+        summary = [f"Outcome grade {grade}." if grade is not None else "Outcome grade not extracted."]
+        if start_date and end_date:
+            summary.append(f"Inspected {start_date} to {end_date}.")
+        if next_inspection:
+            summary.append(f"Next inspection {next_inspection}" + (f" (by {next_inspection_by})." if next_inspection_by else "."))
+        entries.append({
+            'id':               feed_entry_id(urn, published),
+            'url':              url,
+            'title':            f"Area SEND inspection: {local_authority or urn} (published {published})",
+            'content_text':     " ".join(summary),
+            'date_published':   f"{published}T00:00:00Z",
+            'date_modified':    f"{first_seen or published}T00:00:00Z",
+            '_send': {
+                'urn':                      urn,
+                'local_authority':          local_authority,
+                'la_code':                  la_code,
+                'outcome_grade':            grade,
+                'inspection_start_date':    start_date,
+                'inspection_end_date':      end_date,
+                'publication_date':         published,
+                'next_inspection':          next_inspection,
+                'next_inspection_by_date':  next_inspection_by,
+            },
+        })
+    return entries
+
+
+def render_atom_feed(items, feed_url, updated):
+    """Atom (RFC 4287) rendering of the JSON feed items."""
+    atom = 'http://www.w3.org/2005/Atom'
+    ElementTree.register_namespace('', atom)
+    feed = ElementTree.Element(f'{{{atom}}}feed')
+
+    def add(parent, tag, text=None, **attrib):
+        element = ElementTree.SubElement(parent, f'{{{atom}}}{tag}', attrib)
+        element.text = text
+        return element
+
+    add(feed, 'id', feed_url)
+    add(feed, 'title', 'Ofsted area SEND inspections, new publications')
+    add(feed, 'updated', updated)
+    add(feed, 'link', href=feed_url, rel='self')
+    add(feed, 'link', href=feed_site_url)
+    author = add(feed, 'author')
+    add(author, 'name', 'Data to Insight')
+    add(author, 'email', d2i_contact_email)
+
+    for item in items:
+        entry = add(feed, 'entry')
+        add(entry, 'id', item['id'])
+        add(entry, 'title', item['title'])
+        add(entry, 'link', href=item['url'])
+        add(entry, 'published', item['date_published'])
+        add(entry, 'updated', item['date_modified'])
+        add(entry, 'summary', item['content_text'])
+        if item['_send']['outcome_grade'] is not None:
+            add(entry, 'category', term=str(item['_send']['outcome_grade']), label='outcome grade')
+
+    ElementTree.indent(feed)
+    return ElementTree.tostring(feed, encoding='utf-8', xml_declaration=True)
+
+
+def update_publication_feeds(conn, new_publication_links, output_dir, max_entries=feed_max_entries):
+    """
+    Appends this run's new SEND publications to the Atom|JSON feeds (feed_filename .atom|.json in output_dir),
+    newest first and capped at max_entries. Existing entries are kept as they are, from the JSON feed, those
+    from before feed_entry_id given its id (and any later duplicate of a publication dropped).
+
+    Returns:
+        int: Entries added.
+    """
+    json_path = os.path.join(output_dir, feed_filename + '.json')
+    atom_path = os.path.join(output_dir, feed_filename + '.atom')
+
+    items = []
+    if os.path.exists(json_path):
+        with open(json_path, encoding='utf-8') as f:
+            items = json.load(f).get('items', [])
+    unique_items = {}
+    for item in items:
+        item['id'] = feed_entry_id(item['_send']['urn'], item['_send']['publication_date'])
+        unique_items.setdefault(item['id'], item)
+    items = list(unique_items.values())
+    known_ids = set(unique_items)
+
+    new_items = [item for item in load_feed_entries_from_store(conn, new_publication_links) if item['id'] not in known_ids]
+    if not new_items and os.path.exists(json_path) and os.path.exists(atom_path):
+        return 0
+
+    items = sorted(new_items + items, key=lambda item: (item['date_published'], item['id']), reverse=True)[:max_entries]
+    feed_url = feed_site_url + root_export_folder + '/' + feeds_subfolder + '/' + feed_filename
+    # feed updated == latest entry's, so a feed only changes with its entries
+    updated = max((item['date_modified'] for item in items), default=datetime.now().strftime("%Y-%m-%dT00:00:00Z"))
+
+    json_feed = {
+        'version':          'https://jsonfeed.org/version/1.1',
+        'title':            'Ofsted area SEND inspections, new publications',
+        'home_page_url':    feed_site_url,
+        'feed_url':         feed_url + '.json',
+        'authors':          [{'name': 'Data to Insight', 'url': f"mailto:{d2i_contact_email}"}],
+        'items':            items,
+    }
+    data_hash = output_data_hash(json.dumps(items, sort_keys=True))
+    write_output_if_changed(json_path, data_hash, lambda: json.dumps(json_feed, indent=2, ensure_ascii=False))
+    write_output_if_changed(atom_path, data_hash, lambda: render_atom_feed(items, feed_url + '.atom', updated))
+    return len(new_items)
+
+
+#
+# Geospatial outputs
+# Outcomes joined onto the bundled LAD boundaries (by ltla23cd) as choropleth-ready GeoJSON.
+# Boundary geometry is simplified|quantised once and cached against the source file hash.
+
+def simplify_ring(points, tolerance):
+    """
+    Douglas-Peucker simplification of a single coordinate ring|line (iterative, avoids recursion limits).
+
+    Args:
+        points (list): [[lon, lat], ...] coordinates.
+        tolerance (float): Max perpendicular distance (in coordinate units) a dropped point may sit from the simplified line.
+
+    Returns:
+        list: The retained coordinates (first and last always kept).
+    """
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first], points[last]
+        dx, dy = x2 - x1, y2 - y1
+        seg_len_sq = dx * dx + dy * dy
+
+        max_dist_sq, max_index = 0.0, None
+        for i in range(first + 1, last):
+            px, py = points[i]
+            if seg_len_sq == 0:
+                dist_sq = (px - x1) ** 2 + (py - y1) ** 2
+            else:
+                cross = dx * (py - y1) - dy * (px - x1)
+                dist_sq = cross * cross / seg_len_sq
+            if dist_sq > max_dist_sq:
+                max_dist_sq, max_index = dist_sq, i
+
+        if max_index is not None and max_dist_sq > tolerance * tolerance:
+            keep[max_index] = True
+            stack.append((first, max_index))
+            stack.append((max_index, last))
+
+    return [pt for pt, kept in zip(points, keep) if kept]
+
+
+def simplify_polygon(rings, tolerance, precision):
+    """Simplifies + quantises each ring of a polygon, keeping rings valid (closed, >= 4 points)."""
+    simplified = []
+    for ring in rings:
+        reduced = simplify_ring(ring, tolerance)
+        quantised = []
+        for lon, lat in reduced:
+            pt = [round(lon, precision), round(lat, precision)]
+            if not quantised or pt != quantised[-1]:
+                quantised.append(pt)
+
+        if len(quantised) < 4:
+            if simplified:
+                continue  # tiny hole collapsed to nothing, drop it
+            quantised = [[round(lon, precision), round(lat, precision)] for lon, lat in ring]  # keep outer ring as is
+        if quantised[0] != quantised[-1]:
+            quantised.append(quantised[0])
+        simplified.append(quantised)
+    return simplified
+
+
+def load_simplified_boundaries(boundaries_path, cache_dir, tolerance=0.001, precision=4):
+    """
+    Returns the LAD boundaries FeatureCollection with simplified|quantised geometry, from cache where possible.
+    The cache is keyed on the source file hash plus the simplification settings.
+    """
+    with open(boundaries_path, 'rb') as f:
+        source_bytes = f.read()
+    source_hash = hashlib.sha256(source_bytes).hexdigest()[:16]
+
+    cache_path = os.path.join(cache_dir, f"lad_boundaries_{source_hash}_t{tolerance}_p{precision}.geojson")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+
+    boundaries = json.loads(source_bytes)
+    features = []
+    for feature in boundaries['features']:
+        geometry = feature['geometry']
+        if geometry['type'] == 'Polygon':
+            coordinates = simplify_polygon(geometry['coordinates'], tolerance, precision)
+        else:  # MultiPolygon
+            coordinates = [simplify_polygon(polygon, tolerance, precision) for polygon in geometry['coordinates']]
+
+        features.append({
+            'type': 'Feature',
+            'properties': {
+                'ltla23cd': feature['properties']['LAD23CD'],
+                'ltla23nm': feature['properties']['LAD23NM'],
+            },
+            'geometry': {'type': geometry['type'], 'coordinates': coordinates},
+        })
+
+    simplified = {'type': 'FeatureCollection', 'features': features}
+
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    with open(cache_path, 'w') as f:
+        json.dump(simplified, f, separators=(',', ':'))
+    logger.info(f"Simplified LAD boundaries cached: {cache_path} ({len(source_bytes) // 1024} KB -> {os.path.getsize(cache_path) // 1024} KB)")
+
+    return simplified
+
+
+def add_boundary_counties(boundaries, county_lookup_path):
+    """
+    Sets the county code (cty23cd) on the boundaries' shire district features, in place, from the ONS
+    LAD23 -> CTY23 lookup. County council LAs (E10 ltla23cd) have no boundary of their own, they're
+    shown over their districts (see save_geospatial_report).
+    """
+    with open(county_lookup_path, newline='', encoding='utf-8-sig') as f:
+        district_counties = {row['LAD23CD']: row['CTY23CD'] for row in csv.DictReader(f)}
+    for feature in boundaries['features']:
+        county_code = district_counties.get(feature['properties']['ltla23cd'])
+        if county_code:
+            feature['properties']['cty23cd'] = county_code
+    return boundaries
+
+
+def to_topojson(feature_collection, object_name, quantization=10000):
+    """
+    Converts a Polygon|MultiPolygon FeatureCollection into quantised, delta-encoded TopoJSON.
+    Each ring becomes its own arc (no shared-border detection), which keeps this simple while the
+    integer deltas still give most of the size saving for the published payload.
+    """
+    xs = [x for feature in feature_collection['features'] for x, _ in iter_geometry_points(feature['geometry'])]
+    ys = [y for feature in feature_collection['features'] for _, y in iter_geometry_points(feature['geometry'])]
+    x0, y0 = min(xs), min(ys)
+    kx = (max(xs) - x0) / (quantization - 1) or 1
+    ky = (max(ys) - y0) / (quantization - 1) or 1
+
+    arcs = []
+
+    def encode_ring(ring):
+        arc, prev_x, prev_y = [], 0, 0
+        for x, y in ring:
+            qx, qy = round((x - x0) / kx), round((y - y0) / ky)
+            if arc and qx == prev_x and qy == prev_y:
+                continue
+            arc.append([qx - prev_x, qy - prev_y])
+            prev_x, prev_y = qx, qy
+        arcs.append(arc)
+        return len(arcs) - 1
+
+    geometries = []
+    for feature in feature_collection['features']:
+        geometry = feature['geometry']
+        if geometry['type'] == 'Polygon':
+            geometry_arcs = [[encode_ring(ring)] for ring in geometry['coordinates']]
+        else:
+            geometry_arcs = [[[encode_ring(ring)] for ring in polygon] for polygon in geometry['coordinates']]
+        geometries.append({'type': geometry['type'], 'arcs': geometry_arcs, 'properties': feature['properties']})
+
+    return {
+        'type': 'Topology',
+        'transform': {'scale': [kx, ky], 'translate': [x0, y0]},
+        'objects': {object_name: {'type': 'GeometryCollection', 'geometries': geometries}},
+        'arcs': arcs,
+    }
+
+
+def iter_geometry_points(geometry):
+    """Yields every (x, y) in a Polygon|MultiPolygon geometry."""
+    polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+    for polygon in polygons:
+        for ring in polygon:
+            for x, y in ring:
+                yield x, y
+
+
+def save_geospatial_report(summary_df, boundaries, output_path):
+    """
+    Joins the summary outcomes onto boundary features and writes a choropleth-ready GeoJSON,
+    plus a (smaller) TopoJSON copy alongside it for web publishing.
+
+    Joined by ltla23cd, else for county councils onto each of their districts (cty23cd, see add_boundary_counties),
+    else on LA name (e.g. counties since made unitary, whose lookup ltla23cd is still the county's).
+
+    Args:
+        summary_df (DataFrame): Summary data incl. ltla23cd.
+        boundaries (dict): Simplified boundaries FeatureCollection (see load_simplified_boundaries).
+        output_path (str): GeoJSON file to write.
+
+    Returns:
+        list: Summary LAs with no boundary feature (e.g. abolished counties).
+    """
+    outcome_cols = ['urn', 'local_authority', 'region_code', 'outcome_grade', 'publication_date',
+                    'next_inspection_by_date', 'inspection_link']
+    summary_rows = summary_df[['ltla23cd'] + outcome_cols].to_dict('records')
+
+    boundary_codes = {feature['properties']['ltla23cd'] for feature in boundaries['features']}
+    county_districts = {}
+    for feature in boundaries['features']:
+        if feature['properties'].get('cty23cd'):
+            county_districts.setdefault(feature['properties']['cty23cd'], []).append(feature['properties']['ltla23cd'])
+    boundary_names = {la_name_key(feature['properties']['ltla23nm']): feature['properties']['ltla23cd'] for feature in boundaries['features']}
+
+    # boundary ltla23cd -> outcome, a direct code match taking precedence over a county|name match
+    outcomes, unmatched = {}, []
+    for direct in (True, False):
+        for row in summary_rows:
+            code = None if pd.isna(row['ltla23cd']) else row['ltla23cd']
+            local_authority = None if pd.isna(row['local_authority']) else row['local_authority']
+            if direct:
+                matched_codes = [code] if code in boundary_codes else []
+            elif code in boundary_codes:
+                continue
+            elif code in county_districts:
+                matched_codes = county_districts[code]
+            else:
+                name_code = boundary_names.get(la_name_key(local_authority)) if local_authority else None
+                matched_codes = [name_code] if name_code else []
+                if not matched_codes:
+                    unmatched.append(local_authority or code)
+            outcome = {col: (None if pd.isna(row[col]) else row[col]) for col in outcome_cols}
+            for matched_code in matched_codes:
+                outcomes.setdefault(matched_code, outcome)
+
+    features = []
+    for feature in boundaries['features']:
+        properties = dict(feature['properties'])
+        properties.update(outcomes.get(properties['ltla23cd'], {}))
+        features.append({'type': 'Feature', 'properties': properties, 'geometry': feature['geometry']})
+
+    outcomes_geojson = {'type': 'FeatureCollection', 'features': features}
+    topojson_path = os.path.splitext(output_path)[0] + '.topojson'
+
+    # both files carry the data hash (a foreign member), rewritten only when the joined data changes
+    data_hash = output_data_hash(json.dumps(outcomes_geojson, separators=(',', ':'), default=str))
+    geojson_written = write_output_if_changed(
+        output_path, data_hash,
+        lambda: json.dumps({'type': 'FeatureCollection', 'data_hash': data_hash, 'features': features},
+                           separators=(',', ':'), default=str)
+    )
+    topojson_written = write_output_if_changed(
+        topojson_path, data_hash,
+        lambda: json.dumps({'type': 'Topology', 'data_hash': data_hash, **to_topojson(outcomes_geojson, 'send_outcomes')},
+                           separators=(',', ':'), default=str)
+    )
+
+    if geojson_written or topojson_written:
+        logger.info(f"{output_path} successfully created! ({os.path.getsize(output_path) // 1024} KB, "
+                    f"topojson {os.path.getsize(topojson_path) // 1024} KB)")
+    return sorted(la for la in unmatched if la)
+
+
+
+def scrape_search_pages(all_publications=False, skip_links=frozenset()):
+    """
+    Walks the Ofsted search results pages, yielding the processed provider records for each page in turn.
+
+    Args:
+        all_publications (bool): Passed to process_provider_links (history mode).
+        skip_links (set): Passed to process_provider_links, report links not to re-extract.
+
+    Yields:
+        list: Records (dicts) for the providers on each results page.
+    """
+    page_start = start
+    while page_start < max_results:
+        # Construct URL for current chunk
+        url = url_stem + search_url + pagination_param.format(start=page_start)
+
+        logger.debug("Fetching: %s", url)
+
+        # Fetch and parse search page
+        soup = get_soup(url)
+
+        if soup is None:
+            logger.error("No search page content retrieved, stopping.")
+            break
+
+        # Find provider links
+        provider_links = soup.find_all('a', href=lambda href: href and '/provider/' in href)
+
+        logger.debug("Found %d provider links on page %d-%d", len(provider_links), page_start, page_start + max_page_results)
+
+        if not provider_links:
+            break  # no more results found
+
+        # provider links
+        yield process_provider_links(provider_links, all_publications=all_publications, skip_links=skip_links)
+
+        # continue on next batch (if there is)
+        page_start += max_page_results
+
+
+def reextract_inspections_from_text_cache(conn, text_cache_dir):
+    """
+    Re-runs field extraction (extract_send_fields) for every report in the store whose text is cached,
+    updating the store in place. No downloads, so parsing changes apply across the corpus in seconds.
+
+    Returns:
+        tuple: (reports re-extracted, reports with no cached text for the current extractor version,
+                {report link: extraction tiers} see extract_send_fields)
+    """
+    text_search = has_text_search_index(conn)
+    rows = conn.execute(
+        "SELECT publication_link, COALESCE(report_sha256, range_fetched_sha256), report_sha256 IS NULL FROM inspections "
+        "WHERE report_sha256 IS NOT NULL OR range_fetched_sha256 IS NOT NULL"
+    ).fetchall()
+    reextracted_count, not_cached_count = 0, 0
+    extraction_tiers = {}
+
+    with conn:
+        for publication_link, pdf_sha256, range_fetched in rows:
+            pdf_text = load_cached_pdf_text(pdf_sha256, text_cache_dir, range_fetch_pages if range_fetched else None)
+            if pdf_text is None:
+                not_cached_count += 1
+                continue
+
+            fields = extract_send_fields(pdf_text)
+            extraction_tiers[publication_link] = fields['extraction_tiers']
+            conn.execute(
+                "UPDATE inspections SET outcome_grade = ?, previous_inspection_date = ?, inspection_start_date = ?, "
+                "inspection_end_date = ?, next_inspection = ?, next_inspection_by_date = ?, inspection_outcome_text = ?, "
+                "extracted_date = ? WHERE publication_link = ?",
+                (
+                    fields['outcome_grade'],
+                    to_iso_date(fields['previous_inspection_date']),
+                    to_iso_date(fields['inspection_start_date']),
+                    to_iso_date(fields['inspection_end_date']),
+                    fields['next_inspection'],
+                    to_iso_date(fields['next_inspection_by_date']),
+                    fields['inspection_outcome_text'],
+                    datetime.now().strftime("%Y-%m-%d"),
+                    publication_link
+                )
+            )
+            if text_search and not range_fetched:
+                index_inspection_text(conn, publication_link, fields['inspection_outcome_text'], fields['report_text'])
+            reextracted_count += 1
+
+    return reextracted_count, not_cached_count, extraction_tiers
+
+
+
+def save_to_html(data, column_order, local_link_column=None, web_link_column=None, aggregates=None):
     """
     Exports data to an HTML table.
 
@@ -1210,6 +3651,7 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
         data (DataFrame): The data to be exported.
         column_order (list): List of columns in the desired order.
         hyperlink_column (str, optional): The column containing hyperlinks. Defaults to None.
+        aggregates (DataFrame, optional): Regional summary (build_summary_aggregates) shown above the main table.
 
     Returns:
         None
@@ -1235,10 +3677,7 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
 
     <b>Known extraction issues:</b>
     <ul>
-        <li><b>01/01/1900</b> == No-date-data | unreadable.</li>
-        <li>Derbyshire, Enfield, North Yorkshire, Wiltshire (<b>Next Inspection By Date</b> not generated - but detail is available in summary text).</li>
-        <li>Enfield, Wiltshire (<b>Next Inspection</b> timeframe not extracted - but detail is available in summary text).</li>
-        <li>Derbyshire, North Yorkshire (<b>Previous, Start, End Inspection Date(s)</b> not extracted).</li>
+        <li><b>01/01/1900</b> == No-date-data | unreadable (or not previously inspected).</li>
     </ul>
 
     <a href="mailto:{d2i_contact_email}?subject=Ofsted-SEND-Scrape-Tool">Feedback</a> highlighting problems | inaccuracies | suggestions is welcomed.<br/>
@@ -1320,10 +3759,10 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
         # print("Changed files:", changed_files)
         # print("Untracked files:", untracked_files)
         # print("All changed files:", all_changed_files)
-        print("Last updated list:", las_with_new_inspection_list)
+        logger.info(f"Last updated list: {las_with_new_inspection_list}")
 
     except Exception as e:
-        print(f"Error processing repository: {e}")
+        logger.error(f"Error processing repository: {e}")
         raise
 
 # end of most-recent-reports generate
@@ -1333,12 +3772,32 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
 
     # current time, add one hour to the current time to correct non-UK Git server time
     adjusted_timestamp_str = (datetime.now() + timedelta(hours=1)).strftime("%d %m %Y %H:%M")
+    timestamp_placeholder = "<!--summary-timestamp-->"  # swapped in after hashing, so the timestamp alone isn't a change
+
+    # Regional summary (precomputed aggregates), its own section above the per-LA table
+    regional_section = ""
+    if aggregates is not None:
+        aggregates = aggregates.rename(columns={
+            'upcoming': f'due next {upcoming_inspection_months} months',
+            'median_days_end_to_publication': 'median days end to publication',
+        })
+        aggregates.columns = [c.replace('_', ' ').title() for c in aggregates.columns]
+        aggregates.rename(columns={"Las": "LAs"}, inplace=True)
+        regional_section = f"""
+        <h2>Regional summary</h2>
+        <div class="container">
+        {aggregates.to_html(index=False, na_rep="")}
+        </div>
+        <h2>Local authorities</h2>
+        """
 
     # init HTML content with title and CSS
     html_content = f"""
     <html>
     <head>
         <title>{page_title}</title>
+        <link rel="alternate" type="application/atom+xml" title="New SEND publications" href="{root_export_folder}/{feeds_subfolder}/{feed_filename}.atom">
+        <link rel="alternate" type="application/feed+json" title="New SEND publications" href="{root_export_folder}/{feeds_subfolder}/{feed_filename}.json">
         <style>
             .container {{
                 display: flex;
@@ -1363,8 +3822,9 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
         <h1>{page_title}</h1>
         <p>{intro_text}</p>
         <p>{disclaimer_text}</p>
-        <p><b>Summary data last updated: {adjusted_timestamp_str}</b></p>
+        <p><b>Summary data last updated: {timestamp_placeholder}</b></p>
         <p><b>LA inspections last updated: {las_with_new_inspection_list}</b></p>
+        {regional_section}
         <div class="container">
     """
 
@@ -1374,55 +3834,255 @@ def save_to_html(data, column_order, local_link_column=None, web_link_column=Non
     # Close div and HTML tags
     html_content += "\n</div>\n</body>\n</html>"
 
-    # Write to index.html
-    with open("index.html", "w") as f:
-        f.write(html_content)
+    # Write to index.html, only if the page data changed
+    data_hash = output_data_hash(html_content)
+    html_content = html_content.replace(timestamp_placeholder, adjusted_timestamp_str)
+    html_content = html_content.replace("<head>", f'<head>\n        <meta name="data-hash" content="{data_hash}">', 1)
 
-    print("SEND summary page as index.html successfully created!")
+    if write_output_if_changed("index.html", data_hash, lambda: html_content):
+        logger.info("SEND summary page as index.html successfully created!")
 
 
 
+# Per-stage run metrics, stage name -> {'seconds', + track_stage_memory: 'peak_mb', 'rss_mb', 'process_peak_rss_mb', 'top_allocations'}
+run_metrics = {}
 
+# Traced peak of the current stage from before any per-report peak reset (see reset_traced_peak)
+stage_traced_peak = 0
 
 
-#
-# Scrape Ofsted inspection report data
-#
+def current_rss_mb():
+    """Resident memory the process holds now in MB (from /proc, incl. non python allocations), None where unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return round(int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_mb():
+    """Process peak resident memory to date in MB (not per stage, a high water mark of the whole run), None where unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)  # bytes on macOS, KB on linux
+
+
+def reset_traced_peak():
+    """tracemalloc.reset_peak, for a per-report peak, with the stage's peak so far kept for run_stage."""
+    global stage_traced_peak
+    stage_traced_peak = max(stage_traced_peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.reset_peak()
+
+
+def traced_memory_by_line():
+    """Traced memory currently held per allocation site, {(filename, lineno): bytes}."""
+    snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return {
+        (stat.traceback[0].filename, stat.traceback[0].lineno): stat.size
+        for stat in snapshot.statistics('lineno')
+    }
+
+
+def top_allocations(held_by_line, baseline_by_line, limit=memory_top_allocations, min_mb=0.1):
+    """Allocation sites holding the most memory more than at baseline (min_mb or more), as 'file:line +MB' strings."""
+    growth = sorted(
+        ((size - baseline_by_line.get(site, 0), site) for site, size in held_by_line.items()),
+        reverse=True
+    )[:limit]
+    return [f"{os.path.basename(filename)}:{lineno} {size / (1024 * 1024):+.1f} MB" for size, (filename, lineno) in growth if size >= min_mb * 1024 * 1024]
+
+
+@contextmanager
+def run_stage(stage_name):
+    """
+    Times a named pipeline stage into run_metrics, and with track_stage_memory its peak python
+    memory (tracemalloc, allocations in this process only), RSS held at its end, the process peak RSS
+    to date (whole run, not the stage's own), and the allocation sites left holding most memory by the stage.
+
+    Log records within the stage are tagged with it, and logged at its stage_log_levels level (else log_level).
+    """
+    global stage_traced_peak, current_stage
+    current_stage = stage_name
+    if track_stage_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        baseline_by_line = traced_memory_by_line()
+        stage_traced_peak = 0
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_metrics = {'seconds': round(time.perf_counter() - started, 3)}
+        if track_stage_memory:
+            stage_metrics['peak_mb'] = round(max(stage_traced_peak, tracemalloc.get_traced_memory()[1]) / (1024 * 1024), 1)
+            stage_metrics['rss_mb'] = current_rss_mb()
+            stage_metrics['process_peak_rss_mb'] = peak_rss_mb()
+            stage_metrics['top_allocations'] = top_allocations(traced_memory_by_line(), baseline_by_line)
+        run_metrics[stage_name] = stage_metrics
+        logger.debug("Stage %s finished in %ss", stage_name, stage_metrics['seconds'], extra={'metrics': stage_metrics})
+        current_stage = None
+
+
+def apply_memory_budget(budget_mb, per_document_mb=document_memory_estimate_mb):
+    """
+    Caps in-flight report downloads|parses (report_slots, + offline extraction workers) to what fits in
+    budget_mb alongside what the process already holds, at per_document_mb per report.
+
+    Returns:
+        int: Reports allowed in flight (at least 1, at most max_workers).
+    """
+    global report_slots
+    held_mb = current_rss_mb() or peak_rss_mb() or 0  # peak to date where current RSS isn't readable (over estimates)
+    slots = max(1, min(max_workers, int((budget_mb - held_mb) // per_document_mb)))
+    report_slots = threading.BoundedSemaphore(slots)
+    logger.info(f"Memory budget {budget_mb} MB: {slots} report(s) in flight ({held_mb} MB held, ~{per_document_mb} MB per report)")
+    return slots
+
+
+def save_run_metrics(metrics, metrics_path, **run_info):
+    """
+    Writes this run's stage metrics (+ e.g. run mode, record counts) as json, for the regression
+    harness (admin/check_extraction_regression.py) or comparing runs.
+    """
+    os.makedirs(os.path.dirname(metrics_path), exist_ok=True)
+    with open(metrics_path, 'w') as f:
+        json.dump({**run_info, 'stages': metrics}, f, indent=2)
+    logger.info("Stage timings (s): " + ", ".join(f"{name} {m['seconds']}" for name, m in metrics.items()))
 
-data = []
-while start < max_results:
-    # Construct URL for current chunk
-    url = url_stem + search_url + pagination_param.format(start=start)
 
-    print(f"Fetching: {url}")  # Debug output
+# Set up which cols to take forward onto the web front-end(and order of)
+# Remove for now until link fixed applied: 'local_link_to_all_inspections',
+web_column_order = [
+                'urn','la_code','region_code','ltla23cd','local_authority',
+                'previous_inspection_date',
+                'inspection_start_date', 'inspection_end_date',
+                'outcome_grade', 
+                'inspection_outcome_text',
+                'publication_date', 'next_inspection', 'next_inspection_by_date',
+                #'local_link_to_all_inspections', 
+                'inspection_link'
+                ]
 
-    # Fetch and parse search page
-    soup = get_soup(url)
 
-    if soup is None:
-        print("⚠️ ERROR: No content retrieved, stopping.")
-        break
+def save_summary_outputs(conn, geo_boundaries):
+    """
+    Builds the summary (most recent inspection per LA) from the store, and from it every visible output:
+    geospatial, aggregates, excel and the web page. Run once per scrape, and after each watch mode update.
 
-    # Find provider links
-    provider_links = soup.find_all('a', href=lambda href: href and '/provider/' in href)
+    Returns:
+        DataFrame: The summary.
+    """
+    with run_stage('summary'):
+        summary_df = load_send_summary_from_store(conn)
+
+        # Statistical neighbour comparison columns (grade distribution, recent inspections, relative timing)
+        summary_df = add_stat_neighbour_aggregates(summary_df)
+
+        # Report date formats|plain codes, for the published outputs
+        export_df = format_summary_for_export(summary_df)
+
+    # GEOSPATIAL Output
+    # Outcomes joined to (cached, simplified) LAD boundaries for choropleth use
+    with run_stage('geospatial'):
+        geo_unmatched_las = save_geospatial_report(
+            export_df, geo_boundaries,
+            os.path.join(root_export_folder, geospatial_subfolder, geospatial_report_filename)
+        )
+    if geo_unmatched_las:
+        # e.g. abolished counties (no district|unitary boundary of the same name)
+        logger.warning(f"No LAD boundary for {len(geo_unmatched_las)} LA(s): {', '.join(geo_unmatched_las)}")
+
+    # AGGREGATES Output
+    # Regional grade distribution|next inspection timing, small json|csv (+ shown on index.html)
+    with run_stage('aggregates'):
+        aggregates_df = build_summary_aggregates(summary_df)
+        save_summary_aggregates(aggregates_df, os.path.join(root_export_folder, aggregates_subfolder))
+
+    # EXCEL Output
+    # Also define the active hyperlink col if exporting to Excel
+    with run_stage('excel'):
+        save_data_update(export_df, export_summary_filename, file_type=export_file_type, hyperlink_column='local_link_to_all_inspections')
+
+    # WEB Output
+    with run_stage('html'):
+        save_to_html(export_df, web_column_order, local_link_column='local_link_to_all_inspections', web_link_column='inspection_link', aggregates=aggregates_df)
+
+    return summary_df
+
+
+def watch_for_new_publications(conn, extracted_links, lookup_index, geo_boundaries, name_index=None,
+                               interval_minutes=watch_interval_minutes, jitter=watch_jitter, max_polls=None):
+    """
+    Resident polling (run_mode 'watch'), after a normal run. The search listing and provider pages are re-fetched
+    with conditional requests on a jittered schedule, only changed provider pages are processed, and new SEND
+    reports extracted, stored and the outputs refreshed. Store, lookup index and boundaries stay loaded throughout.
 
-    print(f"🔍 DEBUG: Found {len(provider_links)} provider links on page {start}-{start + max_page_results}")
+    Args:
+        conn (sqlite3.Connection): Open inspection store.
+        extracted_links (set): Report links already extracted, added to as new ones are.
+        lookup_index (dict): URN-keyed LA lookup (load_la_lookup_index).
+        geo_boundaries (dict): Simplified LAD boundaries (load_simplified_boundaries).
+        name_index (dict, optional): LA name index onto the lookup (build_la_name_index), for URNs not in it.
+        max_polls (int, optional): Stop after this many polls (default, until interrupted).
+    """
+    listing_provider_links = {}  # search listing url -> provider links, from its last changed fetch
+    polls = 0
+
+    while max_polls is None or polls < max_polls:
+        poll_started = time.perf_counter()
+
+        for page_start in range(start, max_results, max_page_results):
+            url = url_stem + search_url + pagination_param.format(start=page_start)
+            if url in listing_provider_links:
+                modified, soup = get_soup_if_modified(url)
+            else:
+                modified, soup = True, get_soup(url)
+            if modified and soup is not None:
+                listing_provider_links[url] = soup.find_all('a', href=lambda href: href and '/provider/' in href)
+
+        provider_links = [link for links in listing_provider_links.values() for link in links]
+        records = process_provider_links(provider_links, skip_links=extracted_links, if_modified=True)
+
+        for record in records:
+            enrich_record(record, lookup_index, provider_lookup_cols, name_index)
+        new_links = save_inspections_to_store(conn, records)
+        extracted_links.update(record.inspection_link for record in records if record.extracted)
+        confirm_page_validators()
 
-    if not provider_links:
-        break  # no more results found
+        logger.info(f"Watch poll {polls + 1}: {len(provider_links)} providers, {len(records)} record(s) from changed pages, "
+                    f"{len(new_links)} new publication(s) in {time.perf_counter() - poll_started:.1f}s")
 
-    # provider links
-    data.extend(process_provider_links(provider_links))
+        if new_links:
+            update_providers_from_lookup(conn, lookup_index)
+            score_new_inspection_texts(conn)
+            save_summary_outputs(conn, geo_boundaries)
+            update_publication_feeds(conn, new_links, os.path.join(root_export_folder, feeds_subfolder))
 
-    # continue on next batch (if there is)
-    start += max_page_results
+        polls += 1
+        if max_polls is None or polls < max_polls:
+            time.sleep(interval_minutes * 60 * random.uniform(1 - jitter, 1 + jitter))
 
 
-# Convert the 'data' list to a DataFrame
-send_inspection_summary_df = pd.DataFrame(data)
 
-# # testing
-# print(send_inspection_summary_df.head(5))
+
+
+
+
+#
+# Scrape Ofsted inspection report data
+#
+
+run_started = time.perf_counter()
+
+# Open the inspection store up front, previously extracted reports needn't be re-fetched
+inspection_store = open_inspection_store(os.path.join(root_export_folder, inspections_db_filename))
+if reuse_extracted_reports:
+    extracted_links = {row[0] for row in inspection_store.execute("SELECT publication_link FROM inspections")}
+else:
+    extracted_links = set()
+
 
 # Data enrichment - import flat-file stored data 
 #
@@ -1432,31 +4092,122 @@ send_inspection_summary_df = pd.DataFrame(data)
 #       - This process idealy only for static data, or where obtaining specific data points in a dynamic manner isnt possble etc. 
 #       - These just examples of potential enrichment use-cases
 
+# Enrichment1: LA codes
+# Ofsted data centres on URN, but some might need historic 'LA Number'
+# Lookup parsed once into a URN-keyed index (cached between runs), records enriched as they're scraped
+# + LA name index onto it, providers whose URN isn't in the lookup matched on name instead of losing their codes
+with run_stage('lookup_index'):
+    la_lookup_index = load_la_lookup_index(import_la_data_path, os.path.join(root_export_folder, cache_subfolder))
+    la_name_index = build_la_name_index(la_lookup_index)
+unmatched_lookup_urns = []
+name_matched_lookup_urns = []
 
+# Memory budget (small CI runners), reports in flight capped to fit alongside what the run already holds
+report_slots_count = apply_memory_budget(memory_budget_mb) if memory_budget_mb else max_workers
 
 
-# Enrichment1: LA codes
-# Ofsted data centres on URN, but some might need historic 'LA Number'
+data = []
+with run_stage('extract'):
+    if run_mode == 'reextract':
+        # No scrape, field extraction re-run over the text cache of reports already in the store
+        reextracted_count, not_cached_count, extraction_tiers = reextract_inspections_from_text_cache(
+            inspection_store, os.path.join(root_export_folder, cache_subfolder, pdf_text_cache_subfolder)
+        )
+        logger.info(f"Re-extracted {reextracted_count} report(s) from cached text, {not_cached_count} not in the text cache")
+
+    elif run_mode == 'offline':
+        # No network, rebuild from the local reports archive (+ text cache)
+        archived_reports = find_archived_send_reports(os.path.join(root_export_folder, inspections_subfolder))
+        logger.info(f"Offline mode: {len(archived_reports)} archived SEND report(s) found")
+        data = extract_archived_reports(archived_reports, workers=report_slots_count)
+        for record in data:
+            lookup_match = enrich_record(record, la_lookup_index, provider_lookup_cols, la_name_index)
+            if lookup_match != 'urn':
+                (name_matched_lookup_urns if lookup_match else unmatched_lookup_urns).append(f"{record.urn} {record.local_authority}")
 
-# import the needed external/local data
-local_authorities_lookup_df = import_csv_from_folder(import_la_data_path) # bring external data in
+    else:
+        for page_data in scrape_search_pages(all_publications=(run_mode == 'history'), skip_links=extracted_links):
+            for record in page_data:
+                lookup_match = enrich_record(record, la_lookup_index, provider_lookup_cols, la_name_index)
+                if lookup_match != 'urn':
+                    (name_matched_lookup_urns if lookup_match else unmatched_lookup_urns).append(f"{record.urn} {record.local_authority}")
+            data.extend(page_data)
+
+    if run_mode != 'reextract':
+        extraction_tiers = {record.inspection_link: record.extraction_tiers for record in data if record.extraction_tiers}
+
+# Per report memory (track_stage_memory), heaviest listed
+document_metrics = {record.inspection_link: record.document_metrics for record in data if record.document_metrics}
+traced_documents = {link: metrics for link, metrics in document_metrics.items() if 'peak_mb' in metrics}
+if traced_documents:
+    logger.info("Heaviest report extractions (traced MB): " + ", ".join(
+        f"{link.rsplit('/', 1)[-1]} {metrics['peak_mb']}"
+        for link, metrics in sorted(traced_documents.items(), key=lambda item: item[1]['peak_mb'], reverse=True)[:memory_top_allocations]
+    ))
+
+# Per report bytes fetched vs report size (pdf_range_fetch)
+fetched_documents = [metrics for metrics in document_metrics.values() if 'bytes_saved' in metrics]
+if fetched_documents:
+    bytes_total = sum(metrics['bytes_total'] for metrics in fetched_documents)
+    bytes_saved = sum(metrics['bytes_saved'] for metrics in fetched_documents)
+    range_fetched_count = sum(metrics['range_fetched'] for metrics in fetched_documents)
+    logger.info(f"Range fetch: {range_fetched_count} of {len(fetched_documents)} report(s) fetched in part, "
+                f"{bytes_saved / (1024 * 1024):.1f} of {bytes_total / (1024 * 1024):.1f} MB not downloaded "
+                f"({bytes_saved / max(bytes_total, 1):.0%})")
+
+# Which extraction tier resolved each field, fallback|unresolved reports listed
+extraction_tier_counts = summarise_extraction_tiers(extraction_tiers)
+if extraction_tier_counts:
+    logger.info("Extraction tiers: " + " | ".join(
+        f"{field} " + ", ".join(f"{tier} {count}" for tier, count in tier_counts.items() if count)
+        for field, tier_counts in extraction_tier_counts.items()
+    ))
+for link, report_tiers in sorted(extraction_tiers.items()):
+    not_fast = {field: tier or 'unresolved' for field, tier in report_tiers.items() if tier != 'fast'}
+    if not_fast:
+        logger.info(f"    {link}: {not_fast}")
+
+if name_matched_lookup_urns:
+    # LA codes etc. taken from the LA of the same name, add the URNs to the lookup csv
+    logger.warning(f"URNs not found in LA lookup, matched on LA name ({len(name_matched_lookup_urns)}): {', '.join(sorted(set(name_matched_lookup_urns)))}")
+if unmatched_lookup_urns:
+    # kept in the outputs (without LA codes etc.), add them to the lookup csv
+    logger.warning(f"URNs not found in LA lookup ({len(unmatched_lookup_urns)}): {', '.join(sorted(set(unmatched_lookup_urns)))}")
+## End enrichment 1 ##
 
-# print(local_authorities_lookup_df.head(3))
-# print(send_inspection_summary_df.head(3)) # empty
 
+# Persist this run's results into the inspection store
+with run_stage('store'):
+    new_publication_links = save_inspections_to_store(inspection_store, data)
+    update_providers_from_lookup(inspection_store, la_lookup_index)
+    confirm_page_validators()  # pages polled conditionally from here (watch mode)
+logger.info(f"Inspection store updated: {len(data)} report records, {len(new_publication_links)} new publication(s)")
 
-# Ensure key column consistency
-key_col = 'urn'
-send_inspection_summary_df['urn'] = send_inspection_summary_df['urn'].astype('int64')
-local_authorities_lookup_df['urn'] = pd.to_numeric(local_authorities_lookup_df['urn'], errors='coerce')
 
-# # Define what data is required to be merged in
-additional_data_cols = ['la_code', 'region_code', 'ltla23cd', 'stat_neighbours']
-send_inspection_summary_df = merge_and_select_columns(send_inspection_summary_df, local_authorities_lookup_df, key_col, additional_data_cols)
+# Sentiment|themes, batch scored for reports not yet scored
+with run_stage('text_scores'):
+    text_scores_count = score_new_inspection_texts(inspection_store)
+logger.info(f"Sentiment|theme scored {text_scores_count} new report(s)")
 
-# re-organise column structure now with new col(s)
-send_inspection_summary_df = reposition_columns(send_inspection_summary_df, key_col, additional_data_cols)
-## End enrichment 1 ##
+# History mode: long-format table of every SEND publication held, for trend analysis
+if run_mode == 'history':
+    with run_stage('history_export'):
+        send_inspection_history_df = load_send_history_from_store(inspection_store)
+        history_export_path = os.path.join(root_export_folder, history_export_filename + '.csv')
+        history_csv_content = send_inspection_history_df.to_csv(index=False, date_format='%Y-%m-%d')
+        history_written = write_output_if_changed(history_export_path, output_data_hash(history_csv_content), lambda: history_csv_content)
+    if history_written:
+        logger.info(f"{history_export_path} successfully created! ({len(send_inspection_history_df)} publications)")
+
+# Other collected inspection types, one publications listing each
+for inspection_type in collect_inspection_types:
+    if inspection_type == send_inspection_type:
+        continue
+    type_publications_df = load_publications_from_store(inspection_store, inspection_type)
+    type_export_path = os.path.join(root_export_folder, re.sub(r'[^a-z0-9]+', '_', inspection_type).strip('_') + '_publications.csv')
+    type_csv_content = type_publications_df.to_csv(index=False)
+    if write_output_if_changed(type_export_path, output_data_hash(type_csv_content), lambda: type_csv_content):
+        logger.info(f"{type_export_path} successfully created! ({len(type_publications_df)} publications)")
 
 
 
@@ -1479,29 +4230,49 @@ send_inspection_summary_df = reposition_columns(send_inspection_summary_df, key_
 # Export summary data (visible outputs)
 #
 
-# EXCEL Output
-# Also define the active hyperlink col if exporting to Excel
-save_data_update(send_inspection_summary_df, export_summary_filename, file_type=export_file_type, hyperlink_column='local_link_to_all_inspections')
-
-
-# WEB Output
-# Set up which cols to take forward onto the web front-end(and order of)
-# Remove for now until link fixed applied: 'local_link_to_all_inspections',
-column_order = [
-                'urn','la_code','region_code','ltla23cd','local_authority',
-                'previous_inspection_date',
-                'inspection_start_date', 'inspection_end_date',
-                'outcome_grade', 
-                'inspection_outcome_text',
-                'publication_date', 'next_inspection', 'next_inspection_by_date',
-                #'local_link_to_all_inspections', 
-                'inspection_link'
-                ]
-
-
-save_to_html(send_inspection_summary_df, column_order, local_link_column='local_link_to_all_inspections', web_link_column='inspection_link')
+# Simplified LAD boundaries (cached), held for the run (+ watch mode updates)
+with run_stage('geo_boundaries'):
+    geo_boundaries = load_simplified_boundaries(
+        os.path.join(import_geo_data_path, geo_boundaries_filename),
+        os.path.join(root_export_folder, cache_subfolder),
+        tolerance=geo_simplify_tolerance, precision=geo_coord_precision
+    )
+    add_boundary_counties(geo_boundaries, os.path.join(import_geo_data_path, geo_county_lookup_filename))
+
+# Summary (most recent inspection per LA) generated from the store, then the geospatial|aggregates|excel|web outputs
+send_inspection_summary_df = save_summary_outputs(inspection_store, geo_boundaries)
+
+# Change feeds, this run's new SEND publications appended (subscribe instead of re-downloading the summary)
+with run_stage('feeds'):
+    feed_entries_added = update_publication_feeds(inspection_store, new_publication_links, os.path.join(root_export_folder, feeds_subfolder))
+logger.info(f"Publication feeds: {feed_entries_added} new entr{'y' if feed_entries_added == 1 else 'ies'}")
+
+
+save_run_metrics(
+    run_metrics, os.path.join(root_export_folder, cache_subfolder, run_metrics_filename),
+    run_mode=run_mode, report_records=len(data), summary_rows=len(send_inspection_summary_df),
+    extraction_tiers=extraction_tier_counts,
+    memory_budget_mb=memory_budget_mb, documents=document_metrics,
+    total_seconds=round(time.perf_counter() - run_started, 3)
+)
+
+# Publish signal (workflow commits|deploys only when published data changed, or new publications were stored)
+publish_outputs = bool(published_outputs or new_publication_links)
+logger.info(f"Outputs changed: {', '.join(published_outputs) or 'none'} | publish: {publish_outputs}")
+if os.environ.get('GITHUB_OUTPUT'):
+    with open(os.environ['GITHUB_OUTPUT'], 'a') as f:
+        f.write(f"publish={'true' if publish_outputs else 'false'}\n")
+
+if run_mode == 'watch':
+    # Stays resident from here, new publications processed within a poll interval of release
+    logger.info(f"Watching for new publications every ~{watch_interval_minutes} minutes (Ctrl+C to stop)")
+    try:
+        watch_for_new_publications(inspection_store, extracted_links, la_lookup_index, geo_boundaries, la_name_index)
+    except KeyboardInterrupt:
+        logger.info("Watch mode stopped")
 
+inspection_store.close()
 
-print("Last output date and time: ", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+logger.info(f"Last output date and time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 